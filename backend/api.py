@@ -55,7 +55,7 @@ from boards.delete import delete_board
 from boards.share import generate_share_token
 from boards.unshare import revoke_share_token
 from boards.shared_detail import get_shared_board
-from boards.model import BoardCreateRequest, BoardUpdateRequest, BoardItemAddRequest
+from boards.model import BoardCreateRequest, BoardUpdateRequest, BoardItemAddRequest, BoardDetailResponse
 
 from featured.add import add_featured
 from featured.remove import remove_featured
@@ -69,6 +69,7 @@ from users.reset_password import reset_user_password
 from users.update_user_admin import update_user_admin
 from users.model import UserUpdateRequest, AdminResetPasswordRequest
 
+from platforms.google import close_http_client
 from platforms.model import PlatformStatus, PlatformType, Status
 from platforms.batch_runner import start_batch_subprocess, get_batch_process_status
 from platforms.scheduler import start_scheduler, stop_scheduler
@@ -93,6 +94,10 @@ async def lifespan(app):
         stop_scheduler()
     except Exception as e:
         logger.error(f"Failed to stop scheduler: {e}")
+    try:
+        await close_http_client()
+    except Exception as e:
+        logger.error(f"Failed to close SerpApi client: {e}")
 
 
 app = FastAPI(title="Ad Reference API", version="1.0.0", lifespan=lifespan)
@@ -290,14 +295,15 @@ async def api_list_boards(
     return list_boards(user["user_id"], page, limit)
 
 
-@app.get("/boards/{board_id}")
+@app.get("/boards/{board_id}", response_class=JSONResponse, responses={200: {"model": BoardDetailResponse}})
 async def api_get_board_detail(
     board_id: str = Path(...),
     user: dict = Depends(get_user),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=20, ge=1, le=50),
 ):
-    return get_board_detail(board_id, user["user_id"], page, limit)
+    # get_board_detail already returns JSON-safe values; skip jsonable_encoder
+    return JSONResponse(content=get_board_detail(board_id, user["user_id"], page, limit))
 
 
 @app.put("/boards/{board_id}")
@@ -1454,6 +1460,35 @@ async def api_run_batch(
     return {"job_id": job_id, "status": "started", "domain": request.domain, "mode": request.mode}
 
 
+def _attach_domain_results(cur, runs: list[dict]) -> None:
+    """batch_run_domain_results 행으로 각 실행의 domain_results를 채운다.
+
+    소스별 결과의 기준은 이 테이블이다. 행이 없는 예전 실행은 batch_runs.domain_results 값을 그대로 둔다.
+    """
+    if not runs:
+        return
+    cur.execute(
+        """
+        SELECT run_id, domain, ads_scraped, ads_new, ads_updated, duration_seconds, error
+        FROM batch_run_domain_results
+        WHERE run_id = ANY(%s::uuid[])
+        """,
+        ([r["id"] for r in runs],),
+    )
+    by_run: dict[str, dict] = {}
+    for run_id, domain, scraped, new, updated, duration, error in cur.fetchall():
+        by_run.setdefault(str(run_id), {})[domain] = {
+            "ads_scraped": scraped,
+            "ads_new": new,
+            "ads_updated": updated,
+            "duration_seconds": float(duration) if duration is not None else None,
+            "error": error,
+        }
+    for run in runs:
+        if run["id"] in by_run:
+            run["domain_results"] = by_run[run["id"]]
+
+
 @app.get("/batch/runs")
 async def api_list_batch_runs(
     user: dict = Depends(get_user),
@@ -1462,6 +1497,7 @@ async def api_list_batch_runs(
     with get_db() as (conn, cur):
         cur.execute("SELECT * FROM batch_runs ORDER BY started_at DESC LIMIT %s", (limit,))
         rows = rows_to_dicts(cur)
+        _attach_domain_results(cur, rows)
     return {"runs": rows}
 
 
@@ -1471,9 +1507,11 @@ async def api_latest_batch_run(user: dict = Depends(get_user)):
         cur.execute("SELECT * FROM batch_runs ORDER BY started_at DESC LIMIT 1")
         cols = [desc[0] for desc in cur.description]
         row = cur.fetchone()
-    if not row:
-        raise HTTPException(status_code=404, detail="배치 실행 기록이 없습니다.")
-    return serialize_row(cols, row)
+        if not row:
+            raise HTTPException(status_code=404, detail="배치 실행 기록이 없습니다.")
+        run = serialize_row(cols, row)
+        _attach_domain_results(cur, [run])
+    return run
 
 
 @app.get("/batch/runs/{run_id}")
@@ -1485,9 +1523,11 @@ async def api_get_batch_run(
         cur.execute("SELECT * FROM batch_runs WHERE id = %s::uuid", (run_id,))
         cols = [desc[0] for desc in cur.description]
         row = cur.fetchone()
-    if not row:
-        raise HTTPException(status_code=404, detail="배치 실행을 찾을 수 없습니다.")
-    return serialize_row(cols, row)
+        if not row:
+            raise HTTPException(status_code=404, detail="배치 실행을 찾을 수 없습니다.")
+        run = serialize_row(cols, row)
+        _attach_domain_results(cur, [run])
+    return run
 
 
 # ──────────────────────────────────────────────
@@ -5,13 +5,40 @@ from pathlib import Path
 
 from fastapi import HTTPException
 
-from ads.model import Ad
-from boards.model import BoardDetailResponse, BoardItem
 from conn import get_db
+from utils.serialize import serialize_row, serialize_value
+
+# Ad columns selected after the four board_items columns, in SELECT order.
+_AD_FIELDS = (
+    "id", "platform", "format", "advertiser_name",
+    "advertiser_handle", "advertiser_avatar_url",
+    "thumbnail_url", "preview_url", "media_type",
+    "ad_copy", "cta_text", "likes", "comments", "shares",
+    "start_date", "end_date", "tags", "landing_page_url",
+    "created_at", "saved_at",
+)
+
+# Pages larger than this (CLI exports) stream through a server-side cursor.
+_ITEMS_ITERSIZE = 1000
+
+
+def _item_from_row(row: tuple) -> dict:
+    ad = serialize_row(_AD_FIELDS, row[4:])
+    ad["id"] = str(ad["id"])
+    ad["tags"] = ad["tags"] or []
+    ad["brand_name"] = None
+    return {
+        "id": str(row[0]),
+        "board_id": str(row[1]),
+        "ad_id": str(row[2]),
+        "ad": ad,
+        "added_at": serialize_value(row[3]),
+    }
 
 
 def get_board_detail(board_id: str, user_id: str, page: int = 1, limit: int = 20) -> dict:
-    offset = (page - 1) * limit
+    end = page * limit
+    offset = end - limit
 
     with get_db() as (conn, cur):
         cur.execute(
@@ -39,11 +66,17 @@ def get_board_detail(board_id: str, user_id: str, page: int = 1, limit: int = 20
         )
         total = cur.fetchone()[0]
 
-        cur.execute(
+        if limit > _ITEMS_ITERSIZE:
+            items_cur = conn.cursor(name="board_items_cur")
+            items_cur.itersize = _ITEMS_ITERSIZE
+        else:
+            items_cur = cur
+
+        items_cur.execute(
             """
             SELECT
-                bi.id AS bi_id, bi.board_id, bi.ad_id, bi.added_at,
-                a.id AS ad_id_pk, a.platform, a.format, a.advertiser_name,
+                bi.id, bi.board_id, bi.ad_id, bi.added_at,
+                a.id, a.platform, a.format, a.advertiser_name,
                 a.advertiser_handle, a.advertiser_avatar_url,
                 a.thumbnail_url, a.preview_url, a.media_type,
                 a.ad_copy, a.cta_text, a.likes, a.comments, a.shares,
@@ -52,64 +85,29 @@ def get_board_detail(board_id: str, user_id: str, page: int = 1, limit: int = 20
             FROM board_items bi
             JOIN ads a ON a.id = bi.ad_id
             WHERE bi.board_id = %s
-            ORDER BY bi.added_at DESC
+            ORDER BY bi.added_at DESC, bi.id DESC
             LIMIT %s OFFSET %s
             """,
             (board_id, limit, offset),
         )
-        item_cols = [desc[0] for desc in cur.description]
-        item_rows = cur.fetchall()
-
-    items = []
-    for row in item_rows:
-        d = dict(zip(item_cols, row))
-        ad = Ad(
-            id=str(d["ad_id_pk"]),
-            platform=d["platform"],
-            format=d["format"],
-            advertiser_name=d["advertiser_name"],
-            advertiser_handle=d["advertiser_handle"],
-            advertiser_avatar_url=d["advertiser_avatar_url"],
-            thumbnail_url=d["thumbnail_url"],
-            preview_url=d["preview_url"],
-            media_type=d["media_type"],
-            ad_copy=d["ad_copy"],
-            cta_text=d["cta_text"],
-            likes=d["likes"],
-            comments=d["comments"],
-            shares=d["shares"],
-            start_date=d["start_date"],
-            end_date=d["end_date"],
-            tags=d["tags"] if d["tags"] else [],
-            landing_page_url=d["landing_page_url"],
-            created_at=d["created_at"],
-            saved_at=d["saved_at"],
-        )
-        item = BoardItem(
-            id=str(d["bi_id"]),
-            board_id=str(d["board_id"]),
-            ad_id=str(d["ad_id"]),
-            ad=ad,
-            added_at=d["added_at"],
-        )
-        items.append(item)
-
-    response = BoardDetailResponse(
-        id=str(board_row[0]),
-        name=board_row[1],
-        description=board_row[2],
-        cover_image_url=board_row[3],
-        item_count=total,
-        created_at=board_row[4],
-        updated_at=board_row[5],
-        items=items,
-        total=total,
-        page=page,
-        limit=limit,
-        has_next=(page * limit) < total,
-    )
-
-    return response.model_dump(mode="json")
+        items = [_item_from_row(row) for row in items_cur]
+        if items_cur is not cur:
+            items_cur.close()
+
+    return {
+        "id": str(board_row[0]),
+        "name": board_row[1],
+        "description": board_row[2],
+        "cover_image_url": board_row[3],
+        "item_count": total,
+        "created_at": serialize_value(board_row[4]),
+        "updated_at": serialize_value(board_row[5]),
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "has_next": end < total,
+    }
 
 
 def main(board_id: str, user_id: str, page: int = 1, limit: int = 20) -> dict:
@@ -3,12 +3,13 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from boards.model import Board, BoardListResponse
 from conn import get_db
+from utils.serialize import serialize_value
 
 
 def list_boards(user_id: str, page: int = 1, limit: int = 12) -> dict:
-    offset = (page - 1) * limit
+    end = page * limit
+    offset = end - limit
 
     with get_db() as (conn, cur):
         cur.execute(
@@ -33,27 +34,25 @@ def list_boards(user_id: str, page: int = 1, limit: int = 12) -> dict:
         rows = cur.fetchall()
 
     boards = [
-        Board(
-            id=str(row[0]),
-            name=row[1],
-            description=row[2],
-            cover_image_url=row[3],
-            item_count=row[6],
-            created_at=row[4],
-            updated_at=row[5],
-        )
+        {
+            "id": str(row[0]),
+            "name": row[1],
+            "description": row[2],
+            "cover_image_url": row[3],
+            "item_count": row[6],
+            "created_at": serialize_value(row[4]),
+            "updated_at": serialize_value(row[5]),
+        }
         for row in rows
     ]
 
-    response = BoardListResponse(
-        items=boards,
-        total=total,
-        page=page,
-        limit=limit,
-        has_next=(page * limit) < total,
-    )
-
-    return response.model_dump(mode="json")
+    return {
+        "items": boards,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "has_next": end < total,
+    }
 
 
 def main(user_id: str, page: int = 1, limit: int = 12) -> dict:
@@ -1,12 +1,9 @@
 import argparse
 import json
-import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from pydantic import BaseModel
 
 from ads.model import Ad
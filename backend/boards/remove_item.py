@@ -10,11 +10,36 @@ from conn import get_db
 
 def remove_board_item(board_id: str, item_id: str, user_id: str) -> dict:
     with get_db() as (conn, cur):
+        # Ownership check, delete and cover refresh in one round trip.
+        # CTE sub-statements share a snapshot, so the next cover must
+        # exclude the row being deleted explicitly.
         cur.execute(
-            "SELECT id FROM boards WHERE id = %s AND user_id = %s",
-            (board_id, user_id),
+            """
+            WITH owned AS (
+                SELECT id FROM boards WHERE id = %s AND user_id = %s
+            ), deleted AS (
+                DELETE FROM board_items
+                WHERE id = %s AND board_id IN (SELECT id FROM owned)
+                RETURNING board_id
+            ), updated AS (
+                UPDATE boards
+                SET updated_at = NOW(),
+                    cover_image_url = (
+                        SELECT a.thumbnail_url FROM ads a
+                        JOIN board_items bi ON bi.ad_id = a.id
+                        WHERE bi.board_id = boards.id AND bi.id <> %s
+                        ORDER BY bi.added_at ASC LIMIT 1
+                    )
+                WHERE id IN (SELECT board_id FROM deleted)
+                RETURNING id
+            )
+            SELECT EXISTS (SELECT 1 FROM owned), EXISTS (SELECT 1 FROM updated)
+            """,
+            (board_id, user_id, item_id, item_id),
         )
-        if not cur.fetchone():
+        board_found, item_deleted = cur.fetchone()
+
+        if not board_found:
             raise HTTPException(status_code=404, detail={
                 "error": {
                     "code": "NOT_FOUND",
@@ -23,13 +48,7 @@ def remove_board_item(board_id: str, item_id: str, user_id: str) -> dict:
                 }
             })
 
-        cur.execute(
-            "DELETE FROM board_items WHERE id = %s AND board_id = %s RETURNING id",
-            (item_id, board_id),
-        )
-        deleted = cur.fetchone()
-
-        if not deleted:
+        if not item_deleted:
             raise HTTPException(status_code=404, detail={
                 "error": {
                     "code": "NOT_FOUND",
@@ -38,22 +57,6 @@ def remove_board_item(board_id: str, item_id: str, user_id: str) -> dict:
                 }
             })
 
-        # Update board cover_image_url (use first remaining item's ad thumbnail, or NULL)
-        cur.execute(
-            """
-            UPDATE boards
-            SET updated_at = NOW(),
-                cover_image_url = (
-                    SELECT a.thumbnail_url FROM ads a
-                    JOIN board_items bi ON bi.ad_id = a.id
-                    WHERE bi.board_id = %s
-                    ORDER BY bi.added_at ASC LIMIT 1
-                )
-            WHERE id = %s
-            """,
-            (board_id, board_id),
-        )
-
     return {"message": "보드에서 광고가 제거되었습니다."}
 
 
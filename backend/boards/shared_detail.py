@@ -59,7 +59,7 @@ def get_shared_board(token: str, page: int = 1, limit: int = 20) -> dict:
             FROM board_items bi
             JOIN ads a ON a.id = bi.ad_id
             WHERE bi.board_id = %s
-            ORDER BY bi.added_at DESC
+            ORDER BY bi.added_at DESC, bi.id DESC
             LIMIT %s OFFSET %s
             """,
             (board_id, limit, offset),
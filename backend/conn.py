@@ -76,7 +76,10 @@ def get_db(statement_timeout: int | None = None):
         cur.execute(f"SET statement_timeout = {statement_timeout}")
     try:
         yield conn, cur
-        conn.commit()
+        # 블록 안에서 커넥션이 끊겼고 호출 측이 새 커넥션으로 대체해 처리했다면(배치 실행용 커넥션 등)
+        # 커밋할 것이 없으므로 닫힌 커넥션에 commit()을 호출해 InterfaceError를 내지 않는다
+        if not conn.closed:
+            conn.commit()
     except Exception as exc:
         try:
             conn.rollback()
@@ -2,24 +2,47 @@ import argparse
 import json
 import logging
 import os
+import queue
 import threading
 import time
-import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from psycopg2.extras import execute_values
+
 from conn import get_db
 from platforms.google_scraper import scrape_google_ads_by_domain
+from platforms.meta_scraper import parse_meta_page_id, scrape_meta_ads, scrape_meta_ads_by_page_id
 from platforms.model import BatchRunStatus, BrandSourceScrapeResult, DomainScrapeResult, MonitoredDomain
 from platforms.s3 import is_s3_configured, upload_from_url
-from platforms.scrape_worker import upsert_ads_batch
-from utils.activity_log import log_activity
-from utils.daily_stats import record_daily_stats
+from platforms.scrape_worker import mark_unseen_ads_as_ended, upsert_ads_batch
+from utils.activity_log import activity_params, log_activities, log_activity
+from utils.daily_stats import record_daily_stats_many
 
 logger = logging.getLogger("batch_collector")
 
+# batch_runs JSONB 직렬화
+def _to_json(val) -> str:
+    return json.dumps(val, ensure_ascii=False, default=str)
+
+
+def _to_pretty_json(val) -> bytes:
+    return json.dumps(val, ensure_ascii=False, default=str, indent=2).encode("utf-8")
+
+
 BROWSER_RESTART_INTERVAL = int(os.getenv("BROWSER_RESTART_INTERVAL", "10"))
 BATCH_TIMEOUT = int(os.getenv("BATCH_TIMEOUT_SECONDS", "7200"))
+# 동시에 스크래핑할 소스 수 (워커마다 Chromium 1개). 메모리 여유가 있는 환경에서만
+# BATCH_MAX_CONCURRENCY 환경변수 또는 --max-concurrency 로 올린다
+MAX_CONCURRENCY = max(1, int(os.getenv("BATCH_MAX_CONCURRENCY", "2")))
+# 진행 상태(batch_runs) 체크포인트 주기: N개 소스 완료 또는 N초 경과 시
+CHECKPOINT_EVERY = int(os.getenv("BATCH_CHECKPOINT_EVERY", "10"))
+CHECKPOINT_INTERVAL_S = int(os.getenv("BATCH_CHECKPOINT_INTERVAL_SECONDS", "30"))
+# in_progress 상태로 이 시간(분) 이상 남은 소스는 죽은 워커로 보고 다시 선점 가능
+CLAIM_STALE_MINUTES = int(os.getenv("BATCH_CLAIM_STALE_MINUTES", "30"))
+# 소스별 S3/DB 쓰기 대기 배치 수 (넘치면 스크래퍼가 대기)
+WRITE_QUEUE_SIZE = int(os.getenv("BATCH_WRITE_QUEUE_SIZE", "8"))
 
 
 def _sanitize_s3_key(value: str) -> str:
@@ -36,7 +59,7 @@ _timeout_flag = False
 def _set_timeout_flag():
     global _timeout_flag
     _timeout_flag = True
-    logger.error(f"배치 타임아웃 플래그 설정: {BATCH_TIMEOUT}초 초과")
+    logger.error("배치 타임아웃 플래그 설정: %s초 초과", BATCH_TIMEOUT)
 
 
 def _upload_media(ad, s3_prefix: str) -> None:
@@ -63,9 +86,27 @@ def _upload_media(ad, s3_prefix: str) -> None:
             ad.preview_url = s3_url
 
 
-def get_active_domains() -> list[MonitoredDomain]:
+@contextmanager
+def _run_db(cur=None):
+    """배치 실행 동안 유지하는 커서가 있으면 그대로 쓰고 블록 끝에서 커밋. 없거나 끊겼으면 풀에서 새로 받음."""
+    if cur is None or cur.closed or cur.connection.closed:
+        with get_db() as (conn, db_cur):
+            yield db_cur
+        return
+    try:
+        yield cur
+        cur.connection.commit()
+    except Exception:
+        try:
+            cur.connection.rollback()
+        except Exception:
+            pass
+        raise
+
+
+def get_active_domains(cur=None) -> list[MonitoredDomain]:
     """monitored_domains 테이블에서 is_active=True인 도메인 조회"""
-    with get_db() as (conn, cur):
+    with _run_db(cur) as cur:
         cur.execute(
             """
             SELECT id, domain, platform, is_active, notes, created_at, updated_at
@@ -92,9 +133,9 @@ def get_active_domains() -> list[MonitoredDomain]:
     return domains
 
 
-def get_active_brand_sources() -> list[dict]:
+def get_active_brand_sources(cur=None) -> list[dict]:
     """brands + brand_sources JOIN, both is_active=True"""
-    with get_db() as (conn, cur):
+    with _run_db(cur) as cur:
         cur.execute("""
             SELECT bs.id, bs.brand_id, b.brand_name, bs.platform, bs.source_type, bs.source_value
             FROM brand_sources bs
@@ -116,6 +157,248 @@ def get_active_brand_sources() -> list[dict]:
     ]
 
 
+def reset_brand_source_claims(cur=None) -> int:
+    """지난 실행에서 done 처리된 소스를 pending으로 되돌림.
+
+    다른 batch_collector 프로세스가 아직 소스를 처리 중이면(in_progress가 살아 있고 그 실행이
+    batch_runs에서 아직 running이면) 그 실행에 합류하는 것이므로 리셋하지 않는다.
+    크래시로 끝난 실행이 남긴 in_progress는 살아 있는 선점으로 보지 않는다.
+    """
+    with _run_db(cur) as cur:
+        cur.execute(
+            """
+            UPDATE brand_sources SET claim_status = 'pending'
+            WHERE claim_status = 'done'
+              AND NOT EXISTS (
+                  SELECT 1 FROM brand_sources bs
+                  JOIN batch_runs br ON br.id = bs.claimed_by
+                  WHERE bs.claim_status = 'in_progress'
+                    AND bs.claimed_at >= NOW() - make_interval(mins => %s)
+                    AND br.status = 'running'
+              )
+            """,
+            (CLAIM_STALE_MINUTES,),
+        )
+        return cur.rowcount
+
+
+def claim_brand_source(source_id: str, run_id: str) -> bool:
+    """소스를 이 실행이 처리하도록 선점. 다른 프로세스가 잡고 있으면 False.
+
+    CLAIM_STALE_MINUTES 넘게 in_progress로 남은 소스(죽은 워커)나, 선점한 실행이
+    batch_runs에서 더 이상 running이 아닌 소스(크래시한 실행)는 다시 선점할 수 있다.
+    """
+    with get_db() as (conn, cur):
+        cur.execute(
+            """
+            UPDATE brand_sources
+            SET claim_status = 'in_progress', claimed_at = NOW(), claimed_by = %s
+            WHERE id = (
+                SELECT id FROM brand_sources
+                WHERE id = %s
+                  AND (claim_status = 'pending'
+                       OR (claim_status = 'in_progress'
+                           AND (claimed_at < NOW() - make_interval(mins => %s)
+                                OR NOT EXISTS (
+                                    SELECT 1 FROM batch_runs br
+                                    WHERE br.id = brand_sources.claimed_by AND br.status = 'running'
+                                ))))
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING id
+            """,
+            (run_id, source_id, CLAIM_STALE_MINUTES),
+        )
+        return cur.fetchone() is not None
+
+
+def finish_brand_source_claim(source_id: str) -> None:
+    with get_db() as (conn, cur):
+        cur.execute(
+            "UPDATE brand_sources SET claim_status = 'done' WHERE id = %s",
+            (source_id,),
+        )
+
+
+def _source_outcome_rows(source: dict, result: BrandSourceScrapeResult) -> tuple[list[tuple], list[tuple]]:
+    """소스 결과로 activity_logs / daily_brand_stats에 쓸 행을 만든다 (실행 끝에 한 번에 기록)."""
+    platform = source["platform"]
+    source_value = source["source_value"]
+    activities = []
+    if result.ads_new > 0:
+        activities.append(activity_params(
+            event_type="ad_change",
+            event_subtype="new_ads_found",
+            title=f"{result.ads_new} new ads from {source.get('brand_name', '')}",
+            message=f"Platform: {platform}, Source: {source_value}",
+            metadata={
+                "brand_name": source.get("brand_name", ""),
+                "platform": platform,
+                "ads_new": result.ads_new,
+                "ads_scraped": result.ads_scraped,
+            },
+        ))
+    elif result.ads_scraped == 0:
+        activities.append(activity_params(
+            event_type="collection",
+            event_subtype="no_ads_found",
+            title=f"No ads found from {source.get('brand_name', '')}",
+            message=f"Platform: {platform}, Source: {source_value}",
+            metadata={
+                "brand_name": source.get("brand_name", ""),
+                "platform": platform,
+                "ads_new": 0,
+                "ads_scraped": 0,
+            },
+        ))
+    stats = []
+    if result.ads_new > 0 or result.ads_updated > 0:
+        stats.append((source["brand_id"], platform, result.ads_new, result.ads_updated, result.ads_scraped))
+    return activities, stats
+
+
+@contextmanager
+def _background_writer(write_batch, name: str):
+    """스크래퍼가 넘긴 광고 배치를 별도 스레드에서 write_batch로 저장 (스크래핑과 S3/DB 쓰기를 겹침).
+
+    큐 크기를 WRITE_QUEUE_SIZE로 제한해 쓰기가 밀리면 스크래퍼가 기다린다.
+    쓰기 중 예외는 다음 submit 또는 블록 종료 시 다시 발생시킨다.
+    """
+    q = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    failures = []
+
+    def consume():
+        while True:
+            ads = q.get()
+            if ads is None:
+                return
+            if failures:
+                continue
+            try:
+                write_batch(ads)
+            except Exception as e:
+                failures.append(e)
+
+    def submit(ads):
+        if failures:
+            raise failures[0]
+        q.put(ads)
+
+    writer = threading.Thread(target=consume, name=name, daemon=True)
+    writer.start()
+    try:
+        yield submit
+    finally:
+        q.put(None)
+        writer.join()
+    if failures:
+        raise failures[0]
+
+
+def _drop_seen(ads: list, seen: set) -> list:
+    """이번 소스에서 이미 받은 광고((platform, source_id) 기준)를 제외하고 seen에 추가.
+
+    스크래퍼가 페이지를 다시 훑으며 같은 광고를 여러 배치에 넘겨도 S3 업로드/UPSERT는 한 번만 한다.
+    """
+    fresh = []
+    for ad in ads:
+        key = (ad.platform, ad.source_id)
+        if key not in seen:
+            seen.add(key)
+            fresh.append(ad)
+    return fresh
+
+
+def _scrape_google_domain(source: dict, on_batch, mode: str, browser) -> None:
+    scrape_google_ads_by_domain(
+        domain=source["source_value"],
+        headless=True,
+        max_results=None,
+        on_batch_callback=on_batch,
+        mode=mode,
+        browser=browser,
+    )
+
+
+def _existing_meta_source_ids(brand_id: str, source_value: str) -> set:
+    with get_db() as (conn, cur):
+        cur.execute(
+            "SELECT source_id FROM ads WHERE brand_id = %s AND platform = 'meta' AND domain = %s",
+            (brand_id, source_value),
+        )
+        return {row[0] for row in cur.fetchall()}
+
+
+def _scrape_meta_page_id(source: dict, on_batch, mode: str, browser) -> None:
+    page_id = parse_meta_page_id(source["source_value"])
+
+    # full 모드에서는 항상 전체 스캔 (last_seen_at 갱신을 위해)
+    if mode == "full":
+        logger.info("[meta:page_id:%s] full 모드: 전체 스캔", page_id)
+        ads = scrape_meta_ads_by_page_id(page_id, headless=True, max_results=500, browser=browser)
+    else:
+        # incremental 모드: 기존 광고 발견 시 조기 중단
+        existing_source_ids = _existing_meta_source_ids(source["brand_id"], source["source_value"])
+
+        if not existing_source_ids:
+            # 첫 수집: 전체
+            logger.info("[meta:page_id:%s] 첫 수집(전체)", page_id)
+            ads = scrape_meta_ads_by_page_id(page_id, headless=True, max_results=500, browser=browser)
+        else:
+            logger.info("[meta:page_id:%s] 증분 수집, 기존 광고 %s건", page_id, len(existing_source_ids))
+            ads = scrape_meta_ads_by_page_id(
+                page_id, headless=True, max_results=500,
+                existing_source_ids=existing_source_ids,
+                browser=browser,
+            )
+
+    if ads:
+        on_batch(ads)
+
+
+def _scrape_meta_keyword(source: dict, on_batch, mode: str, browser) -> None:
+    source_value = source["source_value"]
+
+    # full 모드에서는 항상 전체 스캔 (last_seen_at 갱신을 위해)
+    if mode == "full":
+        logger.info("[meta:keyword:%s] full 모드: 전체 스캔", source_value)
+        ads = scrape_meta_ads(source_value, headless=True, max_results=500, browser=browser)
+    else:
+        # incremental 모드: 기존 광고 발견 시 조기 중단
+        existing_source_ids = _existing_meta_source_ids(source["brand_id"], source_value)
+
+        if not existing_source_ids:
+            logger.info("[meta:keyword:%s] 첫 수집(전체)", source_value)
+            ads = scrape_meta_ads(source_value, headless=True, max_results=500, browser=browser)
+        else:
+            logger.info("[meta:keyword:%s] 증분 수집, 기존 광고 %s건", source_value, len(existing_source_ids))
+            ads = scrape_meta_ads(
+                source_value, headless=True, max_results=500,
+                existing_source_ids=existing_source_ids,
+                browser=browser,
+            )
+
+    if ads:
+        on_batch(ads)
+
+
+def _scrape_tiktok_keyword(source: dict, on_batch, mode: str, browser) -> None:
+    logger.info("TikTok scraping not yet implemented for: %s", source['source_value'])
+
+
+def _scrape_unsupported(source: dict, on_batch, mode: str, browser) -> None:
+    logger.warning("Unsupported source: %s:%s", source['platform'], source['source_type'])
+
+
+# (platform, source_type) -> scraper. mode는 run_daily_batch에서 full/incremental로 이미 확정됨
+_SOURCE_SCRAPERS = {
+    ("google", "domain"): _scrape_google_domain,
+    ("meta", "page_id"): _scrape_meta_page_id,
+    ("meta", "keyword"): _scrape_meta_keyword,
+    ("tiktok", "keyword"): _scrape_tiktok_keyword,
+}
+
+
 def scrape_source(source: dict, mode: str = "full", browser=None) -> BrandSourceScrapeResult:
     """Dispatch scraping by platform and source_type."""
     start_time = time.monotonic()
@@ -132,10 +415,13 @@ def scrape_source(source: dict, mode: str = "full", browser=None) -> BrandSource
         source_value=source_value,
     )
 
+    # Google domain 스크래핑 시 도메인 불일치 광고 필터링 (대상 도메인은 소스당 한 번만 계산)
+    filter_target = source_value.replace("www.", "") if (platform, source_type) == ("google", "domain") else None
+    seen = set()
+
     def on_batch(ads):
-        # Google domain 스크래핑 시 도메인 불일치 광고 필터링
-        if platform == "google" and source_type == "domain":
-            target = source_value.replace("www.", "")
+        if filter_target is not None:
+            target = filter_target
             before_count = len(ads)
             filtered = []
             for ad in ads:
@@ -146,16 +432,17 @@ def scrape_source(source: dict, mode: str = "full", browser=None) -> BrandSource
             excluded = before_count - len(filtered)
             if excluded > 0:
                 logger.info(
-                    f"[{source_value}] 도메인 필터링: {before_count}건 중 {excluded}건 제외 "
-                    f"(target={target})"
+                    "[%s] 도메인 필터링: %s건 중 %s건 제외 "
+                    "(target=%s)",
+                    source_value, before_count, excluded, target,
                 )
             ads = filtered
 
-        for ad in ads:
-            if not ad.domain:
-                ad.domain = source_value
-            ad.brand_id = brand_id
+        ads = _drop_seen(ads, seen)
+        if ads:
+            submit(ads)
 
+    def write_batch(ads):
         # S3 업로드: 만료되는 CDN URL을 영구 보관 (실패 시 원본 URL 유지)
         if is_s3_configured():
             s3_prefix = f"ads/{platform}/{_sanitize_s3_key(source_value)}"
@@ -170,7 +457,7 @@ def scrape_source(source: dict, mode: str = "full", browser=None) -> BrandSource
                     if orig_preview and not ad.preview_url:
                         ad.preview_url = orig_preview
                 except Exception as e:
-                    logger.error(f"S3 업로드 실패 (원본 URL 유지): {type(e).__name__}: {e}")
+                    logger.error("S3 업로드 실패 (원본 URL 유지): %s: %s", type(e).__name__, e)
                     ad.thumbnail_url = orig_thumbnail
                     ad.preview_url = orig_preview
 
@@ -179,150 +466,61 @@ def scrape_source(source: dict, mode: str = "full", browser=None) -> BrandSource
             if ad.raw_data and isinstance(ad.raw_data, dict) and '_cookies' in ad.raw_data:
                 del ad.raw_data['_cookies']
 
-        stats = upsert_ads_batch(ads, brand_id=brand_id)
+        stats = upsert_ads_batch(ads, brand_id=brand_id, default_domain=source_value)
         result.ads_scraped += len(ads)
         result.ads_new += stats["new"]
         result.ads_updated += stats["updated"]
 
-    if platform == "google" and source_type == "domain":
-        scrape_google_ads_by_domain(
-            domain=source_value,
-            headless=True,
-            max_results=None,
-            on_batch_callback=on_batch,
-            mode="incremental" if mode == "incremental" else "full",
-            browser=browser,
-        )
-    elif platform == "meta" and source_type == "page_id":
-        from platforms.meta_scraper import scrape_meta_ads_by_page_id, parse_meta_page_id
-        page_id = parse_meta_page_id(source_value)
-
-        # full 모드에서는 항상 전체 스캔 (last_seen_at 갱신을 위해)
-        if mode == "full":
-            logger.info(f"[meta:page_id:{page_id}] full 모드: 전체 스캔")
-            ads = scrape_meta_ads_by_page_id(page_id, headless=True, max_results=500, browser=browser)
-        else:
-            # incremental 모드: 기존 광고 발견 시 조기 중단
-            existing_source_ids = set()
-            with get_db() as (conn, cur):
-                cur.execute(
-                    "SELECT source_id FROM ads WHERE brand_id = %s AND platform = 'meta' AND domain = %s",
-                    (brand_id, source_value),
-                )
-                existing_source_ids = {row[0] for row in cur.fetchall()}
-
-            if not existing_source_ids:
-                # 첫 수집: 전체
-                logger.info(f"[meta:page_id:{page_id}] 첫 수집(전체)")
-                ads = scrape_meta_ads_by_page_id(page_id, headless=True, max_results=500, browser=browser)
-            else:
-                logger.info(f"[meta:page_id:{page_id}] 증분 수집, 기존 광고 {len(existing_source_ids)}건")
-                ads = scrape_meta_ads_by_page_id(
-                    page_id, headless=True, max_results=500,
-                    existing_source_ids=existing_source_ids,
-                    browser=browser,
-                )
-
-        if ads:
-            on_batch(ads)
-    elif platform == "meta" and source_type == "keyword":
-        from platforms.meta_scraper import scrape_meta_ads
-
-        # full 모드에서는 항상 전체 스캔 (last_seen_at 갱신을 위해)
-        if mode == "full":
-            logger.info(f"[meta:keyword:{source_value}] full 모드: 전체 스캔")
-            ads = scrape_meta_ads(source_value, headless=True, max_results=500, browser=browser)
-        else:
-            # incremental 모드: 기존 광고 발견 시 조기 중단
-            existing_source_ids = set()
-            with get_db() as (conn, cur):
-                cur.execute(
-                    "SELECT source_id FROM ads WHERE brand_id = %s AND platform = 'meta' AND domain = %s",
-                    (brand_id, source_value),
-                )
-                existing_source_ids = {row[0] for row in cur.fetchall()}
-
-            if not existing_source_ids:
-                logger.info(f"[meta:keyword:{source_value}] 첫 수집(전체)")
-                ads = scrape_meta_ads(source_value, headless=True, max_results=500, browser=browser)
-            else:
-                logger.info(f"[meta:keyword:{source_value}] 증분 수집, 기존 광고 {len(existing_source_ids)}건")
-                ads = scrape_meta_ads(
-                    source_value, headless=True, max_results=500,
-                    existing_source_ids=existing_source_ids,
-                    browser=browser,
-                )
-
-        if ads:
-            on_batch(ads)
-    elif platform == "tiktok" and source_type == "keyword":
-        logger.info(f"TikTok scraping not yet implemented for: {source_value}")
+    scrape_fn = _SOURCE_SCRAPERS.get((platform, source_type), _scrape_unsupported)
+    with _background_writer(write_batch, f"writer-{platform}:{source_value}") as submit:
+        scrape_fn(source, on_batch, mode, browser)
 
     # full 모드에서만 종료 마킹
     # NOTE: incremental 모드에서는 일부만 스캔하므로 mark_unseen 호출 시 false positive 위험 → 호출하지 않음
     if mode == "full":
-        from platforms.scrape_worker import mark_unseen_ads_as_ended
         ended = mark_unseen_ads_as_ended(brand_id, platform, scrape_started_at)
         logger.info(
-            f"[{source['brand_name']}:{platform}:{source_value}] "
-            f"종료 마킹: {ended}건 (scrape_started_at={scrape_started_at.isoformat()})"
+            "[%s:%s:%s] "
+            "종료 마킹: %s건 (scrape_started_at=%s)",
+            source['brand_name'], platform, source_value, ended, scrape_started_at.isoformat(),
         )
 
     result.duration_seconds = round(time.monotonic() - start_time, 1)
     logger.info(
-        f"[{source['brand_name']}:{platform}:{source_value}] "
-        f"scraped={result.ads_scraped}, new={result.ads_new}, "
-        f"updated={result.ads_updated}, duration={result.duration_seconds}s"
+        "[%s:%s:%s] "
+        "scraped=%s, new=%s, "
+        "updated=%s, duration=%ss",
+        source['brand_name'], platform, source_value, result.ads_scraped, result.ads_new, result.ads_updated, result.duration_seconds,
     )
-    if result.ads_new > 0:
-        log_activity(
-            event_type="ad_change",
-            event_subtype="new_ads_found",
-            title=f"{result.ads_new} new ads from {source.get('brand_name', '')}",
-            message=f"Platform: {platform}, Source: {source_value}",
-            metadata={
-                "brand_name": source.get("brand_name", ""),
-                "platform": platform,
-                "ads_new": result.ads_new,
-                "ads_scraped": result.ads_scraped,
-            },
-        )
-    elif result.ads_scraped == 0:
-        log_activity(
-            event_type="collection",
-            event_subtype="no_ads_found",
-            title=f"No ads found from {source.get('brand_name', '')}",
-            message=f"Platform: {platform}, Source: {source_value}",
-            metadata={
-                "brand_name": source.get("brand_name", ""),
-                "platform": platform,
-                "ads_new": 0,
-                "ads_scraped": 0,
-            },
-        )
-    if result.ads_new > 0 or result.ads_updated > 0:
-        record_daily_stats(
-            brand_id=brand_id,
-            platform=platform,
-            new_count=result.ads_new,
-            updated_count=result.ads_updated,
-            total_scraped=result.ads_scraped,
-        )
     return result
 
 
-def create_batch_run(trigger_type: str = "manual") -> str:
-    """batch_runs 레코드 생성, UUID 반환"""
-    run_id = str(uuid.uuid4())
-    with get_db() as (conn, cur):
+def create_batch_run(
+    trigger_type: str = "manual",
+    started_at: datetime | None = None,
+    total_domains: int = 0,
+    cur=None,
+) -> str:
+    """batch_runs 레코드 생성, UUID 반환
+
+    id는 DB(gen_random_uuid())가 만들고, total_domains까지 INSERT 한 번에 기록한다.
+    """
+    with _run_db(cur) as cur:
         cur.execute(
             """
-            INSERT INTO batch_runs (id, started_at, status, trigger_type)
-            VALUES (%s, NOW(), %s, %s)
+            INSERT INTO batch_runs (started_at, status, trigger_type, total_domains)
+            VALUES (COALESCE(%s, NOW()), %s, %s, %s)
+            RETURNING id
             """,
-            (run_id, BatchRunStatus.running.value, trigger_type),
+            (
+                started_at,
+                BatchRunStatus.running.value,
+                trigger_type,
+                total_domains,
+            ),
         )
-    logger.info(f"batch_run 생성: id={run_id}, trigger_type={trigger_type}")
+        run_id = str(cur.fetchone()[0])
+    logger.info("batch_run 생성: id=%s, trigger_type=%s", run_id, trigger_type)
     log_activity(
         event_type="collection",
         event_subtype="batch_started",
@@ -332,41 +530,181 @@ def create_batch_run(trigger_type: str = "manual") -> str:
     return run_id
 
 
-def update_batch_run(run_id: str, **kwargs):
-    """batch_runs 레코드 업데이트 (status, finished_at, totals, domain_results, errors)"""
-    set_clauses = []
-    values = []
-
-    field_map = {
-        "status": "status",
-        "finished_at": "finished_at",
-        "total_domains": "total_domains",
-        "total_ads_scraped": "total_ads_scraped",
-        "total_ads_new": "total_ads_new",
-        "total_ads_updated": "total_ads_updated",
-        "domain_results": "domain_results",
-        "errors": "errors",
-    }
+def _execute_batch_run_update(cur, sql: str, params) -> None:
+    """배치 실행 동안 유지하는 커서로 UPDATE 후 즉시 커밋."""
+    with _run_db(cur) as cur:
+        cur.execute(sql, params)
+
 
-    for key, column in field_map.items():
-        if key in kwargs:
-            val = kwargs[key]
-            if key == "status" and isinstance(val, BatchRunStatus):
-                val = val.value
-            if key in ("domain_results", "errors"):
-                val = json.dumps(val, ensure_ascii=False, default=str)
-            set_clauses.append(f"{column} = %s")
-            values.append(val)
-
-    if not set_clauses:
+def insert_batch_run_results(run_id: str, results: dict, cur=None) -> None:
+    """끝난 소스 결과를 batch_run_domain_results에 행 단위로 기록 (재전송돼도 같은 행을 덮어씀)"""
+    if not results:
         return
+    rows = [
+        (
+            run_id,
+            label,
+            r.get("ads_scraped", 0),
+            r.get("ads_new", 0),
+            r.get("ads_updated", 0),
+            r.get("duration_seconds"),
+            r.get("error"),
+        )
+        for label, r in results.items()
+    ]
+    with _run_db(cur) as cur:
+        execute_values(
+            cur,
+            """
+            INSERT INTO batch_run_domain_results
+                (run_id, domain, ads_scraped, ads_new, ads_updated, duration_seconds, error)
+            VALUES %s
+            ON CONFLICT (run_id, domain) DO UPDATE SET
+                ads_scraped = EXCLUDED.ads_scraped,
+                ads_new = EXCLUDED.ads_new,
+                ads_updated = EXCLUDED.ads_updated,
+                duration_seconds = EXCLUDED.duration_seconds,
+                error = EXCLUDED.error
+            """,
+            rows,
+            template="(%s::uuid, %s, %s, %s, %s, %s, %s)",
+        )
 
-    values.append(run_id)
-    with get_db() as (conn, cur):
-        cur.execute(
-            f"UPDATE batch_runs SET {', '.join(set_clauses)} WHERE id = %s",
-            values,
+
+def _checkpoint_batch_run(run_id: str, pending_results: dict, pending_errors: list, cur=None) -> None:
+    """마지막 체크포인트 이후 끝난 소스 결과와 카운터/에러를 반영. 실패해도 수집은 계속 진행.
+
+    소스별 결과는 batch_run_domain_results에만 행으로 쌓는다 (실행의 소스별 결과는 이 테이블이 기준).
+    실패한 경우 pending을 비우지 않고 다음 체크포인트에서 다시 보낸다.
+    """
+    try:
+        insert_batch_run_results(run_id, pending_results, cur)
+        update_batch_counters(
+            run_id,
+            last_domain=next(reversed(pending_results), None),
+            errors_delta=pending_errors,
+            d_scraped=sum(r.get("ads_scraped", 0) for r in pending_results.values()),
+            d_new=sum(r.get("ads_new", 0) for r in pending_results.values()),
+            d_updated=sum(r.get("ads_updated", 0) for r in pending_results.values()),
+            cur=cur,
         )
+    except Exception as update_err:
+        logger.warning("중간 상태 업데이트 실패 (계속 진행): %s: %s", type(update_err).__name__, update_err)
+        return
+    pending_results.clear()
+    pending_errors.clear()
+
+
+# 갱신하지 않는 컬럼은 NULL을 넘겨 COALESCE로 기존 값 유지 -> SQL 문자열이 항상 같아 PREPARE 가능
+_BATCH_RUN_UPDATE = """
+    UPDATE batch_runs SET
+        status = COALESCE({0}, status),
+        finished_at = COALESCE({1}, finished_at),
+        total_domains = COALESCE({2}, total_domains),
+        total_ads_scraped = COALESCE({3}, total_ads_scraped),
+        total_ads_new = COALESCE({4}, total_ads_new),
+        total_ads_updated = COALESCE({5}, total_ads_updated),
+        last_domain = COALESCE({6}, last_domain),
+        errors = COALESCE({7}::jsonb, errors)
+    WHERE id = {8}
+"""
+
+_CHECKPOINT_UPDATE = """
+    UPDATE batch_runs SET
+        last_domain = {0},
+        errors = COALESCE(errors, '[]'::jsonb) || {1}::jsonb,
+        total_ads_scraped = COALESCE(total_ads_scraped, 0) + {2},
+        total_ads_new = COALESCE(total_ads_new, 0) + {3},
+        total_ads_updated = COALESCE(total_ads_updated, 0) + {4}
+    WHERE id = {5}
+"""
+
+# name -> (파라미터 타입, SQL 템플릿)
+_BATCH_RUN_STATEMENTS = {
+    "batch_run_update": (
+        "text, timestamptz, integer, integer, integer, integer, text, text, uuid",
+        _BATCH_RUN_UPDATE,
+    ),
+    "batch_run_checkpoint": ("text, text, integer, integer, integer, uuid", _CHECKPOINT_UPDATE),
+}
+
+
+def prepare_batch_run_statements(cur) -> None:
+    """batch_runs UPDATE들을 이 커넥션에 한 번 PREPARE (실행 중 매 업데이트의 파싱/플래닝 생략)"""
+    cur.execute("SELECT name FROM pg_prepared_statements WHERE name = ANY(%s)", (list(_BATCH_RUN_STATEMENTS),))
+    prepared = {row[0] for row in cur.fetchall()}
+    for name, (types, template) in _BATCH_RUN_STATEMENTS.items():
+        if name not in prepared:
+            n_params = len(types.split(","))
+            cur.execute(f"PREPARE {name} ({types}) AS" + template.format(*(f"${i}" for i in range(1, n_params + 1))))
+    cur.connection.commit()
+
+
+def _execute_batch_run_statement(cur, name: str, params) -> None:
+    """준비된 실행용 커서면 EXECUTE, 없거나 끊겼으면 같은 SQL을 일반 UPDATE로 보낸다."""
+    if cur is None or cur.closed or cur.connection.closed:
+        template = _BATCH_RUN_STATEMENTS[name][1]
+        _execute_batch_run_update(None, template.format(*["%s"] * len(params)), params)
+    else:
+        _execute_batch_run_update(cur, f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
+
+def update_batch_run(
+    run_id: str,
+    cur=None,
+    *,
+    status: str | None = None,
+    finished_at: datetime | None = None,
+    total_domains: int | None = None,
+    total_ads_scraped: int | None = None,
+    total_ads_new: int | None = None,
+    total_ads_updated: int | None = None,
+    last_domain: str | None = None,
+    errors: list | None = None,
+):
+    """batch_runs 레코드 업데이트 (status, finished_at, totals, last_domain, errors)
+
+    None인 필드는 그대로 둔다. 소스별 결과는 batch_run_domain_results에 따로 기록한다.
+    cur는 prepare_batch_run_statements()로 준비된 실행용 커서여야 한다. 없거나 끊겼으면 일반 UPDATE로 보낸다.
+    """
+    params = (
+        status,
+        finished_at,
+        total_domains,
+        total_ads_scraped,
+        total_ads_new,
+        total_ads_updated,
+        last_domain,
+        None if errors is None else _to_json(errors),
+        run_id,
+    )
+    if all(p is None for p in params[:-1]):
+        return
+    _execute_batch_run_statement(cur, "batch_run_update", params)
+
+
+def update_batch_counters(
+    run_id: str,
+    last_domain: str | None,
+    errors_delta: list,
+    d_scraped: int = 0,
+    d_new: int = 0,
+    d_updated: int = 0,
+    cur=None,
+):
+    """카운터 증분, 새 에러, 마지막으로 끝난 소스만 전송 (진행 상황 heartbeat)
+
+    cur는 prepare_batch_run_statements()로 준비된 실행용 커서여야 한다. 없거나 끊겼으면 일반 UPDATE로 보낸다.
+    """
+    params = (
+        last_domain,
+        _to_json(errors_delta),
+        d_scraped,
+        d_new,
+        d_updated,
+        run_id,
+    )
+    _execute_batch_run_statement(cur, "batch_run_checkpoint", params)
 
 
 def scrape_domain_fully(domain: str, browser=None) -> DomainScrapeResult:
@@ -378,12 +716,15 @@ def scrape_domain_fully(domain: str, browser=None) -> DomainScrapeResult:
     start_time = time.monotonic()
     result = DomainScrapeResult(domain=domain)
 
+    seen = set()
+
     def on_batch(ads):
         """50건마다 호출되는 콜백"""
-        for ad in ads:
-            if not ad.domain:
-                ad.domain = domain
+        ads = _drop_seen(ads, seen)
+        if ads:
+            submit(ads)
 
+    def write_batch(ads):
         # S3 업로드: 만료되는 CDN URL을 영구 보관 (실패 시 원본 URL 유지)
         if is_s3_configured():
             s3_prefix = f"ads/google/{_sanitize_s3_key(domain)}"
@@ -397,32 +738,35 @@ def scrape_domain_fully(domain: str, browser=None) -> DomainScrapeResult:
                     if orig_preview and not ad.preview_url:
                         ad.preview_url = orig_preview
                 except Exception as e:
-                    logger.error(f"S3 업로드 실패 (원본 URL 유지): {type(e).__name__}: {e}")
+                    logger.error("S3 업로드 실패 (원본 URL 유지): %s: %s", type(e).__name__, e)
                     ad.thumbnail_url = orig_thumbnail
                     ad.preview_url = orig_preview
 
-        stats = upsert_ads_batch(ads)
+        stats = upsert_ads_batch(ads, default_domain=domain)
         result.ads_scraped += len(ads)
         result.ads_new += stats["new"]
         result.ads_updated += stats["updated"]
         logger.info(
-            f"[{domain}] 배치 저장: +{len(ads)}건 "
-            f"(누적: scraped={result.ads_scraped}, new={result.ads_new})"
+            "[%s] 배치 저장: +%s건 "
+            "(누적: scraped=%s, new=%s)",
+            domain, len(ads), result.ads_scraped, result.ads_new,
         )
 
-    scrape_google_ads_by_domain(
-        domain=domain,
-        headless=True,
-        max_results=None,
-        on_batch_callback=on_batch,
-        browser=browser,
-    )
+    with _background_writer(write_batch, f"writer-{domain}") as submit:
+        scrape_google_ads_by_domain(
+            domain=domain,
+            headless=True,
+            max_results=None,
+            on_batch_callback=on_batch,
+            browser=browser,
+        )
 
     result.duration_seconds = round(time.monotonic() - start_time, 1)
     logger.info(
-        f"[{domain}] 완료: scraped={result.ads_scraped}, "
-        f"new={result.ads_new}, updated={result.ads_updated}, "
-        f"duration={result.duration_seconds}s"
+        "[%s] 완료: scraped=%s, "
+        "new=%s, updated=%s, "
+        "duration=%ss",
+        domain, result.ads_scraped, result.ads_new, result.ads_updated, result.duration_seconds,
     )
     return result
 
@@ -432,11 +776,14 @@ def scrape_domain_incremental(domain: str, browser=None) -> DomainScrapeResult:
     start_time = time.monotonic()
     result = DomainScrapeResult(domain=domain)
 
+    seen = set()
+
     def on_batch(ads):
-        for ad in ads:
-            if not ad.domain:
-                ad.domain = domain
+        ads = _drop_seen(ads, seen)
+        if ads:
+            submit(ads)
 
+    def write_batch(ads):
         # S3 업로드: 만료되는 CDN URL을 영구 보관 (실패 시 원본 URL 유지)
         if is_s3_configured():
             s3_prefix = f"ads/google/{_sanitize_s3_key(domain)}"
@@ -450,242 +797,364 @@ def scrape_domain_incremental(domain: str, browser=None) -> DomainScrapeResult:
                     if orig_preview and not ad.preview_url:
                         ad.preview_url = orig_preview
                 except Exception as e:
-                    logger.error(f"S3 업로드 실패 (원본 URL 유지): {type(e).__name__}: {e}")
+                    logger.error("S3 업로드 실패 (원본 URL 유지): %s: %s", type(e).__name__, e)
                     ad.thumbnail_url = orig_thumbnail
                     ad.preview_url = orig_preview
 
-        stats = upsert_ads_batch(ads)
+        stats = upsert_ads_batch(ads, default_domain=domain)
         result.ads_scraped += len(ads)
         result.ads_new += stats["new"]
         result.ads_updated += stats["updated"]
         logger.info(
-            f"[{domain}] 증분 배치 저장: +{len(ads)}건 "
-            f"(누적: scraped={result.ads_scraped}, new={result.ads_new})"
+            "[%s] 증분 배치 저장: +%s건 "
+            "(누적: scraped=%s, new=%s)",
+            domain, len(ads), result.ads_scraped, result.ads_new,
         )
 
-    scrape_google_ads_by_domain(
-        domain=domain,
-        headless=True,
-        max_results=None,
-        on_batch_callback=on_batch,
-        mode="incremental",
-        browser=browser,
-    )
+    with _background_writer(write_batch, f"writer-{domain}") as submit:
+        scrape_google_ads_by_domain(
+            domain=domain,
+            headless=True,
+            max_results=None,
+            on_batch_callback=on_batch,
+            mode="incremental",
+            browser=browser,
+        )
 
     result.duration_seconds = round(time.monotonic() - start_time, 1)
     logger.info(
-        f"[{domain}] 증분 완료: scraped={result.ads_scraped}, "
-        f"new={result.ads_new}, updated={result.ads_updated}, "
-        f"duration={result.duration_seconds}s"
+        "[%s] 증분 완료: scraped=%s, "
+        "new=%s, updated=%s, "
+        "duration=%ss",
+        domain, result.ads_scraped, result.ads_new, result.ads_updated, result.duration_seconds,
     )
     return result
 
 
-def _run_brand_sources_batch(run_id: str, brand_sources: list[dict], mode: str) -> dict:
-    """Brand sources 기반 배치 수집 실행."""
-    from playwright.sync_api import sync_playwright
-
-    total_scraped = 0
-    total_new = 0
-    total_updated = 0
-    domain_results = {}
-    errors = []
+_WORKER_DONE = object()
 
-    # Group sources by brand for logging
-    brands_seen = {}
-    for src in brand_sources:
-        brands_seen.setdefault(src["brand_name"], []).append(src)
 
-    logger.info(f"브랜드 소스 배치: {len(brands_seen)}개 브랜드, {len(brand_sources)}개 소스")
-    for brand_name, sources in brands_seen.items():
-        logger.info(f"  [{brand_name}] {len(sources)}개 소스: {[s['platform']+':'+s['source_value'] for s in sources]}")
+def _browser_worker(work_q: queue.Queue, result_q: queue.Queue, stop: threading.Event, scrape_one) -> None:
+    """워커 스레드: 자기 브라우저를 소유하고 work_q가 빌 때까지 소스를 하나씩 처리.
 
-    pw = sync_playwright().start()
-    browser = pw.chromium.launch(headless=True)
-    logger.info("공유 브라우저 시작")
+    Playwright sync API 객체는 생성한 스레드에서만 쓸 수 있으므로 브라우저는 워커마다 따로 띄운다.
+    """
+    from playwright.sync_api import sync_playwright
 
+    worker_name = threading.current_thread().name
+    pw = None
+    browser = None
     try:
-        for idx, src in enumerate(brand_sources):
-            # 타임아웃 플래그 체크: graceful exit
-            if _timeout_flag:
-                logger.error(f"타임아웃 플래그 감지, 배치 중단 ({idx}/{len(brand_sources)} 완료)")
-                errors.append(f"TIMEOUT: 배치 {BATCH_TIMEOUT}초 초과로 중단 ({idx}/{len(brand_sources)} 완료)")
+        pw = sync_playwright().start()
+        browser = pw.chromium.launch(headless=True)
+        logger.info("공유 브라우저 시작 (%s)", worker_name)
+
+        handled = 0
+        since_restart = 0
+        while not stop.is_set() and not _timeout_flag:
+            try:
+                idx, item = work_q.get_nowait()
+            except queue.Empty:
                 break
 
             # 주기적 브라우저 재시작으로 메모리 누적 방지
-            if idx > 0 and idx % BROWSER_RESTART_INTERVAL == 0:
+            if since_restart >= BROWSER_RESTART_INTERVAL:
+                since_restart = 0
                 try:
                     browser.close()
                     browser = pw.chromium.launch(headless=True)
-                    logger.info(f"메모리 관리: 브라우저 재시작 ({idx}/{len(brand_sources)})")
+                    logger.info("메모리 관리: 브라우저 재시작 (%s, %s건 처리)", worker_name, handled)
                 except Exception as e:
-                    logger.warning(f"브라우저 재시작 실패, 새로 시작: {e}")
+                    logger.warning("브라우저 재시작 실패, 새로 시작: %s", e)
                     browser = pw.chromium.launch(headless=True)
 
-            label = f"{src['brand_name']}:{src['platform']}:{src['source_value']}"
-            logger.info(f"=== [{idx + 1}/{len(brand_sources)}] 소스: {label} ===")
-
             try:
-                result = scrape_source(src, mode=mode, browser=browser)
-                domain_results[label] = result.model_dump(mode="json")
+                result = scrape_one(item, browser)
+                # 다른 프로세스가 선점해 건너뛴 소스(None)는 브라우저를 쓰지 않았으므로 재시작 주기에 세지 않음
+                if result is not None:
+                    handled += 1
+                    since_restart += 1
+                result_q.put((idx, item, result, None))
+            except Exception as e:
+                handled += 1
+                since_restart = 0
+                result_q.put((idx, item, None, e))
+                # 에러 발생 시 브라우저 상태가 불안정할 수 있으므로 재시작
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+                browser = None
+                try:
+                    browser = pw.chromium.launch(headless=True)
+                except Exception as launch_err:
+                    # 남은 항목은 다른 워커가 가져가고, 모든 워커가 죽으면 _scrape_concurrently가 에러로 보고
+                    logger.error("에러 후 브라우저 재시작 실패, 워커 종료 (%s): %s", worker_name, launch_err)
+                    break
+                logger.info("에러 후 브라우저 재시작 (%s)", worker_name)
+    except Exception as e:
+        logger.error("브라우저 워커 중단 (%s): %s: %s", worker_name, type(e).__name__, e)
+    finally:
+        if browser is not None:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        if pw is not None:
+            pw.stop()
+        logger.info("공유 브라우저 종료 (%s)", worker_name)
+        result_q.put(_WORKER_DONE)
+
+
+def _scrape_concurrently(items: list, scrape_one, max_concurrency: int, name: str):
+    """items를 최대 max_concurrency개 브라우저 워커로 병렬 스크래핑.
+
+    완료되는 순서대로 (idx, item, result, error)를 yield. 집계/DB 기록은 호출 측(메인 스레드)에서 처리.
+    """
+    work_q: queue.Queue = queue.Queue()
+    for idx, item in enumerate(items):
+        work_q.put((idx, item))
+    result_q: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    n_workers = max(1, min(max_concurrency, len(items)))
+    workers = [
+        threading.Thread(
+            target=_browser_worker,
+            args=(work_q, result_q, stop, scrape_one),
+            name=f"{name}-{i + 1}",
+            daemon=True,
+        )
+        for i in range(n_workers)
+    ]
+    logger.info("%s: 워커 %s개로 %s건 병렬 수집", name, n_workers, len(items))
+    for w in workers:
+        w.start()
+
+    finished = 0
+    try:
+        while finished < n_workers:
+            msg = result_q.get()
+            if msg is _WORKER_DONE:
+                finished += 1
+                continue
+            yield msg
+
+        # 워커가 모두 비정상 종료해 남은 항목은 조용히 사라지지 않도록 에러로 보고
+        # (타임아웃으로 멈춘 경우는 호출 측이 TIMEOUT으로 따로 기록)
+        if not _timeout_flag:
+            while True:
+                try:
+                    idx, item = work_q.get_nowait()
+                except queue.Empty:
+                    break
+                yield idx, item, None, RuntimeError("브라우저 워커가 모두 중단되어 처리되지 않음")
+    finally:
+        stop.set()
+        for w in workers:
+            w.join()
+
+
+def _run_brand_sources_batch(run_id: str, brand_sources: list[dict], mode: str, max_concurrency: int = MAX_CONCURRENCY, cur=None) -> dict:
+    """Brand sources 기반 배치 수집 실행."""
+    total_scraped = 0
+    total_new = 0
+    total_updated = 0
+    sources_done = 0
+    errors = []
+
+    brand_count = len({src["brand_name"] for src in brand_sources})
+    logger.info("브랜드 소스 배치: %s개 브랜드, %s개 소스", brand_count, len(brand_sources))
+    # 브랜드별 소스 목록은 DEBUG에서만 만든다
+    if logger.isEnabledFor(logging.DEBUG):
+        brands_seen = {}
+        for src in brand_sources:
+            brands_seen.setdefault(src["brand_name"], []).append(src)
+        for brand_name, sources in brands_seen.items():
+            logger.debug("  [%s] %s개 소스: %s", brand_name, len(sources), [s['platform']+':'+s['source_value'] for s in sources])
+
+    def scrape_one(src, browser):
+        if not claim_brand_source(src["source_id"], run_id):
+            logger.info(
+                "=== 소스 스킵 (다른 배치 프로세스가 처리 중/완료): %s:%s:%s ===",
+                src["brand_name"], src["platform"], src["source_value"],
+            )
+            return None
+        logger.info("=== 소스 시작: %s:%s:%s ===", src["brand_name"], src["platform"], src["source_value"])
+        try:
+            return scrape_source(src, mode=mode, browser=browser)
+        finally:
+            finish_brand_source_claim(src["source_id"])
+
+    completed = 0
+    skipped = 0
+    pending_results = {}
+    pending_errors = []
+    # activity_logs / daily_brand_stats는 소스마다 쓰지 않고 모아서 실행 끝에 한 번에 기록
+    pending_activities = []
+    pending_stats = []
+    last_flush_t = time.monotonic()
+    try:
+        for idx, src, result, exc in _scrape_concurrently(brand_sources, scrape_one, max_concurrency, "brand-sources"):
+            completed += 1
+            label = f"{src['brand_name']}:{src['platform']}:{src['source_value']}"
+            if exc is None and result is None:
+                skipped += 1
+                continue
+            logger.info("=== [%d/%d] 소스 완료: %s ===", completed, len(brand_sources), label)
+
+            if exc is None:
+                # ScrapeResult 필드는 모두 str/int/float/None이라 JSON 모드 변환이 필요 없음
+                pending_results[label] = result.model_dump()
+                activities, stats = _source_outcome_rows(src, result)
+                pending_activities.extend(activities)
+                pending_stats.extend(stats)
                 total_scraped += result.ads_scraped
                 total_new += result.ads_new
                 total_updated += result.ads_updated
-            except Exception as e:
-                error_msg = f"[{label}] {type(e).__name__}: {e}"
+            else:
+                error_msg = f"[{label}] {type(exc).__name__}: {exc}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-                log_activity(
+                pending_errors.append(error_msg)
+                pending_activities.append(activity_params(
                     event_type="collection",
                     event_subtype="batch_failed",
                     title=f"Scrape failed: {label}",
-                    message=str(e),
-                )
-                domain_results[label] = BrandSourceScrapeResult(
+                    message=str(exc),
+                ))
+                pending_results[label] = BrandSourceScrapeResult(
                     source_id=src["source_id"],
                     platform=src["platform"],
                     source_type=src["source_type"],
                     source_value=src["source_value"],
-                    error=str(e),
-                ).model_dump(mode="json")
-                # 에러 발생 시 브라우저 상태가 불안정할 수 있으므로 재시작
-                try:
-                    browser.close()
-                except Exception:
-                    pass
-                browser = pw.chromium.launch(headless=True)
-                logger.info("에러 후 브라우저 재시작")
+                    error=str(exc),
+                ).model_dump()
+            sources_done += 1
 
-            try:
-                update_batch_run(
-                    run_id,
-                    total_ads_scraped=total_scraped,
-                    total_ads_new=total_new,
-                    total_ads_updated=total_updated,
-                    domain_results=domain_results,
-                    errors=errors,
-                )
-            except Exception as update_err:
-                logger.warning(f"중간 상태 업데이트 실패 (계속 진행): {type(update_err).__name__}: {update_err}")
+            if len(pending_results) >= CHECKPOINT_EVERY or time.monotonic() - last_flush_t >= CHECKPOINT_INTERVAL_S:
+                _checkpoint_batch_run(run_id, pending_results, pending_errors, cur)
+                last_flush_t = time.monotonic()
     finally:
-        try:
-            browser.close()
-        except Exception:
-            pass
-        pw.stop()
-        logger.info("공유 브라우저 종료")
+        # 마지막 체크포인트 이후 남은 결과 (크래시 시에도 기록)
+        if pending_results:
+            _checkpoint_batch_run(run_id, pending_results, pending_errors, cur)
+        log_activities(pending_activities)
+        record_daily_stats_many(pending_stats)
+
+    # 다른 실행이 선점 중이라 건너뛴 소스 (이 실행에서는 처리하지 않음)
+    if skipped:
+        logger.warning(
+            "다른 실행이 선점 중인 소스 %s/%s개 건너뜀 (이 실행 처리: %s개)", skipped, len(brand_sources), sources_done
+        )
+
+    # 타임아웃 플래그: 워커가 새 소스를 가져가지 않고 종료 (graceful exit)
+    if completed < len(brand_sources):
+        if _timeout_flag:
+            logger.error("타임아웃 플래그 감지, 배치 중단 (%s/%s 완료)", completed, len(brand_sources))
+            errors.append(f"TIMEOUT: 배치 {BATCH_TIMEOUT}초 초과로 중단 ({completed}/{len(brand_sources)} 완료)")
+        else:
+            errors.append(f"INCOMPLETE: 브라우저 워커 중단으로 {len(brand_sources) - completed}개 소스 미처리")
 
     # 에러율 임계치 체크: 50% 이상 실패 시 partial_failure
     error_rate = len(errors) / len(brand_sources) if brand_sources else 0
     partial_failure = error_rate >= 0.5
     if partial_failure:
         logger.error(
-            f"에러율 {error_rate:.0%} ({len(errors)}/{len(brand_sources)}) — partial_failure 마킹"
+            "에러율 %.0f%% (%s/%s) — partial_failure 마킹", error_rate * 100, len(errors), len(brand_sources)
         )
 
     return {
         "total_scraped": total_scraped,
         "total_new": total_new,
         "total_updated": total_updated,
-        "domain_results": domain_results,
+        "sources_done": sources_done,
+        # 마지막 체크포인트까지 실패해 아직 기록되지 않은 결과 (최종 업데이트에서 다시 시도)
+        "unsaved_results": pending_results,
         "errors": errors,
         "partial_failure": partial_failure,
     }
 
 
-def _run_legacy_domains_batch(run_id: str, domains: list[MonitoredDomain], mode: str) -> dict:
+def _run_legacy_domains_batch(run_id: str, domains: list[MonitoredDomain], mode: str, max_concurrency: int = MAX_CONCURRENCY, cur=None) -> dict:
     """Legacy monitored_domains 기반 배치 수집 실행."""
-    from playwright.sync_api import sync_playwright
-
     total_scraped = 0
     total_new = 0
     total_updated = 0
-    domain_results = {}
+    sources_done = 0
     errors = []
 
-    pw = sync_playwright().start()
-    browser = pw.chromium.launch(headless=True)
-    logger.info("공유 브라우저 시작 (legacy)")
-
+    def scrape_one(d, browser):
+        logger.info("=== 도메인 시작: %s ===", d.domain)
+        if mode == "incremental":
+            return scrape_domain_incremental(d.domain, browser=browser)
+        return scrape_domain_fully(d.domain, browser=browser)
+
+    completed = 0
+    pending_results = {}
+    pending_errors = []
+    pending_activities = []
+    last_flush_t = time.monotonic()
     try:
-        for idx, d in enumerate(domains):
-            # 타임아웃 플래그 체크: graceful exit
-            if _timeout_flag:
-                logger.error(f"타임아웃 플래그 감지, 배치 중단 ({idx}/{len(domains)} 완료)")
-                errors.append(f"TIMEOUT: 배치 {BATCH_TIMEOUT}초 초과로 중단 ({idx}/{len(domains)} 완료)")
-                break
-
-            # 주기적 브라우저 재시작으로 메모리 누적 방지
-            if idx > 0 and idx % BROWSER_RESTART_INTERVAL == 0:
-                try:
-                    browser.close()
-                    browser = pw.chromium.launch(headless=True)
-                    logger.info(f"메모리 관리: 브라우저 재시작 ({idx}/{len(domains)})")
-                except Exception as e:
-                    logger.warning(f"브라우저 재시작 실패, 새로 시작: {e}")
-                    browser = pw.chromium.launch(headless=True)
+        for idx, d, result, exc in _scrape_concurrently(domains, scrape_one, max_concurrency, "legacy-domains"):
+            completed += 1
+            logger.info("=== [%d/%d] 도메인 완료: %s ===", completed, len(domains), d.domain)
 
-            logger.info(f"=== [{idx + 1}/{len(domains)}] 도메인: {d.domain} ===")
-
-            try:
-                if mode == "incremental":
-                    result = scrape_domain_incremental(d.domain, browser=browser)
-                else:
-                    result = scrape_domain_fully(d.domain, browser=browser)
-                domain_results[d.domain] = result.model_dump(mode="json")
+            if exc is None:
+                pending_results[d.domain] = result.model_dump()
                 total_scraped += result.ads_scraped
                 total_new += result.ads_new
                 total_updated += result.ads_updated
-            except Exception as e:
-                error_msg = f"[{d.domain}] {type(e).__name__}: {e}"
+            else:
+                error_msg = f"[{d.domain}] {type(exc).__name__}: {exc}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-                log_activity(
+                pending_errors.append(error_msg)
+                pending_activities.append(activity_params(
                     event_type="collection",
                     event_subtype="batch_failed",
                     title=f"Scrape failed: {d.domain}",
-                    message=str(e),
-                )
-                domain_results[d.domain] = DomainScrapeResult(
-                    domain=d.domain, error=str(e)
-                ).model_dump(mode="json")
-                # 에러 발생 시 브라우저 상태가 불안정할 수 있으므로 재시작
-                try:
-                    browser.close()
-                except Exception:
-                    pass
-                browser = pw.chromium.launch(headless=True)
-                logger.info("에러 후 브라우저 재시작")
-
-            try:
-                update_batch_run(
-                    run_id,
-                    total_ads_scraped=total_scraped,
-                    total_ads_new=total_new,
-                    total_ads_updated=total_updated,
-                    domain_results=domain_results,
-                    errors=errors,
-                )
-            except Exception as update_err:
-                logger.warning(f"중간 상태 업데이트 실패 (계속 진행): {type(update_err).__name__}: {update_err}")
+                    message=str(exc),
+                ))
+                pending_results[d.domain] = DomainScrapeResult(
+                    domain=d.domain, error=str(exc)
+                ).model_dump()
+            sources_done += 1
+
+            if len(pending_results) >= CHECKPOINT_EVERY or time.monotonic() - last_flush_t >= CHECKPOINT_INTERVAL_S:
+                _checkpoint_batch_run(run_id, pending_results, pending_errors, cur)
+                last_flush_t = time.monotonic()
     finally:
-        try:
-            browser.close()
-        except Exception:
-            pass
-        pw.stop()
-        logger.info("공유 브라우저 종료 (legacy)")
+        # 마지막 체크포인트 이후 남은 결과 (크래시 시에도 기록)
+        if pending_results:
+            _checkpoint_batch_run(run_id, pending_results, pending_errors, cur)
+        log_activities(pending_activities)
+
+    if completed < len(domains):
+        if _timeout_flag:
+            logger.error("타임아웃 플래그 감지, 배치 중단 (%s/%s 완료)", completed, len(domains))
+            errors.append(f"TIMEOUT: 배치 {BATCH_TIMEOUT}초 초과로 중단 ({completed}/{len(domains)} 완료)")
+        else:
+            errors.append(f"INCOMPLETE: 브라우저 워커 중단으로 {len(domains) - completed}개 도메인 미처리")
 
     return {
         "total_scraped": total_scraped,
         "total_new": total_new,
         "total_updated": total_updated,
-        "domain_results": domain_results,
+        "sources_done": sources_done,
+        # 마지막 체크포인트까지 실패해 아직 기록되지 않은 결과 (최종 업데이트에서 다시 시도)
+        "unsaved_results": pending_results,
         "errors": errors,
     }
 
 
-def run_daily_batch(trigger_type: str = "manual", domain: str = "", dry_run: bool = False, mode: str = "full") -> dict:
+def run_daily_batch(
+    trigger_type: str = "manual",
+    domain: str = "",
+    dry_run: bool = False,
+    mode: str = "full",
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> dict:
     """메인 엔트리포인트:
     1. batch_run 레코드 생성
     2. brand_sources가 있으면 brand 기반 수집, 없으면 legacy monitored_domains 기반 수집
@@ -693,174 +1162,211 @@ def run_daily_batch(trigger_type: str = "manual", domain: str = "", dry_run: boo
     4. 최종 update_batch_run()으로 status='completed', finished_at 기록
     5. 결과 summary dict 반환
     """
+    # 실행 시작 시각은 한 번만 구해 batch_runs.started_at / summary에 같이 사용
+    # (소요 시간은 시스템 시계 보정에 영향받지 않도록 monotonic으로 계산)
+    started_at = datetime.now()
+    started_mono = time.monotonic()
+
     # auto 모드: 일요일이면 full, 나머지 요일은 incremental
     if mode == "auto":
-        if datetime.now().weekday() == 6:  # 일요일 = 6
+        if started_at.weekday() == 6:  # 일요일 = 6
             mode = "full"
             logger.info("auto 모드: 일요일 → full 수집")
         else:
             mode = "incremental"
             logger.info("auto 모드: 평일 → incremental 수집")
 
-    # 단일 도메인 모드 (--domain flag): legacy path
-    run_id = None
-    if domain:
-        domains = [MonitoredDomain(domain=domain)]
-        logger.info(f"단일 도메인 모드: {domain}")
-
-        if dry_run:
-            logger.info("DRY-RUN 모드: 스크래핑 없이 종료")
-            return {
-                "mode": "dry_run",
-                "trigger_type": trigger_type,
-                "total_domains": 1,
-                "domains": [domain],
-            }
-
-        run_id = create_batch_run(trigger_type=trigger_type)
-    else:
-        # Try brand sources first, fall back to legacy domains
-        brand_sources = get_active_brand_sources()
-
-        if brand_sources:
-            logger.info(f"브랜드 소스 모드: {len(brand_sources)}개 소스 (mode={mode})")
-            total_items = len(brand_sources)
+    # 소스 조회, batch_run 생성, 진행 상태 기록은 실행 내내 커넥션 하나로 처리
+    # (DB_CLOSE_ON_RETURN 환경에서 호출마다 재연결하지 않도록)
+    with get_db() as (run_conn, run_cur):
+        # 단일 도메인 모드 (--domain flag): legacy path
+        run_id = None
+        if domain:
+            domains = [MonitoredDomain(domain=domain)]
+            logger.info("단일 도메인 모드: %s", domain)
 
             if dry_run:
                 logger.info("DRY-RUN 모드: 스크래핑 없이 종료")
                 return {
                     "mode": "dry_run",
                     "trigger_type": trigger_type,
-                    "total_sources": total_items,
-                    "sources": [
-                        f"{s['brand_name']}:{s['platform']}:{s['source_value']}"
-                        for s in brand_sources
-                    ],
+                    "total_domains": 1,
+                    "domains": [domain],
                 }
 
-            run_id = create_batch_run(trigger_type=trigger_type)
+            run_id = create_batch_run(trigger_type=trigger_type, started_at=started_at, total_domains=1, cur=run_cur)
         else:
-            # Legacy: monitored_domains fallback
-            domains = get_active_domains()
-            logger.info(f"활성 도메인 {len(domains)}개 조회됨 (mode={mode}): {[d.domain for d in domains]}")
-            total_items = len(domains)
+            # Try brand sources first, fall back to legacy domains
+            brand_sources = get_active_brand_sources(cur=run_cur)
+
+            if brand_sources and not dry_run:
+                reset = reset_brand_source_claims(cur=run_cur)
+                if reset:
+                    logger.info("소스 선점 상태 초기화: %s개", reset)
+
+            if brand_sources:
+                logger.info("브랜드 소스 모드: %s개 소스 (mode=%s)", len(brand_sources), mode)
+                total_items = len(brand_sources)
+
+                if dry_run:
+                    logger.info("DRY-RUN 모드: 스크래핑 없이 종료")
+                    return {
+                        "mode": "dry_run",
+                        "trigger_type": trigger_type,
+                        "total_sources": total_items,
+                        "sources": [
+                            f"{s['brand_name']}:{s['platform']}:{s['source_value']}"
+                            for s in brand_sources
+                        ],
+                    }
+
+                run_id = create_batch_run(
+                    trigger_type=trigger_type, started_at=started_at, total_domains=total_items, cur=run_cur
+                )
+            else:
+                # Legacy: monitored_domains fallback
+                domains = get_active_domains(cur=run_cur)
+                logger.info("활성 도메인 %s개 조회됨 (mode=%s)", len(domains), mode)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("활성 도메인 목록: %s", [d.domain for d in domains])
+                total_items = len(domains)
+
+                if dry_run:
+                    logger.info("DRY-RUN 모드: 스크래핑 없이 종료")
+                    return {
+                        "mode": "dry_run",
+                        "trigger_type": trigger_type,
+                        "total_domains": total_items,
+                        "domains": [d.domain for d in domains],
+                    }
+
+                run_id = create_batch_run(
+                    trigger_type=trigger_type, started_at=started_at, total_domains=total_items, cur=run_cur
+                )
 
-            if dry_run:
-                logger.info("DRY-RUN 모드: 스크래핑 없이 종료")
-                return {
-                    "mode": "dry_run",
-                    "trigger_type": trigger_type,
-                    "total_domains": total_items,
-                    "domains": [d.domain for d in domains],
-                }
+        global _timeout_flag
+        _timeout_flag = False
+        timeout_timer = threading.Timer(BATCH_TIMEOUT, _set_timeout_flag)
+        timeout_timer.daemon = True
+        timeout_timer.start()
 
-            run_id = create_batch_run(trigger_type=trigger_type)
+        try:
+            prepare_batch_run_statements(run_cur)
+            if domain:
+                batch_result = _run_legacy_domains_batch(run_id, domains, mode, max_concurrency, run_cur)
+            elif brand_sources:
+                batch_result = _run_brand_sources_batch(run_id, brand_sources, mode, max_concurrency, run_cur)
+            else:
+                batch_result = _run_legacy_domains_batch(run_id, domains, mode, max_concurrency, run_cur)
+
+            total_scraped = batch_result["total_scraped"]
+            total_new = batch_result["total_new"]
+            total_updated = batch_result["total_updated"]
+            sources_done = batch_result["sources_done"]
+            errors = batch_result["errors"]
+
+            # 최종 상태 업데이트
+            if batch_result.get("partial_failure"):
+                final_status = BatchRunStatus.partial_failure
+                logger.warning("에러율 50% 이상: partial_failure 상태로 마킹")
+            elif _timeout_flag:
+                final_status = BatchRunStatus.completed  # timeout은 graceful exit이므로 completed
+                logger.warning("타임아웃으로 조기 종료했으나 부분 결과는 저장")
+            else:
+                final_status = BatchRunStatus.completed
+            finished_at = datetime.now()
+            duration_seconds = round(time.monotonic() - started_mono, 1)
+            # 카운터/errors는 전체 값으로 덮어써서 실패한 체크포인트가 있어도 최종 값은 정확함.
+            # 소스별 결과는 체크포인트마다 batch_run_domain_results에 기록했고, 남은 것만 여기서 다시 보낸다
+            for _retry in range(3):
+                try:
+                    insert_batch_run_results(run_id, batch_result["unsaved_results"], cur=run_cur)
+                    update_batch_run(
+                        run_id,
+                        cur=run_cur,
+                        status=final_status.value,
+                        finished_at=finished_at,
+                        total_ads_scraped=total_scraped,
+                        total_ads_new=total_new,
+                        total_ads_updated=total_updated,
+                        errors=errors,
+                    )
+                    break
+                except Exception as update_err:
+                    logger.warning("최종 상태 업데이트 재시도 (%s/3): %s: %s", _retry + 1, type(update_err).__name__, update_err)
+                    time.sleep(2)
+
+            log_activity(
+                event_type="collection",
+                event_subtype="batch_completed",
+                title=f"Batch completed: {total_new} new, {total_updated} updated",
+                metadata={
+                    "batch_run_id": run_id,
+                    "total_scraped": total_scraped,
+                    "total_new": total_new,
+                    "total_updated": total_updated,
+                    "errors_count": len(errors),
+                },
+            )
 
-    global _timeout_flag
-    _timeout_flag = False
-    timeout_timer = threading.Timer(BATCH_TIMEOUT, _set_timeout_flag)
-    timeout_timer.daemon = True
-    timeout_timer.start()
+            summary = {
+                "batch_run_id": run_id,
+                "trigger_type": trigger_type,
+                "mode": mode,
+                "status": final_status.value,
+                "total_sources": sources_done,
+                "total_ads_scraped": total_scraped,
+                "total_ads_new": total_new,
+                "total_ads_updated": total_updated,
+                "errors": errors,
+                "started_at": started_at.isoformat(),
+                "finished_at": finished_at.isoformat(),
+                "duration_seconds": duration_seconds,
+            }
 
-    try:
-        if domain:
-            update_batch_run(run_id, total_domains=1)
-            batch_result = _run_legacy_domains_batch(run_id, domains, mode)
-        elif brand_sources:
-            update_batch_run(run_id, total_domains=total_items)
-            batch_result = _run_brand_sources_batch(run_id, brand_sources, mode)
-        else:
-            update_batch_run(run_id, total_domains=total_items)
-            batch_result = _run_legacy_domains_batch(run_id, domains, mode)
-
-        total_scraped = batch_result["total_scraped"]
-        total_new = batch_result["total_new"]
-        total_updated = batch_result["total_updated"]
-        domain_results = batch_result["domain_results"]
-        errors = batch_result["errors"]
-
-        # 최종 상태 업데이트
-        if batch_result.get("partial_failure"):
-            final_status = BatchRunStatus.partial_failure if hasattr(BatchRunStatus, "partial_failure") else BatchRunStatus.completed
-            logger.warning("에러율 50% 이상: partial_failure 상태로 마킹")
-        elif _timeout_flag:
-            final_status = BatchRunStatus.completed  # timeout은 graceful exit이므로 completed
-            logger.warning("타임아웃으로 조기 종료했으나 부분 결과는 저장")
-        else:
-            final_status = BatchRunStatus.completed
-        for _retry in range(3):
+            logger.info(
+                "배치 완료: sources=%s, "
+                "scraped=%s, new=%s, updated=%s, "
+                "errors=%s, duration=%ss",
+                sources_done, total_scraped, total_new, total_updated, len(errors), duration_seconds,
+            )
+            timeout_timer.cancel()
+            return summary
+
+        except Exception as e:
+            timeout_timer.cancel()
+            logger.error("배치 실행 중 크래시: %s: %s", type(e).__name__, e)
             try:
+                # 실행용 커넥션이 깨졌거나 PREPARE 전에 실패했을 수 있으므로 새 커넥션으로 기록
                 update_batch_run(
                     run_id,
-                    status=final_status,
+                    status=BatchRunStatus.crashed.value,
                     finished_at=datetime.now(),
-                    total_ads_scraped=total_scraped,
-                    total_ads_new=total_new,
-                    total_ads_updated=total_updated,
-                    domain_results=domain_results,
-                    errors=errors,
+                    errors=[f"CRASH: {type(e).__name__}: {e}"],
                 )
-                break
-            except Exception as update_err:
-                logger.warning(f"최종 상태 업데이트 재시도 ({_retry + 1}/3): {type(update_err).__name__}: {update_err}")
-                time.sleep(2)
-
-        log_activity(
-            event_type="collection",
-            event_subtype="batch_completed",
-            title=f"Batch completed: {total_new} new, {total_updated} updated",
-            metadata={
-                "batch_run_id": run_id,
-                "total_scraped": total_scraped,
-                "total_new": total_new,
-                "total_updated": total_updated,
-                "errors_count": len(errors),
-            },
-        )
-
-        summary = {
-            "batch_run_id": run_id,
-            "trigger_type": trigger_type,
-            "mode": mode,
-            "status": final_status.value,
-            "total_sources": len(domain_results),
-            "total_ads_scraped": total_scraped,
-            "total_ads_new": total_new,
-            "total_ads_updated": total_updated,
-            "domain_results": domain_results,
-            "errors": errors,
-            "started_at": datetime.now().isoformat(),
-        }
-
-        logger.info(
-            f"배치 완료: sources={len(domain_results)}, "
-            f"scraped={total_scraped}, new={total_new}, updated={total_updated}, "
-            f"errors={len(errors)}"
-        )
-        timeout_timer.cancel()
-        return summary
-
-    except Exception as e:
-        timeout_timer.cancel()
-        logger.error(f"배치 실행 중 크래시: {type(e).__name__}: {e}")
-        try:
-            update_batch_run(
-                run_id,
-                status="crashed",
-                finished_at=datetime.now(),
-                errors=[f"CRASH: {type(e).__name__}: {e}"],
-            )
-        except Exception:
-            logger.error("크래시 상태 업데이트 실패")
-        raise
-
-
-def main(trigger_type: str = "manual", domain: str = "", dry_run: bool = False, mode: str = "full") -> dict:
+            except Exception:
+                logger.error("크래시 상태 업데이트 실패")
+            raise
+
+
+def main(
+    trigger_type: str = "manual",
+    domain: str = "",
+    dry_run: bool = False,
+    mode: str = "full",
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> dict:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     )
-    return run_daily_batch(trigger_type=trigger_type, domain=domain, dry_run=dry_run, mode=mode)
+    return run_daily_batch(
+        trigger_type=trigger_type,
+        domain=domain,
+        dry_run=dry_run,
+        mode=mode,
+        max_concurrency=max_concurrency,
+    )
 
 
 if __name__ == "__main__":
@@ -869,6 +1375,7 @@ if __name__ == "__main__":
     parser.add_argument("--dry-run", action="store_true", default=False, help="List domains only, no scraping")
     parser.add_argument("--trigger-type", type=str, default="manual", help="Trigger type (manual/scheduled)")
     parser.add_argument("--mode", choices=["full", "incremental", "auto"], default="full", help="Scraping mode (full/incremental/auto)")
+    parser.add_argument("--max-concurrency", type=int, default=MAX_CONCURRENCY, help="Sources scraped in parallel (one browser each)")
     args = parser.parse_args()
 
     result = main(
@@ -876,10 +1383,14 @@ if __name__ == "__main__":
         domain=args.domain,
         dry_run=args.dry_run,
         mode=args.mode,
+        max_concurrency=args.max_concurrency,
     )
 
     output_dir = Path(__file__).parent / "output"
     output_dir.mkdir(exist_ok=True)
     output_file = output_dir / f"batch_collector_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    output_file.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    # 임시 파일에 쓴 뒤 rename: 중간에 죽어도 반쯤 쓰인 결과 파일이 남지 않음
+    tmp_file = output_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(_to_pretty_json(result))
+    os.replace(tmp_file, output_file)
     print(f"Saved: {output_file}")
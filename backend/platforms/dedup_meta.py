@@ -1,7 +1,8 @@
 import argparse
 import hashlib
 import logging
-from collections import defaultdict
+import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from conn import get_db
@@ -9,62 +10,74 @@ from conn import get_db
 logger = logging.getLogger("dedup_meta")
 
 
+# http(s) URL의 path만 뽑는 빠른 경로. ';params'나 공백/제어문자가 섞이면 매치하지 않고
+# urlparse로 넘겨서 meta_scraper.make_source_id와 항상 같은 값을 낸다
+_HTTP_PATH_RE = re.compile(rb"^[hH][tT][tT][pP][sS]?://[^/?#\t\r\n]*([^?#;\t\r\n]*)(?:[?#]|$)")
+
+
+@lru_cache(maxsize=8192)
+def _url_path(content_url: str) -> bytes:
+    """정규식 빠른 경로에 안 맞는 URL의 path (같은 URL이 반복되면 캐시 히트)"""
+    return urlparse(content_url).path.encode()
+
+
 def make_source_id(advertiser_name: str, content_url: str) -> str:
-    parsed = urlparse(content_url)
-    stable_url = parsed.path
-    raw = f"meta:{advertiser_name}:{stable_url}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    if content_url:
+        m = _HTTP_PATH_RE.match(content_url.encode())
+        stable_url = m.group(1) if m else _url_path(content_url)
+    else:
+        stable_url = b""  # preview_url 없는 광고
+    h = hashlib.sha256(b"meta:")
+    h.update(str(advertiser_name).encode())
+    h.update(b":")
+    h.update(stable_url)
+    return h.hexdigest()[:16]
 
 
 def main(dry_run: bool = False):
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 
     with get_db() as (conn, cur):
-        # 1. 모든 Meta 광고 조회
+        # 1~2. thumbnail URL path 기준 중복 그룹을 DB에서 바로 집계
+        # thumbnail path가 가장 안정적인 식별자 (없으면 preview URL path),
+        # scheme/host와 query/fragment를 떼어 urlparse(...).path와 같은 값을 만든다
         cur.execute("""
-            SELECT id, advertiser_name, preview_url, thumbnail_url, created_at
+            SELECT
+                array_agg(id::text ORDER BY created_at ASC) AS ids,
+                (array_agg(advertiser_name ORDER BY created_at ASC))[1] AS adv_name,
+                (array_agg(preview_url ORDER BY created_at ASC))[1] AS preview_url
             FROM ads
             WHERE platform = 'meta'
-            ORDER BY created_at ASC
+            GROUP BY
+                advertiser_name,
+                regexp_replace(
+                    regexp_replace(
+                        COALESCE(NULLIF(thumbnail_url, ''), NULLIF(preview_url, ''), ''),
+                        '[?#].*$', ''
+                    ),
+                    '^[a-zA-Z][a-zA-Z0-9+.-]*://[^/]*', ''
+                )
+            HAVING count(*) > 1
+            ORDER BY min(created_at) ASC
         """)
-        rows = cur.fetchall()
-        logger.info(f"Total meta ads: {len(rows)}")
-
-        # 2. thumbnail URL path 기준으로 그룹화
-        groups = defaultdict(list)
-        for row in rows:
-            ad_id, adv_name, preview_url, thumb_url, created_at = row
-            # thumbnail path가 가장 안정적인 식별자
-            if thumb_url:
-                path = urlparse(thumb_url).path
-            elif preview_url:
-                path = urlparse(preview_url).path
-            else:
-                path = ""
-            key = (adv_name, path)
-            groups[key].append(row)
-
-        # 3. 중복 그룹 찾기
+        dup_groups = cur.fetchall()
+
+        # 3. 중복 그룹 정리
         duplicates_to_delete = []
         ids_to_update = []
 
-        for key, items in groups.items():
-            if len(items) > 1:
-                # 가장 오래된 것 유지 (이미 created_at ASC로 정렬됨)
-                keep = items[0]
-                delete_items = items[1:]
-                duplicates_to_delete.extend([item[0] for item in delete_items])
+        for ids, adv_name, preview_url in dup_groups:
+            # 가장 오래된 것 유지 (array_agg가 created_at ASC로 정렬됨)
+            keep_id = ids[0]
+            duplicates_to_delete.extend(ids[1:])
 
-                # 남길 광고의 source_id를 새 로직으로 업데이트
-                adv_name = keep[1]
-                preview_url = keep[2] or ""
-                new_source_id = make_source_id(adv_name, preview_url)
-                ids_to_update.append((new_source_id, keep[0]))
+            # 남길 광고의 source_id를 새 로직으로 업데이트
+            new_source_id = make_source_id(adv_name, preview_url or "")
+            ids_to_update.append((new_source_id, keep_id))
 
-        dup_group_count = len([g for g in groups.values() if len(g) > 1])
-        logger.info(f"Duplicate groups: {dup_group_count}")
-        logger.info(f"Ads to delete: {len(duplicates_to_delete)}")
-        logger.info(f"Ads to update source_id: {len(ids_to_update)}")
+        logger.info("Duplicate groups: %s", len(dup_groups))
+        logger.info("Ads to delete: %s", len(duplicates_to_delete))
+        logger.info("Ads to update source_id: %s", len(ids_to_update))
 
         if dry_run:
             logger.info("DRY RUN - no changes made")
@@ -75,27 +88,52 @@ def main(dry_run: bool = False):
             # board_items 참조 확인 후 삭제
             cur.execute("DELETE FROM board_items WHERE ad_id = ANY(%s::uuid[])", (duplicates_to_delete,))
             deleted_board_items = cur.rowcount
-            logger.info(f"Deleted {deleted_board_items} board_items referencing duplicates")
+            logger.info("Deleted %s board_items referencing duplicates", deleted_board_items)
 
             cur.execute("DELETE FROM ads WHERE id = ANY(%s::uuid[])", (duplicates_to_delete,))
-            logger.info(f"Deleted {cur.rowcount} duplicate ads")
+            logger.info("Deleted %s duplicate ads", cur.rowcount)
+
+        # 5. 남은 광고 source_id 업데이트 (행 단위 왕복 없이 배열로 한 번에 처리)
+        if ids_to_update:
+            new_source_ids = [new_source_id for new_source_id, _ in ids_to_update]
+            keep_ids = [ad_id for _, ad_id in ids_to_update]
+
+            # 새 source_id가 이미 다른 광고에 있거나, 앞선 그룹이 같은 source_id를 가져가면
+            # 이 광고도 삭제 (최신 버전이 이미 있음)
+            cur.execute(
+                """
+                WITH v AS (
+                    SELECT new_sid, ad_id, ord
+                    FROM unnest(%s::text[], %s::uuid[]) WITH ORDINALITY AS t(new_sid, ad_id, ord)
+                )
+                SELECT v.ad_id FROM v
+                WHERE EXISTS (
+                    SELECT 1 FROM ads a
+                    WHERE a.source_id = v.new_sid AND a.platform = 'meta' AND a.id <> v.ad_id
+                )
+                OR EXISTS (
+                    SELECT 1 FROM v prev
+                    WHERE prev.new_sid = v.new_sid AND prev.ord < v.ord
+                )
+                """,
+                (new_source_ids, keep_ids),
+            )
+            conflict_ids = [row[0] for row in cur.fetchall()]
+
+            if conflict_ids:
+                cur.execute("DELETE FROM board_items WHERE ad_id = ANY(%s::uuid[])", (conflict_ids,))
+                cur.execute("DELETE FROM ads WHERE id = ANY(%s::uuid[])", (conflict_ids,))
+            extra_deleted = len(conflict_ids)
 
-        # 5. 남은 광고 source_id 업데이트
-        extra_deleted = 0
-        for new_source_id, ad_id in ids_to_update:
-            # 새 source_id가 이미 존재하면, 이 광고도 삭제 (최신 버전이 이미 있음)
             cur.execute(
-                "SELECT id FROM ads WHERE source_id = %s AND platform = 'meta' AND id != %s",
-                (new_source_id, ad_id),
+                """
+                UPDATE ads SET source_id = v.new_sid
+                FROM unnest(%s::text[], %s::uuid[]) AS v(new_sid, ad_id)
+                WHERE ads.id = v.ad_id
+                """,
+                (new_source_ids, keep_ids),
             )
-            existing = cur.fetchone()
-            if existing:
-                cur.execute("DELETE FROM board_items WHERE ad_id = %s", (ad_id,))
-                cur.execute("DELETE FROM ads WHERE id = %s", (ad_id,))
-                extra_deleted += 1
-            else:
-                cur.execute("UPDATE ads SET source_id = %s WHERE id = %s", (new_source_id, ad_id))
-        logger.info(f"Updated source_ids: {len(ids_to_update) - extra_deleted}, extra deleted: {extra_deleted}")
+            logger.info("Updated source_ids: %s, extra deleted: %s", cur.rowcount, extra_deleted)
 
     logger.info("Deduplication complete")
 
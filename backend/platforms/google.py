@@ -1,8 +1,10 @@
 import argparse
 import asyncio
+import hashlib
 import json
 import os
 import time
+from collections import OrderedDict
 from datetime import date, datetime
 from pathlib import Path
 
@@ -15,22 +17,53 @@ load_dotenv()
 
 SERPAPI_BASE = "https://serpapi.com/search"
 
-# Simple in-memory cache: key -> (timestamp, data)
-_cache: dict[str, tuple[float, list[dict]]] = {}
+# Shared client so repeated SerpApi calls reuse keep-alive connections
+_http: httpx.AsyncClient | None = None
+
+
+def _client() -> httpx.AsyncClient:
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=64),
+        )
+    return _http
+
+
+async def close_http_client() -> None:
+    global _http
+    if _http is not None:
+        client, _http = _http, None
+        await client.aclose()
+
+
+# In-memory LRU cache of normalized results: key -> (timestamp, ads)
+_cache: OrderedDict[tuple[str, str | None, int], tuple[float, list[PlatformAd]]] = OrderedDict()
 _CACHE_TTL = 300  # 5 minutes
+_CACHE_MAXSIZE = 512
 
+# Requests currently on the wire: key -> task, shared by concurrent callers
+_inflight: dict[tuple[str, str | None, int], asyncio.Future[list[PlatformAd]]] = {}
 
-def _get_cached(cache_key: str) -> list[dict] | None:
-    if cache_key in _cache:
-        ts, data = _cache[cache_key]
-        if time.time() - ts < _CACHE_TTL:
-            return data
+
+def _get_cached(cache_key: tuple[str, str | None, int]) -> list[PlatformAd] | None:
+    entry = _cache.get(cache_key)
+    if entry is None:
+        return None
+    ts, ads = entry
+    if time.monotonic() - ts >= _CACHE_TTL:
         del _cache[cache_key]
-    return None
+        return None
+    _cache.move_to_end(cache_key)
+    return ads
 
 
-def _set_cache(cache_key: str, data: list[dict]) -> None:
-    _cache[cache_key] = (time.time(), data)
+def _set_cache(cache_key: tuple[str, str | None, int], ads: list[PlatformAd]) -> None:
+    _cache[cache_key] = (time.monotonic(), ads)
+    _cache.move_to_end(cache_key)
+    while len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
 
 
 def _unix_to_date(ts: int | float | None) -> date | None:
@@ -39,8 +72,25 @@ def _unix_to_date(ts: int | float | None) -> date | None:
     return datetime.fromtimestamp(ts).date()
 
 
+def _fallback_source_id(raw: dict) -> str:
+    """Stable id for creatives without ad_creative_id (same payload -> same id across processes)."""
+    h = hashlib.blake2b(digest_size=16)
+    for k in sorted(raw):
+        val = raw[k]
+        h.update(k.encode())
+        h.update(b"=")
+        if isinstance(val, (dict, list)):
+            h.update(json.dumps(val, sort_keys=True, default=str).encode())
+        else:
+            h.update(str(val).encode())
+        h.update(b";")
+    return h.hexdigest()
+
+
 def _normalize_google_response(raw: dict) -> PlatformAd:
-    source_id = raw.get("ad_creative_id", str(hash(json.dumps(raw, sort_keys=True, default=str))))
+    source_id = raw.get("ad_creative_id")
+    if source_id is None:
+        source_id = _fallback_source_id(raw)
     advertiser_name = raw.get("advertiser", "Unknown")
     advertiser_handle = raw.get("advertiser_id", None)
 
@@ -80,16 +130,12 @@ def _normalize_google_response(raw: dict) -> PlatformAd:
     )
 
 
-async def search_google_ads(
+async def _fetch_google_ads(
+    cache_key: tuple[str, str | None, int],
     keyword: str,
-    format: str | None = None,
-    limit: int = 25,
+    format: str | None,
+    limit: int,
 ) -> list[PlatformAd]:
-    cache_key = f"google:{keyword}:{format}:{limit}"
-    cached = _get_cached(cache_key)
-    if cached is not None:
-        return [_normalize_google_response(ad) for ad in cached]
-
     api_key = os.environ["SERPAPI_KEY"]
 
     params = {
@@ -101,16 +147,36 @@ async def search_google_ads(
     if format:
         params["creative_format"] = format
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(SERPAPI_BASE, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _client().get(SERPAPI_BASE, params=params)
+    resp.raise_for_status()
+    data = resp.json()
 
     ads_data = data.get("ad_creatives", [])[:limit]
-    _set_cache(cache_key, ads_data)
-
     results = [_normalize_google_response(ad) for ad in ads_data]
-    return [ad for ad in results if ad.format != 'text']
+    ads = [ad for ad in results if ad.format != 'text']
+    _set_cache(cache_key, ads)
+    return ads
+
+
+async def search_google_ads(
+    keyword: str,
+    format: str | None = None,
+    limit: int = 25,
+) -> list[PlatformAd]:
+    cache_key = (keyword, format, limit)
+    cached = _get_cached(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # 같은 키로 이미 나가 있는 요청이 있으면 그 결과를 같이 기다린다
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_google_ads(cache_key, keyword, format, limit))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+
+    # shield: 한 호출자가 취소돼도 다른 호출자가 기다리는 요청은 계속 진행
+    return list(await asyncio.shield(task))
 
 
 async def get_google_ad_detail(advertiser_id: str, creative_id: str | None = None) -> PlatformAd | None:
@@ -122,10 +188,9 @@ async def get_google_ad_detail(advertiser_id: str, creative_id: str | None = Non
         "api_key": api_key,
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(SERPAPI_BASE, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _client().get(SERPAPI_BASE, params=params)
+    resp.raise_for_status()
+    data = resp.json()
 
     ads_data = data.get("ad_creatives", [])
     if not ads_data:
@@ -139,8 +204,15 @@ async def get_google_ad_detail(advertiser_id: str, creative_id: str | None = Non
     return _normalize_google_response(ads_data[0])
 
 
+async def _search_once(keyword: str) -> list[PlatformAd]:
+    try:
+        return await search_google_ads(keyword)
+    finally:
+        await close_http_client()
+
+
 def main(keyword: str) -> dict:
-    ads = asyncio.run(search_google_ads(keyword))
+    ads = asyncio.run(_search_once(keyword))
     return {
         "platform": "google",
         "keyword": keyword,
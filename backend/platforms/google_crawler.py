@@ -1,13 +1,16 @@
 import argparse
 import asyncio
 import json
+import os
 import re
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 
 import logging
 
 from playwright.async_api import async_playwright
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
 logger = logging.getLogger("google_crawler")
@@ -17,23 +20,108 @@ from platforms.model import PlatformAd, PlatformType
 
 load_dotenv()
 
+_CREATIVE_ID_RE = re.compile(r'/creative/(CR\w+)')
+_ADVERTISER_ID_RE = re.compile(r'/advertiser/(AR\w+)')
+# Listing-card format badge that marks a text/search ad (the whole badge, not a substring)
+_TEXT_FORMAT_RE = re.compile(r'^(?:텍스트|text)$', re.IGNORECASE)
 
-async def crawl_google_ads(domain: str, max_ads: int = 20) -> list[PlatformAd]:
-    """Crawl Google Ads Transparency Center for a domain."""
-    ads = []
+# Domains crawled concurrently (one shared browser, one context per domain)
+CRAWL_CONCURRENCY = int(os.getenv("GOOGLE_CRAWL_CONCURRENCY", "5"))
+# Detail workers per domain, each with its own context and page, fed while the listing scrolls
+DETAIL_PAGES = int(os.getenv("GOOGLE_CRAWL_DETAIL_PAGES", "4"))
+# Detail pages a worker visits before its context is closed and recreated (caps memory)
+CONTEXT_RECYCLE_PAGES = max(1, int(os.getenv("GOOGLE_CRAWL_CONTEXT_RECYCLE_PAGES", "50")))
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            locale="ko-KR"
-        )
+
+# Resources the extractor never reads: fonts, video/audio bytes (src/poster stay in the DOM)
+# and UI-chrome images. Creative images still load since isLargeImage and screenshots need pixels.
+_BLOCKED_RESOURCE_TYPES = frozenset({"font", "media"})
+_BLOCKED_IMAGE_RE = re.compile(r"flag|googlelogo|favicon|icon|arrow|chevron")
+
+
+async def _block_unused_resources(route):
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or (
+        request.resource_type == "image" and _BLOCKED_IMAGE_RE.search(request.url.lower())
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Chromium features headless crawling never uses; trims launch time and per-process memory
+_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-features=Translate,site-per-process",
+]
+
+
+async def _launch_browser(p):
+    return await p.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+
+
+async def _new_context(browser, storage_state=None):
+    """Fresh isolated context on the shared browser (cheap compared with launching Chromium)."""
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 800},
+        locale="ko-KR",
+        storage_state=storage_state,
+        service_workers="block",
+    )
+    # Installed once per context (not per page); the context is recycled periodically
+    await context.route("**/*", _block_unused_resources)
+    return context
+
+
+async def crawl_google_ads(domain: str, max_ads: int = 20, browser=None) -> list[PlatformAd]:
+    """Crawl Google Ads Transparency Center for a domain.
+
+    Opens a per-domain context on the given browser, or launches (and closes) its own if none is passed.
+    """
+    if browser is None:
+        async with async_playwright() as p:
+            own_browser = await _launch_browser(p)
+            try:
+                return await crawl_google_ads(domain, max_ads=max_ads, browser=own_browser)
+            finally:
+                await own_browser.close()
+
+    ads = []
+    context = await _new_context(browser)
+    try:
         page = await context.new_page()
 
+        # The grid is filled from the SearchCreatives RPC; read creative ids straight from its
+        # responses so the scroll loop can stop as soon as enough ids are known
+        rpc_hrefs: dict[str, str] = {}
+
+        async def _on_response(response):
+            if _LISTING_RPC_MARKER in response.url:
+                try:
+                    rpc_hrefs.update(_creative_hrefs_from_rpc(await response.text()))
+                except Exception as e:
+                    logger.debug("Could not read listing RPC response: %s", e)
+
+        page.on("response", _on_response)
+
         # 1. Go to listing page
         url = f"https://adstransparency.google.com/?region=anywhere&domain={domain}"
-        await page.goto(url, wait_until="networkidle", timeout=30000)
-        await page.wait_for_timeout(3000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        try:
+            await page.wait_for_selector(
+                'creative-preview a[href*="/creative/"], material-button.grid-expansion-button',
+                timeout=15000,
+            )
+        except Exception:
+            logger.info("No ad cards rendered for %s", domain)
 
         # 2. Click "See all ads" button to expand the full grid
         try:
@@ -47,67 +135,291 @@ async def crawl_google_ads(domain: str, max_ads: int = 20) -> list[PlatformAd]:
         except Exception as e:
             logger.error("Could not click 'See all ads': %s", e)
 
-        # 3. Scroll to load more ads
-        prev_count = 0
-        scroll_attempts = 0
-        max_scroll_attempts = 15  # safety limit
+        # 3. Detail workers start now and consume links while the listing is still scrolling.
+        # Each worker gets its own context seeded with the listing's cookies.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+        state = await context.storage_state()
+        workers = [
+            asyncio.create_task(_detail_worker(browser, state, queue, ads))
+            for _ in range(max(1, DETAIL_PAGES))
+        ]
+        seen: set[str] = set()
+        queued = 0
+        skipped_text = 0
+        skipped_stored = 0
+
+        async def _enqueue(links: list[dict], final: bool) -> None:
+            """Queue unseen, non-text, not-yet-stored creatives up to max_ads.
+
+            Until the final pass, cards without media are left for later: their media may
+            simply not be rendered yet.
+            """
+            nonlocal queued, skipped_text, skipped_stored
+            fresh = {}
+            for link_data in links:
+                m = _CREATIVE_ID_RE.search(link_data['href'])
+                if not m or m.group(1) in seen:
+                    continue
+                if _is_text_card(link_data):
+                    if not final and link_data.get('hasMedia') is False:
+                        continue
+                    seen.add(m.group(1))
+                    skipped_text += 1
+                    continue
+                seen.add(m.group(1))
+                fresh[m.group(1)] = link_data
+            if not fresh:
+                return
+            stored = await asyncio.to_thread(get_stored_source_ids, list(fresh))
+            skipped_stored += len(stored)
+            for cr_id, link_data in fresh.items():
+                if cr_id in stored or queued >= max_ads:
+                    continue
+                await queue.put(link_data)
+                queued += 1
+
+        try:
+            # 4. Scroll to load more ads; each scroll waits only until new cards render, and
+            # the cards seen so far are handed to the workers after every step
+            scroll_attempts = 0
+            max_scroll_attempts = 15  # safety limit
+
+            while scroll_attempts < max_scroll_attempts:
+                dom_links = await page.evaluate(_LISTING_LINKS_JS)
+                await _enqueue(dom_links, final=False)
+
+                logger.info("Scroll %d: found %d ads so far (%d via RPC), %d queued", scroll_attempts + 1, len(dom_links), len(rpc_hrefs), queued)
+
+                if queued >= max_ads:
+                    break
+
+                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+                scroll_attempts += 1
+                try:
+                    await page.wait_for_function(
+                        "n => document.querySelectorAll('creative-preview a[href*=\"/creative/\"]').length > n",
+                        arg=len(dom_links),
+                        timeout=3000,
+                    )
+                except Exception:
+                    break  # nothing new within 3s: the grid is exhausted
+
+            # 5. Final pass: remaining cards, plus creatives the RPC returned but the grid didn't render
+            page.remove_listener("response", _on_response)
+            ad_links = await page.evaluate(_LISTING_LINKS_JS)
+            ad_links += [{'href': href} for href in rpc_hrefs.values()]
+            await _enqueue(ad_links, final=True)
+            logger.info(
+                "Found %d ads for %s: %d queued, %d text ads skipped, %d already stored",
+                len(seen), domain, queued, skipped_text, skipped_stored,
+            )
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    finally:
+        await context.close()
 
-        while scroll_attempts < max_scroll_attempts:
-            current_count = await page.evaluate('''() => {
-                return document.querySelectorAll('creative-preview a[href*="/creative/"]').length;
-            }''')
+    return ads
 
-            logger.info("Scroll %d: found %d ads so far", scroll_attempts + 1, current_count)
 
-            if current_count >= max_ads:
-                break
+def _creative_hrefs_from_rpc(body: str) -> dict[str, str]:
+    """creative id -> detail href from a SearchCreatives response body.
 
-            if current_count == prev_count and scroll_attempts > 2:
-                break
+    The RPC payload is undocumented, so no schema is assumed: each CR id is paired with the
+    nearest preceding AR (advertiser) id. Callers fall back to the rendered grid regardless.
+    """
+    hrefs = {}
+    advertiser_id = None
+    for m in _RPC_ID_RE.finditer(body):
+        token = m.group(1)
+        if token.startswith('AR'):
+            advertiser_id = token
+        elif advertiser_id and token not in hrefs:
+            hrefs[token] = f"/advertiser/{advertiser_id}/creative/{token}?region=anywhere"
+    return hrefs
 
-            prev_count = current_count
 
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await page.wait_for_timeout(2000)
-            scroll_attempts += 1
+def _is_text_card(link_data: dict) -> bool:
+    """Listing-card heuristic for text/search ads, which never yield a display ad.
 
-        # 4. Extract ad links from creative-preview elements
-        ad_links = await page.evaluate('''() => {
-            const cards = document.querySelectorAll('creative-preview a');
-            return Array.from(cards).map(a => ({
-                href: a.getAttribute('href'),
-                label: a.getAttribute('aria-label') || ''
-            })).filter(a => a.href && a.href.includes('/creative/'));
-        }''')
+    Only the format badge is checked; the free-form aria-label can contain advertiser
+    names or words that merely include "text".
+    """
+    if _TEXT_FORMAT_RE.match(link_data.get('formatHint', '').strip()):
+        return True
+    return link_data.get('hasMedia') is False
 
-        logger.info("Found %d ads for %s", len(ad_links), domain)
 
-        # 5. Visit each detail page (limit to max_ads)
-        for i, link_data in enumerate(ad_links[:max_ads]):
-            href = link_data['href']
-            detail_url = f"https://adstransparency.google.com{href}"
+async def _detail_worker(browser, storage_state, queue: asyncio.Queue, ads: list[PlatformAd]) -> None:
+    """Extract detail pages for links taken from `queue` until a None sentinel arrives.
 
+    The worker owns one context and page, and replaces the context (carrying cookies over)
+    every CONTEXT_RECYCLE_PAGES details so its cache and JS heap stay bounded.
+    """
+    context = None
+    page = None
+    visited = 0
+    try:
+        while (link_data := await queue.get()) is not None:
+            detail_url = f"https://adstransparency.google.com{link_data['href']}"
             try:
+                if context is None or visited >= CONTEXT_RECYCLE_PAGES:
+                    if context is not None:
+                        storage_state = await context.storage_state()
+                        await context.close()
+                        context = None
+                    context = await _new_context(browser, storage_state=storage_state)
+                    page = await context.new_page()
+                    visited = 0
+                visited += 1
                 ad_data = await _extract_ad_detail(page, detail_url)
-                if ad_data:
-                    ads.append(ad_data)
-                    logger.info("[%d/%d] %s - %s", i + 1, min(len(ad_links), max_ads), ad_data.advertiser_name, ad_data.format)
             except Exception as e:
-                logger.error("[%d] Error: %s", i + 1, e)
+                # Keep draining the queue so the listing producer never blocks on a full queue
+                logger.error("Error on %s: %s", detail_url, e)
                 continue
+            if ad_data:
+                ads.append(ad_data)
+                logger.info("[%d] %s - %s", len(ads), ad_data.advertiser_name, ad_data.format)
+    finally:
+        if context is not None:
+            await context.close()
 
-            # Small delay between requests
-            await page.wait_for_timeout(500)
 
-        await browser.close()
+async def crawl_all(domains: list[str], max_per_domain: int = 20, concurrency: int = CRAWL_CONCURRENCY, handle=None) -> dict:
+    """Crawl several domains on one browser, at most `concurrency` at a time.
 
-    return ads
+    If `handle` is given, each domain's ads are passed to `await handle(domain, ads)` as soon as
+    that domain finishes and its return value is kept instead of the ad list.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as p:
+        browser = await _launch_browser(p)
+
+        async def _guarded(domain: str):
+            async with sem:
+                logger.info("Crawling %s...", domain)
+                try:
+                    ads = await crawl_google_ads(domain, max_ads=max_per_domain, browser=browser)
+                except Exception as e:
+                    logger.error("Crawl failed for %s: %s", domain, e)
+                    ads = []
+            return await handle(domain, ads) if handle else ads
+
+        try:
+            results = await asyncio.gather(*[_guarded(d) for d in domains])
+        finally:
+            await browser.close()
+
+    return dict(zip(domains, results))
+
+
+# Detail links on the listing grid, with the card's format hints
+_LISTING_LINKS_JS = '''() => {
+    const cards = document.querySelectorAll('creative-preview a');
+    return Array.from(cards).map(a => {
+        const card = a.closest('creative-preview') || a;
+        const badge = card.querySelector('.format-label');
+        return {
+            href: a.getAttribute('href'),
+            formatHint: badge ? badge.innerText.trim() : '',
+            hasMedia: !!card.querySelector('img, video, iframe')
+        };
+    }).filter(a => a.href && a.href.includes('/creative/'));
+}'''
+
+_LISTING_RPC_MARKER = "SearchCreatives"
+_RPC_ID_RE = re.compile(r'"((?:AR|CR)\d{6,})"')
+
+_SCREENSHOTS_DIR = Path(__file__).parent.parent / "static" / "screenshots"
+
+# Detail fields kept in raw_data; image candidate lists and the page URL are already reflected above
+_RAW_DATA_KEYS = ('advertiser', 'advertiserId', 'creativeId', 'format', 'lastShown', 'isSearchAd')
+
+# (substring, (ad_format, media_type)) in priority order; the first hit wins
+_FORMAT_MAP = (
+    ('동영상', ('video', 'video')),
+    ('video', ('video', 'video')),
+    ('이미지', ('image', 'image')),
+    ('image', ('image', 'image')),
+    ('텍스트', ('text', 'image')),
+    ('text', ('text', 'image')),
+)
+
+
+@lru_cache(maxsize=64)
+def _parse_format(raw_format: str) -> tuple[str, str]:
+    """Map the detail page's "형식" value to (ad_format, media_type); unknown formats count as image."""
+    raw_format = raw_format.lower()
+    for needle, parsed in _FORMAT_MAP:
+        if needle in raw_format:
+            return parsed
+    return ('image', 'image')
+
+
+def _choose_thumbnail_and_preview(data: dict, detail_url: str) -> tuple[str, str, str, str, bool]:
+    """Per-ad decisions from the detail-page data, without any browser access.
+
+    Returns (ad_format, media_type, thumbnail_url, preview_url, should_skip). An empty
+    thumbnail_url means the caller should fall back to a screenshot.
+    """
+    # 1. Determine format FIRST (needed for thumbnail priority)
+    ad_format, media_type = _parse_format(data.get('format', 'unknown'))
+
+    # Skip text/search ads
+    if ad_format == 'text' or data.get('isSearchAd', False):
+        logger.debug("Search/text ad %s - not a display ad (format=%s, isSearchAd=%s)", data.get('creativeId'), ad_format, data.get('isSearchAd', False))
+        return ad_format, media_type, '', '', True
+
+    # 2. Determine thumbnail based on format
+    youtube_ids = data.get('youtubeVideoIds') or []
+
+    if ad_format == 'video' and youtube_ids:
+        # Video ads: prefer YouTube > syndication > other > screenshot
+        video_id = youtube_ids[0]
+        return (
+            ad_format, media_type,
+            f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg',
+            f'https://www.youtube.com/embed/{video_id}',
+            False,
+        )
+
+    # Additional search ad detection: video format but no actual video content.
+    # If the only image is from googlesyndication (text ad rendering), it's a misclassified search ad
+    if ad_format == 'video' and not data.get('videoSrc'):
+        other_img = data.get('adImageOther') or ''
+        if not other_img or 'googlesyndication.com' in other_img:
+            logger.debug("Likely search ad %s - video format but no video content, only syndication thumbnail", data.get('creativeId'))
+            return ad_format, media_type, '', '', True
+
+    # Image ads (and videos without a YouTube ID): adImage > syndication > other > poster > screenshot
+    thumbnail_url = data.get('adImage') or data.get('adImageSyndication') or data.get('adImageOther') or data.get('videoPoster') or ''
+
+    # 3. Determine preview URL
+    preview_url = data.get('videoSrc') or detail_url
+    return ad_format, media_type, thumbnail_url, preview_url, False
 
 
 async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
     """Extract ad data from a detail page."""
-    await page.goto(detail_url, wait_until="networkidle", timeout=20000)
-    await page.wait_for_timeout(2000)
+    # IDs come from the URL we already have, so malformed links never cost a navigation
+    creative_match = _CREATIVE_ID_RE.search(detail_url)
+    if not creative_match:
+        return None
+    creative_id = creative_match.group(1)
+    advertiser_match = _ADVERTISER_ID_RE.search(detail_url)
+
+    await page.goto(detail_url, wait_until="domcontentloaded", timeout=20000)
+    # Wait for the creative to render instead of for network idle (Google pages keep polling)
+    try:
+        await page.wait_for_selector('advertiser-name, .advertiser-name', state='attached', timeout=10000)
+        await page.wait_for_function("document.querySelectorAll('img').length > 2", timeout=5000)
+    except Exception:
+        pass  # text ads may render few images; extract whatever is there
 
     data = await page.evaluate('''() => {
         // Advertiser name
@@ -117,19 +429,24 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
         // Get body text for format and date
         const bodyText = document.body.innerText;
 
-        // Format
-        const formatMatch = bodyText.match(/형식:\\s*(.+?)\\n/);
-        const format = formatMatch ? formatMatch[1].trim() : 'unknown';
-
-        // Last shown date
-        const dateMatch = bodyText.match(/마지막 게재일:\\s*(.+?)\\n/);
-        const lastShown = dateMatch ? dateMatch[1].trim() : null;
+        // Format + last shown date in one pass over the body text
+        let format = 'unknown';
+        let lastShown = null;
+        for (const m of bodyText.matchAll(/(형식|마지막 게재일):\\s*(.+?)\\n/g)) {
+            if (m[1] === '형식' && format === 'unknown') format = m[2].trim();
+            else if (m[1] === '마지막 게재일' && lastShown === null) lastShown = m[2].trim();
+        }
 
         // Get main ad image - broadened detection
         // Look for any large image, excluding known icons/UI elements
-        const excludePatterns = ['flag', 'googlelogo', 'favicon', 'icon', 'arrow', 'chevron', 'close', 'search', 'menu'];
-        const adCdnDomains = ['i.ytimg.com', 'ytimg.com', 'tpc.googlesyndication.com', 'googleusercontent.com'];
-        const imgs = document.querySelectorAll('img');
+        // All <img> elements are read once; every pass below works on this list
+        const excludeRe = /flag|googlelogo|favicon|icon|arrow|chevron|close|search|menu/;
+        const adCdnRe = /ytimg\\.com|tpc\\.googlesyndication\\.com|googleusercontent\\.com/;
+        const ytRegex = /i\\.ytimg\\.com\\/vi\\/([a-zA-Z0-9_-]+)\\//;
+        const bgUrlRe = /url\\(["']?(.+?)["']?\\)/;
+        const imgMeta = Array.from(document.querySelectorAll('img'))
+            .filter(img => img.src)
+            .map(img => ({img, src: img.src, srcLower: img.src.toLowerCase()}));
         let adImage = null;
 
         function isLargeImage(img) {
@@ -142,46 +459,36 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
             return false;
         }
 
-        function isAdCdnImage(src) {
-            const srcLower = src.toLowerCase();
-            return adCdnDomains.some(domain => srcLower.includes(domain));
+        function isCandidate(m) {
+            // Accept if large OR from a known ad CDN, unless it looks like UI chrome
+            return !excludeRe.test(m.srcLower) && (isLargeImage(m.img) || adCdnRe.test(m.srcLower));
         }
 
-        // First pass: prefer images inside creative-preview or creative container
+        // Single scan over all images: the first candidate inside the creative container wins;
+        // otherwise keep the first syndication and first other candidate. The first YouTube ID
+        // on the page (the only one used) is picked up in the same loop.
         const creativeArea = document.querySelector('creative-preview, .creative-preview, .creative-container, [class*="creative"]');
-        if (creativeArea) {
-            const creativeImgs = creativeArea.querySelectorAll('img');
-            for (const img of creativeImgs) {
-                if (!img.src) continue;
-                const srcLower = img.src.toLowerCase();
-                const isExcluded = excludePatterns.some(p => srcLower.includes(p));
-                if (isExcluded) continue;
-                // Accept if large OR from a known ad CDN
-                if (isLargeImage(img) || isAdCdnImage(img.src)) {
-                    adImage = img.src;
-                    break;
-                }
-            }
-        }
-
-        // Second pass: separate by source (syndication vs other)
         let adImageSyndication = null;
         let adImageOther = null;
-        if (!adImage) {
-            for (const img of imgs) {
-                if (!img.src) continue;
-                const srcLower = img.src.toLowerCase();
-                const isExcluded = excludePatterns.some(p => srcLower.includes(p));
-                if (isExcluded) continue;
-                if (isLargeImage(img) || isAdCdnImage(img.src)) {
-                    if (srcLower.includes('googlesyndication.com') && !adImageSyndication) {
-                        adImageSyndication = img.src;
-                    } else if (!adImageOther) {
-                        adImageOther = img.src;
-                    }
-                    if (adImageSyndication && adImageOther) break;
-                }
+        const youtubeVideoIds = [];
+        for (const m of imgMeta) {
+            if (youtubeVideoIds.length === 0) {
+                const ytMatch = m.src.match(ytRegex);
+                if (ytMatch && ytMatch[1]) youtubeVideoIds.push(ytMatch[1]);
             }
+            if (adImage || !isCandidate(m)) continue;
+            if (creativeArea && creativeArea.contains(m.img)) {
+                adImage = m.src;
+            } else if (m.srcLower.includes('googlesyndication.com') && !adImageSyndication) {
+                adImageSyndication = m.src;
+            } else if (!adImageOther) {
+                adImageOther = m.src;
+            }
+        }
+        if (adImage) {
+            // Same result as before: fallbacks are only reported when the creative area had no hit
+            adImageSyndication = null;
+            adImageOther = null;
         }
 
         // Get video if exists
@@ -200,7 +507,7 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
                 const style = window.getComputedStyle(container);
                 const bgImage = style.backgroundImage;
                 if (bgImage && bgImage !== 'none') {
-                    const urlMatch = bgImage.match(/url\\(["']?(.+?)["']?\\)/);
+                    const urlMatch = bgImage.match(bgUrlRe);
                     if (urlMatch && urlMatch[1]) {
                         videoPoster = urlMatch[1];
                         break;
@@ -215,18 +522,6 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
             }
         }
 
-        // Extract YouTube video IDs from ALL images on the page
-        const youtubeVideoIds = [];
-        const ytRegex = /i\\.ytimg\\.com\\/vi\\/([a-zA-Z0-9_-]+)\\//;
-        const allImgs = document.querySelectorAll('img');
-        for (const img of allImgs) {
-            if (!img.src) continue;
-            const ytMatch = img.src.match(ytRegex);
-            if (ytMatch && ytMatch[1] && !youtubeVideoIds.includes(ytMatch[1])) {
-                youtubeVideoIds.push(ytMatch[1]);
-            }
-        }
-
         // Detect search ads by content patterns
         let isSearchAd = false;
 
@@ -244,11 +539,7 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
             isSearchAd = true;
         }
 
-        // Extract IDs from URL
-        const url = window.location.href;
-        const advIdMatch = url.match(/advertiser\\/(AR\\w+)/);
-        const creativeIdMatch = url.match(/creative\\/(CR\\w+)/);
-
+        // Keep the payload small: IDs and the page URL are already known on the Python side
         return {
             advertiser,
             format,
@@ -259,76 +550,26 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
             videoSrc,
             videoPoster,
             youtubeVideoIds,
-            isSearchAd,
-            advertiserId: advIdMatch ? advIdMatch[1] : null,
-            creativeId: creativeIdMatch ? creativeIdMatch[1] : null,
-            url: url
+            isSearchAd
         };
     }''')
 
-    if not data.get('creativeId'):
-        return None
-
-    logger.debug("%s: adImage=%r, adImageSyndication=%r, adImageOther=%r, videoPoster=%r, youtubeVideoIds=%s", data.get('creativeId'), data.get('adImage'), data.get('adImageSyndication'), data.get('adImageOther'), data.get('videoPoster'), data.get('youtubeVideoIds', []))
+    data['creativeId'] = creative_id
+    data['advertiserId'] = advertiser_match.group(1) if advertiser_match else None
 
-    # 1. Determine format FIRST (needed for thumbnail priority)
-    raw_format = data.get('format', 'unknown').lower()
-    if '동영상' in raw_format or 'video' in raw_format:
-        ad_format = 'video'
-        media_type = 'video'
-    elif '이미지' in raw_format or 'image' in raw_format:
-        ad_format = 'image'
-        media_type = 'image'
-    elif '텍스트' in raw_format or 'text' in raw_format:
-        ad_format = 'text'
-        media_type = 'image'
-    else:
-        ad_format = 'image'
-        media_type = 'image'
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: adImage=%r, adImageSyndication=%r, adImageOther=%r, videoPoster=%r, youtubeVideoIds=%s", data.get('creativeId'), data.get('adImage'), data.get('adImageSyndication'), data.get('adImageOther'), data.get('videoPoster'), data.get('youtubeVideoIds', []))
 
-    # Skip text/search ads
-    if ad_format == 'text' or data.get('isSearchAd', False):
-        logger.debug("Search/text ad %s - not a display ad (format=%s, isSearchAd=%s)", data.get('creativeId'), ad_format, data.get('isSearchAd', False))
+    ad_format, media_type, thumbnail_url, preview_url, should_skip = _choose_thumbnail_and_preview(data, detail_url)
+    if should_skip:
         return None
 
-    # 2. Determine thumbnail based on format
-    youtube_ids = data.get('youtubeVideoIds', [])
-
-    # Additional search ad detection: video format but no actual video content
-    if ad_format == 'video' and not youtube_ids and not data.get('videoSrc'):
-        # "Video" format but no actual video - likely a misclassified search ad
-        # Check if the only image is from googlesyndication (text ad rendering)
-        syndication_img = data.get('adImageSyndication', '')
-        other_img = data.get('adImageOther', '')
-        if not other_img or 'googlesyndication.com' in (other_img or ''):
-            logger.debug("Likely search ad %s - video format but no video content, only syndication thumbnail", data.get('creativeId'))
-            return None
-
-    if ad_format == 'video':
-        # Video ads: prefer YouTube > syndication > other > screenshot
-        if youtube_ids:
-            video_id = youtube_ids[0]
-            thumbnail_url = f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg'
-            youtube_embed = f'https://www.youtube.com/embed/{video_id}'
-        else:
-            thumbnail_url = data.get('adImage') or data.get('adImageSyndication') or data.get('adImageOther') or data.get('videoPoster') or ''
-            youtube_embed = None
-    else:
-        # Image/text ads: prefer syndication > adImage > other > screenshot
-        thumbnail_url = data.get('adImage') or data.get('adImageSyndication') or data.get('adImageOther') or data.get('videoPoster') or ''
-        youtube_embed = None
-
     # Screenshot fallback if still no thumbnail
     if not thumbnail_url:
         thumbnail_url = await _screenshot_fallback(page, data['creativeId'])
 
-    # 3. Determine preview URL
-    if ad_format == 'video' and youtube_embed:
-        preview_url = youtube_embed
-    else:
-        preview_url = data.get('videoSrc') or data.get('url')
-
-    logger.debug("%s: thumbnail_url=%r, preview_url=%r", data.get('creativeId'), thumbnail_url[:80] if thumbnail_url else 'EMPTY', preview_url[:80] if preview_url else 'EMPTY')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: thumbnail_url=%r, preview_url=%r", data.get('creativeId'), thumbnail_url[:80] if thumbnail_url else 'EMPTY', preview_url[:80] if preview_url else 'EMPTY')
 
     return PlatformAd(
         source_id=data['creativeId'],
@@ -345,89 +586,114 @@ async def _extract_ad_detail(page, detail_url: str) -> PlatformAd | None:
         end_date=None,
         landing_page_url=None,
         tags=[],
-        raw_data=data,
+        raw_data={k: data.get(k) for k in _RAW_DATA_KEYS},
     )
 
 
 async def _screenshot_fallback(page, creative_id: str) -> str:
-    """Take a viewport screenshot of the creative preview area as thumbnail fallback."""
+    """Take a viewport screenshot of the creative preview area as thumbnail fallback.
+
+    Captured as JPEG bytes on the caller's (pooled) page, so other detail pages keep working
+    meanwhile; the file write happens off the event loop.
+    """
     logger.info("Taking fallback screenshot for %s...", creative_id)
-    screenshots_dir = Path(__file__).parent.parent / "static" / "screenshots"
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-    screenshot_path = screenshots_dir / f"{creative_id}.png"
+    screenshot_path = _SCREENSHOTS_DIR / f"{creative_id}.jpg"
 
     try:
-        await page.screenshot(
-            path=str(screenshot_path),
+        image = await page.screenshot(
+            type="jpeg",
+            quality=75,
             clip={"x": 250, "y": 200, "width": 780, "height": 550},
         )
+        await asyncio.to_thread(_write_screenshot, screenshot_path, image)
         logger.info("Screenshot saved: %s", screenshot_path)
-        return f"/static/screenshots/{creative_id}.png"
+        return f"/static/screenshots/{creative_id}.jpg"
     except Exception:
         logger.error("Screenshot failed for %s", creative_id)
         return ''
 
 
+def _write_screenshot(path: Path, image: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(image)
+
+
+def get_stored_source_ids(creative_ids: list[str]) -> set[str]:
+    """Subset of `creative_ids` already saved as Google ads."""
+    if not creative_ids:
+        return set()
+    with get_db() as (conn, cur):
+        cur.execute(
+            "SELECT source_id FROM ads WHERE platform = 'google' AND source_id = ANY(%s)",
+            (creative_ids,),
+        )
+        return {row[0] for row in cur.fetchall()}
+
+
 def save_crawled_ads(ads: list[PlatformAd]) -> int:
-    """Save crawled ads to database."""
+    """Save crawled ads to database in one multi-row upsert per page of rows."""
     if not ads:
         return 0
 
-    saved = 0
+    # The same (source_id, platform) twice in one INSERT makes ON CONFLICT fail; keep the last one
+    rows = {
+        (ad.source_id, ad.platform.value): (
+            ad.source_id, ad.platform.value, ad.format,
+            ad.advertiser_name, ad.advertiser_handle,
+            ad.thumbnail_url, ad.preview_url,
+            ad.media_type, ad.ad_copy, ad.cta_text,
+            ad.start_date, ad.end_date,
+            ad.tags, ad.landing_page_url,
+        )
+        for ad in ads
+    }
     with get_db() as (conn, cur):
-        for ad in ads:
-            cur.execute(
-                """
-                INSERT INTO ads (
-                    source_id, platform, format, advertiser_name,
-                    advertiser_handle, thumbnail_url, preview_url,
-                    media_type, ad_copy, cta_text,
-                    start_date, end_date, tags,
-                    landing_page_url
-                ) VALUES (
-                    %s, %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    %s
-                )
-                ON CONFLICT (source_id, platform) DO UPDATE SET
-                    advertiser_name = EXCLUDED.advertiser_name,
-                    thumbnail_url = EXCLUDED.thumbnail_url,
-                    preview_url = EXCLUDED.preview_url,
-                    ad_copy = EXCLUDED.ad_copy
-                """,
-                (
-                    ad.source_id, ad.platform.value, ad.format,
-                    ad.advertiser_name, ad.advertiser_handle,
-                    ad.thumbnail_url, ad.preview_url,
-                    ad.media_type, ad.ad_copy, ad.cta_text,
-                    ad.start_date, ad.end_date,
-                    ad.tags, ad.landing_page_url,
-                ),
-            )
-            saved += 1
+        execute_values(
+            cur,
+            """
+            INSERT INTO ads (
+                source_id, platform, format, advertiser_name,
+                advertiser_handle, thumbnail_url, preview_url,
+                media_type, ad_copy, cta_text,
+                start_date, end_date, tags,
+                landing_page_url
+            ) VALUES %s
+            ON CONFLICT (source_id, platform) DO UPDATE SET
+                advertiser_name = EXCLUDED.advertiser_name,
+                thumbnail_url = EXCLUDED.thumbnail_url,
+                preview_url = EXCLUDED.preview_url,
+                ad_copy = EXCLUDED.ad_copy
+            """,
+            list(rows.values()),
+            page_size=100,
+        )
 
-    return saved
+    return len(rows)
+
+
+async def _save_domain_ads(domain: str, ads: list[PlatformAd]) -> tuple[int, int]:
+    """Persist one domain's ads as soon as it is crawled; returns (found, saved)."""
+    try:
+        saved = await asyncio.to_thread(save_crawled_ads, ads)
+    except Exception as e:
+        logger.error("Saving ads failed for %s: %s", domain, e)
+        saved = 0
+    logger.info("%s: %d ads, saved %d", domain, len(ads), saved)
+    return len(ads), saved
 
 
 def main(domains: list[str], max_per_domain: int = 20) -> dict:
-    """Crawl Google Ads for multiple domains."""
-    all_ads = []
+    """Crawl Google Ads for multiple domains, saving each domain's ads when it finishes."""
     results = {"domains": {}, "total": 0, "saved": 0}
 
-    for domain in domains:
-        logger.info("Crawling %s...", domain)
-        ads = asyncio.run(crawl_google_ads(domain, max_ads=max_per_domain))
-        all_ads.extend(ads)
-        results["domains"][domain] = len(ads)
-
-    saved = save_crawled_ads(all_ads)
-    results["total"] = len(all_ads)
-    results["saved"] = saved
+    crawled = asyncio.run(crawl_all(domains, max_per_domain, handle=_save_domain_ads))
+    for domain, (found, saved) in crawled.items():
+        results["domains"][domain] = found
+        results["total"] += found
+        results["saved"] += saved
     results["crawled_at"] = datetime.now().isoformat()
 
-    logger.info("Total: %d ads, Saved: %d", len(all_ads), saved)
+    logger.info("Total: %d ads, Saved: %d", results["total"], results["saved"])
     return results
 
 
@@ -3,10 +3,16 @@ import hashlib
 import json
 import logging
 import os
+import queue
 import re
+import threading
 import time
 import urllib.parse
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -29,19 +35,42 @@ BLOCKED_DOMAINS = [
     "facebook.",
     "instagram.",
 ]
+# BLOCKED_DOMAINS를 하나로 묶은 정규식 (url.lower() 없이 한 번에 검색)
+_BLOCKED_RE = re.compile("|".join(map(re.escape, BLOCKED_DOMAINS)), re.IGNORECASE)
+
+# 랜딩 URL 후보에서 제외할 구글 자체/광고 프레임 도메인
+_SKIP_DOMAINS_RE = re.compile("|".join(map(re.escape, [
+    "adstransparency.google.com", "support.google.com",
+    "policies.google.com", "safety.google", "about.google",
+    "blog.google", "googlesyndication.com", "safeframe",
+])))
 
 CONTEXT_RESTART_INTERVAL = int(os.getenv("SCRAPER_CONTEXT_RESTART_INTERVAL", "20"))
+# 상세 페이지를 동시에 방문할 브라우저 수 (1이면 순차)
+DETAIL_WORKERS = max(1, int(os.getenv("SCRAPER_DETAIL_WORKERS", "4")))
+# 상세 페이지용으로 추가로 띄우는 브라우저는 프로세스 전체에서 DETAIL_WORKERS - 1개까지만.
+# 배치 워커 여러 개가 동시에 fan-out해도 Chromium 수가 곱으로 늘지 않게 한다
+_detail_browser_slots = threading.BoundedSemaphore(DETAIL_WORKERS - 1)
+
+_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "ko-KR",
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
 
 
+@lru_cache(maxsize=2048)
 def is_blocked_url(url: str) -> bool:
-    if not url:
-        return False
-    return any(domain in url.lower() for domain in BLOCKED_DOMAINS)
+    return bool(url) and _BLOCKED_RE.search(url) is not None
 
 
 def make_source_id(advertiser_name: str, content_url: str) -> str:
-    raw = f"google:{advertiser_name}:{content_url}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    # sha256("google:{advertiser_name}:{content_url}")과 같은 값을 중간 문자열 없이 계산
+    h = hashlib.sha256(b"google:")
+    h.update(str(advertiser_name).encode())
+    h.update(b":")
+    h.update(str(content_url).encode())
+    return h.hexdigest()[:16]
 
 
 def extract_creative_id_from_link(href: str) -> str | None:
@@ -50,276 +79,389 @@ def extract_creative_id_from_link(href: str) -> str | None:
     return m.group(1) if m else None
 
 
-def get_existing_creative_ids(domain: str) -> set[str]:
-    """DB에서 해당 도메인의 기존 creative_id 목록 조회"""
+# 증분 모드 creative_id 캐시: bare_domain -> (timestamp, 확인한 ID, DB에 있는 ID)
+_creative_id_cache: OrderedDict[str, tuple[float, set[str], set[str]]] = OrderedDict()
+_CREATIVE_ID_CACHE_TTL = 600  # 10 minutes
+_CREATIVE_ID_CACHE_MAXSIZE = 256
+# 배치 워커 스레드들이 캐시를 공유하므로 조회-갱신-축출은 락 안에서만 한다 (DB 조회는 락 밖)
+_creative_id_cache_lock = threading.Lock()
+
+
+def get_existing_creative_ids(domain: str, candidate_ids: list[str]) -> set[str]:
+    """candidate_ids 중 DB에 이미 있는 해당 도메인의 creative_id만 조회
+
+    도메인 전체 목록을 가져오지 않고 후보 ID로 먼저 좁힌다 (creative_id = ANY).
+    """
+    if not candidate_ids:
+        return set()
     bare_domain = domain.replace("www.", "")
+    # 같은 실행 안에서 이미 확인한 ID는 캐시로 답하고, 처음 보는 ID만 DB에 묻는다
+    now = time.monotonic()
+    with _creative_id_cache_lock:
+        entry = _creative_id_cache.get(bare_domain)
+        if entry is None or now - entry[0] >= _CREATIVE_ID_CACHE_TTL:
+            entry = (now, set(), set())
+        unchecked = [cid for cid in candidate_ids if cid not in entry[1]]
+    found = _query_existing_creative_ids(bare_domain, unchecked) if unchecked else set()
+    with _creative_id_cache_lock:
+        _, checked, existing = entry
+        existing |= found
+        checked.update(unchecked)
+        _creative_id_cache[bare_domain] = entry
+        _creative_id_cache.move_to_end(bare_domain)
+        while len(_creative_id_cache) > _CREATIVE_ID_CACHE_MAXSIZE:
+            _creative_id_cache.popitem(last=False)
+        return existing.intersection(candidate_ids)
+
+
+def add_creative_id(domain: str, creative_id: str) -> None:
+    """저장된 creative_id를 캐시에 반영 (write-through). 캐시에 없는 도메인은 무시"""
+    with _creative_id_cache_lock:
+        entry = _creative_id_cache.get(domain.replace("www.", ""))
+        if entry is not None:
+            entry[1].add(creative_id)
+            entry[2].add(creative_id)
+
+
+# 조회 쿼리는 풀 커넥션마다 한 번 PREPARE하고 이후에는 EXECUTE만 보낸다 (매 호출 파싱/플래닝 생략).
+# PREPARE는 세션 단위라 커넥션 객체로 추적하고, 풀에서 버려진 커넥션은 WeakSet에서 자동으로 빠진다
+_EXISTING_CREATIVE_IDS_PREPARE = """
+    PREPARE existing_creative_ids (text[], text, text) AS
+    SELECT creative_id FROM ads
+    WHERE platform = 'google'
+      AND creative_id = ANY($1)
+      AND (REPLACE(domain, 'www.', '') = $2
+           OR (domain IS NULL AND landing_page_url LIKE $3))
+"""
+_prepared_conns: weakref.WeakSet = weakref.WeakSet()
+
+
+def _query_existing_creative_ids(bare_domain: str, candidate_ids: list[str]) -> set[str]:
     with get_db() as (conn, cur):
+        if conn not in _prepared_conns:
+            cur.execute(_EXISTING_CREATIVE_IDS_PREPARE)
+            _prepared_conns.add(conn)
         cur.execute(
-            """
-            SELECT creative_id FROM ads
-            WHERE platform = 'google'
-              AND creative_id IS NOT NULL
-              AND (REPLACE(domain, 'www.', '') = %s
-                   OR (domain IS NULL AND landing_page_url LIKE %s))
-            """,
-            (bare_domain, f"%{bare_domain}%"),
+            "EXECUTE existing_creative_ids (%s, %s, %s)",
+            (candidate_ids, bare_domain, f"%{bare_domain}%"),
         )
         return {row[0] for row in cur.fetchall()}
 
 
+@lru_cache(maxsize=4096)
 def _is_junk_url(url: str) -> bool:
-    """content_url로 쓸모없는 URL인지 판별"""
+    """content_url로 쓸모없는 URL인지 판별 (_COLLECT_VARIANTS_JS의 isJunkUrl과 같은 규칙)"""
     if not url:
         return True
     lower = url.lower()
-    if "safeframe" in lower:
-        return True
-    if lower.rstrip("/").endswith("/adframe"):
-        return True
-    if lower.startswith("about:"):
-        return True
-    return False
+    return (
+        lower.startswith("about:")
+        or "safeframe" in lower
+        or lower.rstrip("/").endswith("/adframe")
+    )
+
 
+# ytimg.com/vi/ · youtube.com/watch?v= · youtube.com/embed/ · youtu.be/ · video_id= 파라미터를 한 번에 검색
+_YT_ID_RE = re.compile(
+    r'(?:ytimg\.com/vi/|youtube\.com/watch\?v=|youtube\.com/embed/|youtu\.be/|[?&]video_id=)'
+    r'([a-zA-Z0-9_-]{11})'
+)
 
+
+@lru_cache(maxsize=4096)
 def _extract_youtube_video_id(url: str) -> str | None:
     """다양한 YouTube 관련 URL에서 video ID를 추출"""
     if not url:
         return None
-    # ytimg.com/vi/{VIDEO_ID}/... 패턴
-    m = re.search(r'ytimg\.com/vi/([a-zA-Z0-9_-]{11})', url)
-    if m:
-        return m.group(1)
-    # youtube.com/watch?v={VIDEO_ID}
-    m = re.search(r'youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})', url)
-    if m:
-        return m.group(1)
-    # youtube.com/embed/{VIDEO_ID}
-    m = re.search(r'youtube\.com/embed/([a-zA-Z0-9_-]{11})', url)
-    if m:
-        return m.group(1)
-    # youtu.be/{VIDEO_ID}
-    m = re.search(r'youtu\.be/([a-zA-Z0-9_-]{11})', url)
-    if m:
-        return m.group(1)
-    # youtube_vertical_player_media 등 URL 내 video_id 파라미터
-    m = re.search(r'[?&]video_id=([a-zA-Z0-9_-]{11})', url)
-    if m:
-        return m.group(1)
-    return None
+    # 대부분의 simgad URL은 정규식까지 가지 않고 걸러진다
+    if "ytimg" not in url and "youtu" not in url and "video_id=" not in url:
+        return None
+    m = _YT_ID_RE.search(url)
+    return m.group(1) if m else None
 
 
-def collect_all_variants(page) -> list[dict]:
-    """creative-details .ad-container의 모든 대안 sub-container에서 content_url 일괄 수집
-    (모든 대안이 DOM에 동시에 로드되어 있음 - hidden 클래스로 표시 제어)
-    각 variant에 landing_url 후보(anchor href)도 함께 수집
+_COLLECT_VARIANTS_JS = """() => {
+    const container = document.querySelector('creative-details .ad-container');
+    if (!container) return [];
 
-    수집 우선순위:
-    1. img[src*="simgad"] - 직접 이미지
-    2. iframe[src*="youtube"] - 유튜브 영상
-    3. iframe[src*="sadbundle"] - sadbundle (adurl 추출 가능)
-    4. adframe iframe 내부 진입 -> simgad 이미지 추출
-    5. safeframe iframe은 content_url 후보에서 제외
-    """
-    raw = page.evaluate("""() => {
-        const container = document.querySelector('creative-details .ad-container');
-        if (!container) return [];
-
-        const results = [];
-        const seen = new Set();
-        const skipDomains = ['adstransparency.google.com', 'support.google.com',
-                              'policies.google.com', 'safety.google', 'about.google'];
-
-        // 형식 라벨 감지 (creative-details 영역 내)
-        const allBodyText = document.body ? document.body.innerText : '';
-        const isTextAd = /형식\\s*[:\\uff1a]\\s*텍스트|Format\\s*[:\\uff1a]\\s*Text/i.test(allBodyText);
-
-        // 모든 대안 sub-container 순회 (visible/hidden 모두 포함)
-        const subs = container.querySelectorAll('.creative-sub-container');
-        const targets = subs.length > 0 ? Array.from(subs) : [container];
-
-        // YouTube video ID 추출 헬퍼 (JS 내부)
-        function extractYtVideoId(src) {
-            if (!src) return null;
-            let m;
-            m = src.match(/ytimg\\.com\\/vi\\/([a-zA-Z0-9_-]{11})/);
-            if (m) return m[1];
-            m = src.match(/youtube\\.com\\/embed\\/([a-zA-Z0-9_-]{11})/);
-            if (m) return m[1];
-            m = src.match(/youtube\\.com\\/watch\\?v=([a-zA-Z0-9_-]{11})/);
-            if (m) return m[1];
-            m = src.match(/youtu\\.be\\/([a-zA-Z0-9_-]{11})/);
-            if (m) return m[1];
-            m = src.match(/[?&]video_id=([a-zA-Z0-9_-]{11})/);
-            if (m) return m[1];
-            return null;
+    const results = [];
+    const seen = new Set();
+    // content_url로 쓸모없는 URL (Python _is_junk_url과 같은 규칙). CDP로 넘기기 전에 여기서 거른다
+    function isJunkUrl(u) {
+        const lower = u.toLowerCase();
+        return lower.startsWith('about:') || lower.includes('safeframe')
+            || lower.replace(/\\/+$/, '').endsWith('/adframe');
+    }
+    // 랜딩 후보에서 제외할 호스트: URL을 한 번 파싱해 호스트와 상위 도메인만 Set에서 조회
+    const skipHosts = new Set(['adstransparency.google.com', 'support.google.com',
+                               'policies.google.com', 'safety.google', 'about.google']);
+    function isSkippedUrl(h) {
+        let host;
+        try { host = new URL(h).hostname; } catch (e) { return true; }
+        for (let d = host; d; d = d.includes('.') ? d.slice(d.indexOf('.') + 1) : '') {
+            if (skipHosts.has(d)) return true;
         }
+        return false;
+    }
 
-        for (const sub of targets) {
-            let url = null;
-            let is_video = false;
-            let video_url = null;
-            let thumb_url = null;
-            let youtube_video_id = null;
-
-            // 영상 감지: sub-container 내 video/iframe 관련 요소 확인
-            const ytIframeCheck = sub.querySelector('iframe[src*="youtube"]');
-            const ytVerticalCheck = sub.querySelector('iframe[src*="youtube_vertical_player"]');
-            const videoTagCheck = sub.querySelector('video');
-            if (ytIframeCheck || ytVerticalCheck || videoTagCheck) {
-                is_video = true;
-            }
+    // 형식 라벨 감지 (creative-details 영역 내)
+    const allBodyText = document.body ? document.body.innerText : '';
+    const isTextAd = /형식\\s*[:\\uff1a]\\s*텍스트|Format\\s*[:\\uff1a]\\s*Text/i.test(allBodyText);
+
+    // 모든 대안 sub-container 순회 (visible/hidden 모두 포함)
+    const subs = container.querySelectorAll('.creative-sub-container');
+    const targets = subs.length > 0 ? Array.from(subs) : [container];
+    // sub-container마다 후보 요소를 이 셀렉터 한 번으로 (문서 순서대로) 모은다
+    const candidateSel = 'img[src*="simgad"], img[src*="ytimg"], iframe[src], video';
+
+    // YouTube video ID 추출 헬퍼 (JS 내부)
+    function extractYtVideoId(src) {
+        if (!src) return null;
+        let m;
+        m = src.match(/ytimg\\.com\\/vi\\/([a-zA-Z0-9_-]{11})/);
+        if (m) return m[1];
+        m = src.match(/youtube\\.com\\/embed\\/([a-zA-Z0-9_-]{11})/);
+        if (m) return m[1];
+        m = src.match(/youtube\\.com\\/watch\\?v=([a-zA-Z0-9_-]{11})/);
+        if (m) return m[1];
+        m = src.match(/youtu\\.be\\/([a-zA-Z0-9_-]{11})/);
+        if (m) return m[1];
+        m = src.match(/[?&]video_id=([a-zA-Z0-9_-]{11})/);
+        if (m) return m[1];
+        return null;
+    }
 
-            // 영상 광고: thumbnail_url과 video_url 분리 수집
-            if (is_video) {
-                // 썸네일: ytimg.com 이미지 또는 simgad 이미지
-                const ytThumb = sub.querySelector('img[src*="ytimg"]');
-                if (ytThumb && ytThumb.src) {
-                    thumb_url = ytThumb.src;
-                    // ytimg URL에서 video ID 추출
-                    if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytThumb.src);
-                }
-                if (!thumb_url) {
-                    const simgadThumb = sub.querySelector('img[src*="simgad"]');
-                    if (simgadThumb && simgadThumb.src) thumb_url = simgadThumb.src;
+    for (const sub of targets) {
+        let url = null;
+        let is_video = false;
+        let video_url = null;
+        let thumb_url = null;
+        let youtube_video_id = null;
+
+        // 후보 요소를 한 번 훑으며 종류별로 처음 나온 요소만 기록
+        // (querySelector 여러 번과 같은 결과: 각 종류의 문서 순서상 첫 요소)
+        let simgadImg = null, ytThumb = null, videoTag = null;
+        let ytIframe = null, ytVertical = null, sbIframe = null, adframeIframe = null, otherIframe = null;
+        for (const el of sub.querySelectorAll(candidateSel)) {
+            if (el.tagName === 'VIDEO') {
+                if (!videoTag) videoTag = el;
+                continue;
+            }
+            const src = el.getAttribute('src');
+            if (el.tagName === 'IMG') {
+                if (!simgadImg && src.includes('simgad')) simgadImg = el;
+                if (!ytThumb && src.includes('ytimg')) ytThumb = el;
+                continue;
+            }
+            if (!ytIframe && src.includes('youtube')) ytIframe = el;
+            if (!ytVertical && src.includes('youtube_vertical_player')) ytVertical = el;
+            if (!sbIframe && src.includes('sadbundle')) sbIframe = el;
+            if (!adframeIframe && src.includes('adframe')) adframeIframe = el;
+            if (!otherIframe) {
+                const s = el.src.toLowerCase();
+                if (s && !s.includes('safeframe') && !s.includes('adframe')
+                    && !s.startsWith('about:')) {
+                    otherIframe = el;
                 }
+            }
+        }
 
-                // 영상 플레이어 URL: YouTube iframe src 또는 youtube_vertical_player iframe src
-                if (ytVerticalCheck && ytVerticalCheck.src) {
-                    video_url = ytVerticalCheck.src;
-                    if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytVerticalCheck.src);
-                } else if (ytIframeCheck && ytIframeCheck.src) {
-                    video_url = ytIframeCheck.src;
-                    if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytIframeCheck.src);
-                }
-                if (videoTagCheck && !video_url) {
-                    const videoSrc = videoTagCheck.src || videoTagCheck.querySelector('source')?.src;
-                    if (videoSrc) video_url = videoSrc;
-                }
+        // 영상 감지: sub-container 내 video/youtube iframe 존재 여부
+        if (ytIframe || videoTag) {
+            is_video = true;
+        }
+
+        // 영상 광고: thumbnail_url과 video_url 분리 수집
+        if (is_video) {
+            // 썸네일: ytimg.com 이미지 또는 simgad 이미지
+            if (ytThumb && ytThumb.src) {
+                thumb_url = ytThumb.src;
+                // ytimg URL에서 video ID 추출
+                if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytThumb.src);
+            }
+            if (!thumb_url && simgadImg && simgadImg.src) thumb_url = simgadImg.src;
+
+            // 영상 플레이어 URL: YouTube iframe src 또는 youtube_vertical_player iframe src
+            if (ytVertical && ytVertical.src) {
+                video_url = ytVertical.src;
+                if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytVertical.src);
+            } else if (ytIframe && ytIframe.src) {
+                video_url = ytIframe.src;
+                if (!youtube_video_id) youtube_video_id = extractYtVideoId(ytIframe.src);
             }
+            if (videoTag && !video_url) {
+                const videoSrc = videoTag.src || videoTag.querySelector('source')?.src;
+                if (videoSrc) video_url = videoSrc;
+            }
+        }
 
-            // 1순위: 직접 simgad 이미지
-            const img = sub.querySelector('img[src*="simgad"]');
-            if (img && img.src) url = img.src;
-
-            // 2순위: YouTube iframe
-            const ytIframe = sub.querySelector('iframe[src*="youtube"]');
-            if (!url && ytIframe && ytIframe.src) url = ytIframe.src;
-
-            // 3순위: sadbundle iframe
-            const sbIframe = sub.querySelector('iframe[src*="sadbundle"]');
-            if (!url && sbIframe && sbIframe.src) url = sbIframe.src;
-
-            // 4순위: adframe iframe 내부에서 simgad 이미지 탐색
-            if (!url) {
-                const adframeIframe = sub.querySelector('iframe[src*="adframe"]');
-                if (adframeIframe) {
-                    try {
-                        const innerDoc = adframeIframe.contentDocument || adframeIframe.contentWindow.document;
-                        if (innerDoc) {
-                            const innerImg = innerDoc.querySelector('img[src*="simgad"]');
-                            if (innerImg && innerImg.src) url = innerImg.src;
-                            // adframe 내부의 다른 iframe에서도 탐색
-                            if (!url) {
-                                const innerIframes = innerDoc.querySelectorAll('iframe[src]');
-                                for (const f of innerIframes) {
-                                    if (f.src && (f.src.includes('simgad') || f.src.includes('youtube'))) {
-                                        url = f.src;
-                                        break;
-                                    }
-                                }
+        // 1순위: 직접 simgad 이미지
+        if (simgadImg && simgadImg.src) url = simgadImg.src;
+
+        // 2순위: YouTube iframe
+        if (!url && ytIframe && ytIframe.src) url = ytIframe.src;
+
+        // 3순위: sadbundle iframe
+        if (!url && sbIframe && sbIframe.src) url = sbIframe.src;
+
+        // 4순위: adframe iframe 내부에서 simgad 이미지 탐색
+        if (!url && adframeIframe) {
+            try {
+                const innerDoc = adframeIframe.contentDocument || adframeIframe.contentWindow.document;
+                if (innerDoc) {
+                    const innerImg = innerDoc.querySelector('img[src*="simgad"]');
+                    if (innerImg && innerImg.src) url = innerImg.src;
+                    // adframe 내부의 다른 iframe에서도 탐색
+                    if (!url) {
+                        const innerIframes = innerDoc.querySelectorAll('iframe[src]');
+                        for (const f of innerIframes) {
+                            if (f.src && (f.src.includes('simgad') || f.src.includes('youtube'))) {
+                                url = f.src;
+                                break;
+                            }
+                        }
+                    }
+                    // adframe 내부에서도 영상 감지
+                    if (!is_video) {
+                        const innerYt = innerDoc.querySelector('iframe[src*="youtube"]');
+                        const innerVideo = innerDoc.querySelector('video');
+                        if (innerYt || innerVideo) {
+                            is_video = true;
+                            if (innerYt && innerYt.src) {
+                                video_url = innerYt.src;
+                                if (!youtube_video_id) youtube_video_id = extractYtVideoId(innerYt.src);
                             }
-                            // adframe 내부에서도 영상 감지
-                            if (!is_video) {
-                                const innerYt = innerDoc.querySelector('iframe[src*="youtube"]');
-                                const innerVideo = innerDoc.querySelector('video');
-                                if (innerYt || innerVideo) {
-                                    is_video = true;
-                                    if (innerYt && innerYt.src) {
-                                        video_url = innerYt.src;
-                                        if (!youtube_video_id) youtube_video_id = extractYtVideoId(innerYt.src);
-                                    }
-                                    const innerThumb = innerDoc.querySelector('img[src*="ytimg"]');
-                                    if (innerThumb && innerThumb.src) {
-                                        thumb_url = innerThumb.src;
-                                        if (!youtube_video_id) youtube_video_id = extractYtVideoId(innerThumb.src);
-                                    }
-                                }
+                            const innerThumb = innerDoc.querySelector('img[src*="ytimg"]');
+                            if (innerThumb && innerThumb.src) {
+                                thumb_url = innerThumb.src;
+                                if (!youtube_video_id) youtube_video_id = extractYtVideoId(innerThumb.src);
                             }
                         }
-                    } catch(e) {
-                        // cross-origin 접근 불가 시 무시
                     }
                 }
+            } catch(e) {
+                // cross-origin 접근 불가 시 무시
             }
+        }
 
-            // 5순위: 기타 iframe (safeframe/adframe/about: 제외)
-            if (!url) {
-                const allIframes = sub.querySelectorAll('iframe[src]');
-                for (const f of allIframes) {
-                    const s = f.src.toLowerCase();
-                    if (s && !s.includes('safeframe') && !s.includes('adframe')
-                        && !s.startsWith('about:')) {
-                        url = f.src;
-                        break;
-                    }
-                }
+        // 5순위: 기타 iframe (safeframe/adframe/about: 제외)
+        if (!url && otherIframe) url = otherIframe.src;
+
+        // sub-container 내 <a> 태그에서 외부 링크 수집 (랜딩 URL 후보)
+        let anchor_href = null;
+        const anchors = sub.querySelectorAll('a[href]');
+        for (const a of anchors) {
+            const h = a.href;
+            if (h && h.startsWith('http') && !isSkippedUrl(h)) {
+                anchor_href = h;
+                break;
             }
+        }
 
-            // sub-container 내 <a> 태그에서 외부 링크 수집 (랜딩 URL 후보)
-            let anchor_href = null;
-            const anchors = sub.querySelectorAll('a[href]');
-            for (const a of anchors) {
-                const h = a.href;
-                if (h && h.startsWith('http') && !skipDomains.some(d => h.includes(d))) {
-                    anchor_href = h;
-                    break;
+        // content_url에서도 youtube_video_id 추출 시도
+        if (!youtube_video_id && url) youtube_video_id = extractYtVideoId(url);
+
+        // 텍스트 광고는 content_url 필터 제외
+        if (url && !seen.has(url)) {
+            seen.add(url);
+            if (!(isTextAd && !is_video) && isJunkUrl(url)) continue;
+            results.push({
+                content_url: url,
+                anchor_href: anchor_href,
+                is_video: is_video,
+                is_text: isTextAd && !is_video,
+                ad_copy_text: (isTextAd && !is_video) ? sub.innerText.trim() : null,
+                video_url: video_url,
+                thumbnail_url: thumb_url,
+                youtube_video_id: youtube_video_id,
+            });
+        }
+
+        // 텍스트 광고 처리: 형식이 텍스트이고 이미지/비디오 URL이 없는 경우
+        if (!url && isTextAd) {
+            const textContent = sub.innerText.trim();
+            if (textContent) {
+                const syntheticId = 'text_ad:' + btoa(unescape(encodeURIComponent(textContent.substring(0, 100))));
+                if (!seen.has(syntheticId)) {
+                    seen.add(syntheticId);
+                    results.push({
+                        content_url: syntheticId,
+                        anchor_href: anchor_href,
+                        is_video: false,
+                        is_text: true,
+                        ad_copy_text: textContent,
+                        video_url: null,
+                        thumbnail_url: null,
+                        youtube_video_id: null,
+                    });
                 }
             }
+        }
+    }
 
-            // content_url에서도 youtube_video_id 추출 시도
-            if (!youtube_video_id && url) youtube_video_id = extractYtVideoId(url);
-
-            if (url && !seen.has(url)) {
-                seen.add(url);
-                results.push({
-                    content_url: url,
-                    anchor_href: anchor_href,
-                    is_video: is_video,
-                    is_text: isTextAd && !is_video,
-                    ad_copy_text: (isTextAd && !is_video) ? sub.innerText.trim() : null,
-                    video_url: video_url,
-                    thumbnail_url: thumb_url,
-                    youtube_video_id: youtube_video_id,
-                });
-            }
+    return results;
+}"""
 
-            // 텍스트 광고 처리: 형식이 텍스트이고 이미지/비디오 URL이 없는 경우
-            if (!url && isTextAd) {
-                const textContent = sub.innerText.trim();
-                if (textContent) {
-                    const syntheticId = 'text_ad:' + btoa(unescape(encodeURIComponent(textContent.substring(0, 100))));
-                    if (!seen.has(syntheticId)) {
-                        seen.add(syntheticId);
-                        results.push({
-                            content_url: syntheticId,
-                            anchor_href: anchor_href,
-                            is_video: false,
-                            is_text: true,
-                            ad_copy_text: textContent,
-                            video_url: null,
-                            thumbnail_url: null,
-                            youtube_video_id: null,
-                        });
-                    }
-                }
+
+def collect_all_variants(page) -> list[dict]:
+    """creative-details .ad-container의 모든 대안 sub-container에서 content_url 일괄 수집
+    (모든 대안이 DOM에 동시에 로드되어 있음 - hidden 클래스로 표시 제어)
+    각 variant에 landing_url 후보(anchor href)도 함께 수집
+
+    수집 우선순위:
+    1. img[src*="simgad"] - 직접 이미지
+    2. iframe[src*="youtube"] - 유튜브 영상
+    3. iframe[src*="sadbundle"] - sadbundle (adurl 추출 가능)
+    4. adframe iframe 내부 진입 -> simgad 이미지 추출
+    5. safeframe iframe은 content_url 후보에서 제외
+    """
+    # 쓸모없는 URL(safeframe/adframe/about:)은 JS 안에서 이미 걸러져 돌아온다
+    return page.evaluate(_COLLECT_VARIANTS_JS)
+
+
+# iframe 하나에서 콘텐츠 URL·영상·랜딩 후보를 한 번에 수집 (frame당 evaluate 1회)
+_FRAME_VARIANT_JS = """(skipPattern) => {
+    const skipRe = new RegExp(skipPattern);
+    function firstAttr(selector, name, accept) {
+        for (const el of document.querySelectorAll(selector)) {
+            const v = el.getAttribute(name);
+            if (v && (!accept || accept(v))) return v;
+        }
+        return null;
+    }
+
+    // 영상 감지: frame 내부의 video/youtube 요소 확인
+    let isVideo = false;
+    let videoUrl = null;
+    let thumbUrl = null;
+    const videoTags = document.querySelectorAll('video');
+    if (document.querySelector('iframe[src*="youtube"]') || videoTags.length > 0) {
+        isVideo = true;
+        // 영상 플레이어 URL: vertical player > youtube iframe > video 태그
+        videoUrl = firstAttr('iframe[src*="youtube_vertical_player"]', 'src')
+            || firstAttr('iframe[src*="youtube"]', 'src');
+        if (!videoUrl) {
+            for (const vt of videoTags) {
+                const src = vt.getAttribute('src');
+                if (src) { videoUrl = src; break; }
+                const source = vt.querySelector('source[src]');
+                if (source && source.getAttribute('src')) { videoUrl = source.getAttribute('src'); break; }
             }
         }
+        thumbUrl = firstAttr('img[src*="ytimg"]', 'src');
+    }
 
-        return results;
-    }""")
+    // 1. simgad 이미지 > 2. 중첩 iframe(simgad/youtube) > 3. 일반 이미지
+    const contentUrl = firstAttr('img[src*="simgad"]', 'src')
+        || firstAttr('iframe[src]', 'src', s => s.includes('simgad') || s.includes('youtube'))
+        || firstAttr('img[src]', 'src', s => s.startsWith('http') && !s.includes('googlesyndication'));
 
-    # Python 측에서 쓸모없는 URL 최종 필터링 (텍스트 광고는 content_url 필터 제외)
-    return [v for v in raw if v.get("is_text") or not _is_junk_url(v.get("content_url", ""))]
+    // frame 내부 외부 링크 (랜딩 URL 후보)
+    const anchorHref = firstAttr('a[href]', 'href', h => h.startsWith('http') && !skipRe.test(h));
+
+    return {content_url: contentUrl, anchor_href: anchorHref, is_video: isVideo,
+            video_url: videoUrl, thumbnail_url: thumbUrl};
+}"""
 
 
 def _collect_variants_from_frames(page) -> list[dict]:
@@ -330,114 +472,27 @@ def _collect_variants_from_frames(page) -> list[dict]:
     seen = set()
 
     for frame in page.frames:
-        frame_url = frame.url
         # 메인 프레임 스킵
         if frame == page.main_frame:
             continue
 
         # safeframe/adframe 내부에 접근하여 실제 콘텐츠 URL 찾기
-        content_url = None
-        anchor_href = None
-        is_video = False
-        video_url = None
-        thumb_url = None
-        youtube_video_id = None
-
-        # 영상 감지: frame 내부의 video/youtube 요소 확인
-        yt_iframes = frame.query_selector_all('iframe[src*="youtube"]')
-        yt_vertical_iframes = frame.query_selector_all('iframe[src*="youtube_vertical_player"]')
-        video_tags = frame.query_selector_all('video')
-        if yt_iframes or yt_vertical_iframes or video_tags:
-            is_video = True
-            # 영상 플레이어 URL 수집
-            for yt_v in yt_vertical_iframes:
-                src = yt_v.get_attribute("src")
-                if src:
-                    video_url = src
-                    if not youtube_video_id:
-                        youtube_video_id = _extract_youtube_video_id(src)
-                    break
-            if not video_url:
-                for yt_i in yt_iframes:
-                    src = yt_i.get_attribute("src")
-                    if src:
-                        video_url = src
-                        if not youtube_video_id:
-                            youtube_video_id = _extract_youtube_video_id(src)
-                        break
-            if not video_url:
-                for vt in video_tags:
-                    src = vt.get_attribute("src")
-                    if src:
-                        video_url = src
-                        break
-                    source_el = vt.query_selector("source[src]")
-                    if source_el:
-                        src = source_el.get_attribute("src")
-                        if src:
-                            video_url = src
-                            break
-            # 썸네일 수집
-            ytimg_imgs = frame.query_selector_all('img[src*="ytimg"]')
-            for img in ytimg_imgs:
-                src = img.get_attribute("src")
-                if src:
-                    thumb_url = src
-                    if not youtube_video_id:
-                        youtube_video_id = _extract_youtube_video_id(src)
-                    break
-
-        # 1. frame 내부의 simgad 이미지
-        simgad_imgs = frame.query_selector_all('img[src*="simgad"]')
-        for img in simgad_imgs:
-            src = img.get_attribute("src")
-            if src:
-                content_url = src
-                break
-
-        # 2. frame 내부의 또 다른 iframe (중첩)
-        if not content_url:
-            inner_iframes = frame.query_selector_all('iframe[src]')
-            for inner in inner_iframes:
-                src = inner.get_attribute("src")
-                if src and ("simgad" in src or "youtube" in src):
-                    content_url = src
-                    break
-
-        # 3. frame 내부의 일반 이미지 (충분히 큰 것만)
-        if not content_url:
-            all_imgs = frame.query_selector_all("img[src]")
-            for img in all_imgs:
-                src = img.get_attribute("src")
-                if src and src.startswith("http") and "googlesyndication" not in src:
-                    content_url = src
-                    break
-
-        # frame 내부 외부 링크 수집 (랜딩 URL 후보)
-        skip_domains = ["adstransparency.google.com", "support.google.com",
-                        "policies.google.com", "safety.google", "about.google",
-                        "blog.google", "googlesyndication.com", "safeframe"]
-        anchors = frame.query_selector_all("a[href]")
-        for a in anchors:
-            href = a.get_attribute("href")
-            if href and href.startswith("http") and not any(d in href for d in skip_domains):
-                anchor_href = href
-                break
-
-        # content_url에서도 youtube_video_id 추출 시도
-        if not youtube_video_id and content_url:
-            youtube_video_id = _extract_youtube_video_id(content_url)
+        try:
+            v = frame.evaluate(_FRAME_VARIANT_JS, _SKIP_DOMAINS_RE.pattern)
+        except Exception as e:
+            logger.debug(f"frame evaluate 실패, skip: {e}")
+            continue
 
+        content_url = v["content_url"]
         if content_url and content_url not in seen and not _is_junk_url(content_url):
             seen.add(content_url)
-            results.append({
-                "content_url": content_url,
-                "anchor_href": anchor_href,
-                "is_video": is_video,
-                "video_url": video_url,
-                "thumbnail_url": thumb_url,
-                "youtube_video_id": youtube_video_id,
-            })
+            # 플레이어 URL > 썸네일 > content_url 순으로 youtube_video_id 추출
+            v["youtube_video_id"] = (
+                _extract_youtube_video_id(v["video_url"])
+                or _extract_youtube_video_id(v["thumbnail_url"])
+                or _extract_youtube_video_id(content_url)
+            )
+            results.append(v)
 
     return results
 
@@ -445,13 +500,70 @@ def _collect_variants_from_frames(page) -> list[dict]:
 def get_landing_from_sadbundle(page, sadbundle_url: str) -> str:
     """sadbundle 방문 -> HTML에서 adurl= 파라미터 추출 -> 랜딩 URL 디코딩"""
     page.goto(sadbundle_url, wait_until="load", timeout=15000)
-    time.sleep(2)
 
-    html = page.content()
-    match = re.search(r"adurl=(https?[^\"&<>\s\\]+)", html)
-    if match:
-        return urllib.parse.unquote(match.group(1))
-    return ""
+    # HTML 전체를 CDP로 넘기지 않고 브라우저 안에서 adurl= 값만 뽑아온다.
+    # 고정 대기 없이 adurl=이 나타나는 즉시 반환하고, 2초 안에 없으면 포기한다
+    # (디코딩은 잘못된 %-시퀀스에도 관대한 urllib.parse.unquote로)
+    try:
+        adurl = page.wait_for_function("""() => {
+            const m = document.documentElement.outerHTML.match(/adurl=(https?[^"&<>\\s\\\\]+)/);
+            return m ? m[1] : '';
+        }""", timeout=2000).json_value()
+    except Exception:
+        adurl = ""
+    return urllib.parse.unquote(adurl) if adurl else ""
+
+
+_LANDING_URL_JS = """() => {
+    // 전략 1: '대상' 또는 'Destination' 라벨 근처 URL
+    const allText = document.body ? document.body.innerText : '';
+    const destMatch = allText.match(/(?:대상|Destination)[:\\s]*(https?:\\/\\/[^\\s]+)/i);
+    if (destMatch) return destMatch[1];
+
+    // 전략 2: creative-details 내 외부 <a> 링크
+    // 호스트(및 상위 도메인)를 Set에서 조회, google.com/ads만 경로까지 확인
+    const skipHosts = new Set([
+        'adstransparency.google.com',
+        'support.google.com',
+        'policies.google.com',
+        'safety.google',
+        'about.google',
+        'blog.google',
+        'googlesyndication.com',
+    ]);
+    function isSkippedUrl(h) {
+        let url;
+        try { url = new URL(h); } catch (e) { return true; }
+        const host = url.hostname;
+        if ((host === 'google.com' || host.endsWith('.google.com')) && url.pathname.startsWith('/ads')) return true;
+        for (let d = host; d; d = d.includes('.') ? d.slice(d.indexOf('.') + 1) : '') {
+            if (skipHosts.has(d)) return true;
+        }
+        return false;
+    }
+    const details = document.querySelector('creative-details');
+    if (details) {
+        const links = details.querySelectorAll('a[href]');
+        for (const a of links) {
+            const h = a.href;
+            if (h && h.startsWith('http') && !isSkippedUrl(h)) {
+                return h;
+            }
+        }
+    }
+
+    // 전략 3: googleadservices 리다이렉트 링크의 adurl= 추출
+    // 페이지 전체 innerHTML을 직렬화하지 않고 해당 href/src를 가진 요소만 확인
+    const redirects = document.querySelectorAll('[href*="googleadservices.com"], [src*="googleadservices.com"]');
+    for (const el of redirects) {
+        const u = el.getAttribute('href') || el.getAttribute('src');
+        const m = u && u.match(/adurl=(https?[^"&<>\\s\\\\]+)/);
+        if (!m) continue;
+        try { return decodeURIComponent(m[1]); } catch (e) { /* 잘못된 %-시퀀스는 건너뜀 */ }
+    }
+
+    return '';
+}"""
 
 
 def _extract_landing_url(page) -> str:
@@ -461,43 +573,63 @@ def _extract_landing_url(page) -> str:
     2. creative-details 영역 내 외부 <a> 링크
     3. 페이지 전체에서 googleadservices.com 리다이렉트 URL의 adurl= 파라미터
     """
-    result = page.evaluate("""() => {
-        // 전략 1: '대상' 또는 'Destination' 라벨 근처 URL
-        const allText = document.body ? document.body.innerText : '';
-        const destMatch = allText.match(/(?:대상|Destination)[:\\s]*(https?:\\/\\/[^\\s]+)/i);
-        if (destMatch) return destMatch[1];
-
-        // 전략 2: creative-details 내 외부 <a> 링크
-        const skipDomains = [
-            'adstransparency.google.com',
-            'support.google.com',
-            'policies.google.com',
-            'safety.google',
-            'google.com/ads',
-            'about.google',
-            'blog.google',
-            'googlesyndication.com',
-        ];
-        const details = document.querySelector('creative-details');
-        if (details) {
-            const links = details.querySelectorAll('a[href]');
-            for (const a of links) {
-                const h = a.href;
-                if (h && h.startsWith('http')
-                    && !skipDomains.some(d => h.includes(d))) {
-                    return h;
-                }
-            }
-        }
+    result = page.evaluate(_LANDING_URL_JS)
+    return result or ""
 
-        // 전략 3: 페이지 내 googleadservices 리다이렉트에서 adurl= 추출
-        const html = document.documentElement.innerHTML;
-        const adservicesMatch = html.match(/googleadservices\\.com[^"']*adurl=(https?[^"&<>\\s\\\\]+)/);
-        if (adservicesMatch) return decodeURIComponent(adservicesMatch[1]);
 
-        return '';
-    }""")
-    return result or ""
+# 상세 페이지 수집을 evaluate 한 번(CDP 왕복 1회)으로 묶은 스크립트
+_DETAIL_PAGE_JS = """() => {
+    const variants = (""" + _COLLECT_VARIANTS_JS + """)();
+    const landingUrl = (""" + _LANDING_URL_JS + """)();
+    const bodyText = document.body ? document.body.innerText : '';
+    const isTextFormat = /형식\\s*[:\\uff1a]\\s*텍스트|Format\\s*[:\\uff1a]\\s*Text/i.test(bodyText);
+    let adText = '';
+    if (isTextFormat) {
+        const container = document.querySelector('creative-details .ad-container');
+        adText = container ? container.innerText.trim() : '';
+    }
+    return {variants, landing_url: landingUrl || '', is_text_format: isTextFormat, ad_text: adText};
+}"""
+
+
+def collect_detail_page(page) -> dict:
+    """상세 페이지의 대안 목록·랜딩 URL·텍스트 형식 여부를 evaluate 한 번으로 수집
+
+    collect_all_variants + _extract_landing_url + 텍스트 광고 판별을 합친 것.
+    반환: {"variants": [...], "landing_url": str, "is_text_format": bool, "ad_text": str}
+    """
+    return page.evaluate(_DETAIL_PAGE_JS)
+
+
+def _text_ad_variant(ad_text: str) -> dict:
+    """이미지/영상 없이 텍스트만 있는 광고의 synthetic variant"""
+    return {
+        "content_url": "text_ad:" + hashlib.sha256(ad_text[:100].encode()).hexdigest()[:16],
+        "anchor_href": None,
+        "is_video": False,
+        "is_text": True,
+        "ad_copy_text": ad_text,
+        "video_url": None,
+        "thumbnail_url": None,
+        "youtube_video_id": None,
+    }
+
+
+_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/]+)')
+# content_url에 있으면 영상 광고로 보는 키워드 (대소문자 무시)
+_VIDEO_URL_RE = re.compile(
+    r"youtube\.com|youtu\.be|ytimg\.com|youtube_vertical_player|youtube_player|video_player",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def _extract_domain(url: str) -> str:
+    """랜딩 URL의 도메인 (www. 접두사 제거). 매칭 실패 시 빈 문자열"""
+    if not url:
+        return ""
+    m = _DOMAIN_RE.match(url)
+    return m.group(1) if m else ""
 
 
 def variant_to_platform_ad(advertiser_name: str, variant: dict, landing_url: str) -> PlatformAd:
@@ -511,14 +643,14 @@ def variant_to_platform_ad(advertiser_name: str, variant: dict, landing_url: str
         if content_url and not content_url.startswith("text_ad:"):
             source_id = make_source_id(advertiser_name, content_url)
         else:
-            content_key = f"text:{advertiser_name}:{ad_copy_text[:100]}"
-            source_id = hashlib.sha256(f"google:{content_key}".encode()).hexdigest()[:16]
+            # sha256("google:text:{advertiser_name}:{ad_copy_text[:100]}")
+            h = hashlib.sha256(b"google:text:")
+            h.update(str(advertiser_name).encode())
+            h.update(b":")
+            h.update(str(ad_copy_text[:100]).encode())
+            source_id = h.hexdigest()[:16]
 
-        domain = ""
-        if landing_url:
-            m = re.match(r'https?://(?:www\.)?([^/]+)', landing_url)
-            if m:
-                domain = m.group(1)
+        domain = _extract_domain(landing_url)
 
         return PlatformAd(
             source_id=source_id,
@@ -534,25 +666,22 @@ def variant_to_platform_ad(advertiser_name: str, variant: dict, landing_url: str
             raw_data={"advertiser_name": advertiser_name, "variant": variant},
         )
 
-    # 기존 video/image 로직
+    # 기존 video/image 로직 (variant 필드는 한 번씩만 읽는다)
     content_url = variant.get("content_url", "")
-    lower_url = content_url.lower()
+    variant_thumbnail_url = variant.get("thumbnail_url")
+    variant_video_url = variant.get("video_url")
 
     # 영상 판별: JS에서 전달한 is_video 힌트 + URL 키워드 기반 판별 병용
-    is_video = variant.get("is_video", False) or any(keyword in lower_url for keyword in [
-        "youtube.com", "youtu.be", "ytimg.com",
-        "youtube_vertical_player", "youtube_player",
-        "video_player",
-    ])
+    is_video = variant.get("is_video", False) or _VIDEO_URL_RE.search(content_url) is not None
     media_type = "video" if is_video else "image"
 
     # YouTube video ID 추출: variant에서 직접 가져오거나 URL들에서 추출
-    video_id = variant.get("youtube_video_id")
-    if not video_id:
-        for url_key in ("content_url", "thumbnail_url", "video_url"):
-            video_id = _extract_youtube_video_id(variant.get(url_key, ""))
-            if video_id:
-                break
+    video_id = (
+        variant.get("youtube_video_id")
+        or _extract_youtube_video_id(content_url)
+        or _extract_youtube_video_id(variant_thumbnail_url or "")
+        or _extract_youtube_video_id(variant_video_url or "")
+    )
 
     # 영상 광고: thumbnail_url은 썸네일 이미지, preview_url은 실제 YouTube 영상 URL
     # 이미지 광고: 둘 다 content_url 사용
@@ -560,18 +689,14 @@ def variant_to_platform_ad(advertiser_name: str, variant: dict, landing_url: str
         thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg"
         preview_url = f"https://www.youtube.com/watch?v={video_id}"
     elif is_video:
-        thumbnail_url = variant.get("thumbnail_url") or content_url or ""
-        preview_url = variant.get("video_url") or content_url or None
+        thumbnail_url = variant_thumbnail_url or content_url or ""
+        preview_url = variant_video_url or content_url or None
     else:
         thumbnail_url = content_url or ""
         preview_url = content_url or None
 
     # Extract domain from landing_url (www. 접두사 제거하여 정규화)
-    domain = ""
-    if landing_url:
-        m = re.match(r'https?://(?:www\.)?([^/]+)', landing_url)
-        if m:
-            domain = m.group(1)
+    domain = _extract_domain(landing_url)
 
     return PlatformAd(
         source_id=make_source_id(advertiser_name, content_url),
@@ -587,20 +712,64 @@ def variant_to_platform_ad(advertiser_name: str, variant: dict, landing_url: str
     )
 
 
-def _search_and_get_advertisers(page, keyword: str, base_url: str) -> list[dict]:
-    """키워드 검색 후 드롭다운에서 광고주 목록(이름 + 인덱스)을 수집한다."""
-    page.goto(base_url, wait_until="load", timeout=60000)
-    time.sleep(5)
+# 도메인 검색 결과 그리드에서 상세 페이지 링크가 달린 카드 수
+_CARD_COUNT_JS = """() => document.querySelectorAll('creative-preview a[href*="/creative/"]').length"""
+
+_CREATIVE_READY_JS = """() => !!document.querySelector(
+    'creative-details img[src*="simgad"], '
+    + 'creative-details iframe[src*="youtube"], '
+    + 'creative-details iframe[src*="sadbundle"]'
+)"""
+
+
+def _wait_for_creative_ready(page, timeout: int = 5000) -> bool:
+    """실제 광고 콘텐츠(simgad 이미지, youtube/sadbundle iframe)가 DOM에 붙을 때까지 대기.
 
-    search_input = page.wait_for_selector('input[type="text"]', timeout=15000)
+    고정 sleep 대신 조건이 참이 되는 즉시 반환한다. 시간 내에 나타나지 않으면 False.
+    """
+    try:
+        page.wait_for_function(_CREATIVE_READY_JS, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+def _wait_for_more_cards(page, prev_count: int, timeout: int) -> bool:
+    """광고 카드 수가 prev_count보다 늘어날 때까지 대기. 시간 내에 늘지 않으면 False."""
+    try:
+        page.wait_for_function(
+            f"(n) => ({_CARD_COUNT_JS})() > n", arg=prev_count, timeout=timeout
+        )
+        return True
+    except Exception:
+        return False
+
+
+def _open_search_dropdown(page, keyword: str, base_url: str, reload: bool = True) -> list:
+    """검색창에 키워드를 입력해 광고주 드롭다운을 열고 항목 목록을 반환한다.
+
+    reload=False면 현재 페이지(뒤로 가기로 돌아온 검색 페이지)의 검색창을 그대로 쓴다.
+    """
+    if reload:
+        # 트래커/이미지까지 기다리는 load 대신 DOM만 준비되면 바로 검색창을 기다린다
+        page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+
+    search_input = page.wait_for_selector('input[type="text"]', timeout=15000 if reload else 5000)
     search_input.click()
     search_input.fill(keyword)
-    time.sleep(1)
 
-    page.wait_for_selector("material-select-item", timeout=15000)
-    time.sleep(1)
+    page.wait_for_function(
+        "() => document.querySelectorAll('material-select-item').length > 0", timeout=15000
+    )
+
+    return page.query_selector_all("material-select-item")
+
 
-    items = page.query_selector_all("material-select-item")
+def _search_and_get_advertisers(page, keyword: str, base_url: str) -> list[dict]:
+    """키워드 검색 후 드롭다운에서 광고주 목록(이름 + 인덱스)을 수집한다.
+    드롭다운은 열린 채로 두어 첫 광고주는 다시 검색하지 않고 바로 클릭할 수 있다.
+    """
+    items = _open_search_dropdown(page, keyword, base_url)
     advertisers = []
     for idx, item in enumerate(items):
         name_el = item.query_selector("div.name")
@@ -610,23 +779,10 @@ def _search_and_get_advertisers(page, keyword: str, base_url: str) -> list[dict]
     return advertisers
 
 
-def _collect_ads_for_advertiser(
-    page, keyword: str, base_url: str, advertiser_index: int, advertiser_name: str, max_creatives: int
-) -> list[PlatformAd]:
-    """검색 페이지에서 특정 광고주를 클릭하고 광고를 수집한다."""
-    # 검색 페이지로 이동 + 키워드 입력 + 드롭다운 대기
-    page.goto(base_url, wait_until="load", timeout=60000)
-    time.sleep(5)
-
-    search_input = page.wait_for_selector('input[type="text"]', timeout=15000)
-    search_input.click()
-    search_input.fill(keyword)
-    time.sleep(1)
-
-    page.wait_for_selector("material-select-item", timeout=15000)
-    time.sleep(1)
-
-    items = page.query_selector_all("material-select-item")
+def _collect_creative_links(
+    page, items: list, advertiser_index: int, advertiser_name: str, max_creatives: int
+) -> list[str]:
+    """열린 드롭다운(items)에서 특정 광고주를 클릭하고 크리에이티브 링크를 수집한다."""
     if advertiser_index >= len(items):
         logger.warning(f"광고주 인덱스 {advertiser_index} 초과 (총 {len(items)}개)")
         return []
@@ -635,10 +791,9 @@ def _collect_ads_for_advertiser(
     logger.info(f"광고주 클릭: {advertiser_name} (index={advertiser_index})")
     target_item.click()
 
-    # 광고 카드 로드 대기
+    # 광고 카드 로드 대기: 고정 sleep 대신 크리에이티브 링크가 달린 카드가 나타날 때까지
     logger.info("creative-preview 카드 대기")
-    page.wait_for_selector("creative-preview", timeout=30000)
-    time.sleep(3)
+    page.wait_for_function(f"() => ({_CARD_COUNT_JS})() > 0", timeout=30000)
 
     # 크리에이티브 링크 수집
     creatives = page.query_selector_all("creative-preview")[:max_creatives]
@@ -652,97 +807,73 @@ def _collect_ads_for_advertiser(
             creative_links.append(href)
 
     logger.info(f"크리에이티브 링크 {len(creative_links)}개 수집")
+    return creative_links
 
-    # 각 크리에이티브 상세 페이지 방문 -> 대안별 URL 수집 -> 랜딩 URL 추출
-    ads: list[PlatformAd] = []
 
-    for i, href in enumerate(creative_links):
-        detail_url = f"https://adstransparency.google.com{href}"
-        if "region=KR" not in detail_url:
-            detail_url += ("&" if "?" in detail_url else "?") + "region=KR"
+def _scrape_creative_detail(page, href: str, advertiser_name: str, label: str) -> list[PlatformAd]:
+    """크리에이티브 상세 페이지 하나를 방문해 대안별 광고를 수집한다."""
+    detail_url = f"https://adstransparency.google.com{href}"
+    if "region=KR" not in detail_url:
+        detail_url += ("&" if "?" in detail_url else "?") + "region=KR"
 
-        logger.info(f"  [{i+1}/{len(creative_links)}] 상세 페이지: {href[:80]}")
+    logger.info(f"  [{label}] 상세 페이지: {href[:80]}")
 
-        loaded = False
-        for attempt in range(3):
-            try:
-                page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                loaded = True
-                break
-            except Exception as e:
-                if attempt < 2:
-                    logger.warning(f"  [{i+1}/{len(creative_links)}] 상세 페이지 로드 재시도 ({attempt+1}/3): {e}")
-                    time.sleep(2)
-                else:
-                    logger.warning(f"  [{i+1}/{len(creative_links)}] 상세 페이지 로드 최종 실패, skip: {e}")
-        if not loaded:
-            continue
-        time.sleep(3)
+    loaded = False
+    for attempt in range(3):
+        try:
+            page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
+            loaded = True
+            break
+        except Exception as e:
+            if attempt < 2:
+                logger.warning(f"  [{label}] 상세 페이지 로드 재시도 ({attempt+1}/3): {e}")
+                time.sleep(2)
+            else:
+                logger.warning(f"  [{label}] 상세 페이지 로드 최종 실패, skip: {e}")
+    if not loaded:
+        return []
 
-        # 광고주명
-        name_el = page.query_selector("div.advertiser-name")
-        name = name_el.inner_text().strip() if name_el else advertiser_name
+    # creative-details 패널 대기
+    try:
+        page.wait_for_selector("creative-details .ad-container", timeout=8000)
+    except Exception:
+        logger.warning(f"creative-details 패널 없음: url={detail_url[:100]}")
+        return []
 
-        # creative-details 패널 대기
-        try:
-            page.wait_for_selector("creative-details .ad-container", timeout=5000)
-        except Exception:
-            logger.warning(f"creative-details 패널 없음: url={detail_url[:100]}")
-            continue
+    # 광고주명 (패널이 렌더링된 뒤에 읽는다)
+    name_el = page.query_selector("div.advertiser-name")
+    name = name_el.inner_text().strip() if name_el else advertiser_name
 
-        # 실제 광고 콘텐츠(simgad 이미지 또는 youtube iframe)가 로드될 때까지 추가 대기
-        try:
-            page.wait_for_selector(
-                'creative-details img[src*="simgad"], '
-                'creative-details iframe[src*="youtube"], '
-                'creative-details iframe[src*="sadbundle"]',
-                timeout=5000,
-            )
-        except Exception:
-            logger.debug("simgad/youtube/sadbundle 콘텐츠 미감지, 기존 DOM으로 진행")
-        time.sleep(1)
-
-        # 모든 대안 수집 (JS evaluate + Playwright frame API 병용)
-        raw_variants = collect_all_variants(page)
-
-        # JS로 못 찾은 경우 Playwright frame API로 iframe 내부 콘텐츠 탐색
-        if not raw_variants:
-            raw_variants = _collect_variants_from_frames(page)
-
-        # 텍스트 광고 fallback: 이미지/영상 variant가 없지만 페이지에 텍스트 콘텐츠가 있는 경우
-        if not raw_variants:
-            is_text_format = page.evaluate("""() => {
-                const bodyText = document.body ? document.body.innerText : '';
-                return /형식\\s*[:\\uff1a]\\s*텍스트|Format\\s*[:\\uff1a]\\s*Text/i.test(bodyText);
-            }""")
-            if is_text_format:
-                ad_text = page.evaluate("""() => {
-                    const container = document.querySelector('creative-details .ad-container');
-                    return container ? container.innerText.trim() : '';
-                }""")
-                if ad_text:
-                    raw_variants = [{
-                        "content_url": "text_ad:" + hashlib.sha256(ad_text[:100].encode()).hexdigest()[:16],
-                        "anchor_href": None,
-                        "is_video": False,
-                        "is_text": True,
-                        "ad_copy_text": ad_text,
-                        "video_url": None,
-                        "thumbnail_url": None,
-                        "youtube_video_id": None,
-                    }]
-                    logger.info(f"  텍스트 광고 감지: {ad_text[:80]}")
-
-        logger.info(f"  {name} | 대안 {len(raw_variants)}개")
-
-        # 상세 페이지 자체에서 랜딩 URL 추출 시도 (모든 variant 공통)
-        page_landing_url = _extract_landing_url(page)
-        if is_blocked_url(page_landing_url):
-            page_landing_url = ""
-        if page_landing_url:
-            logger.info(f"  상세 페이지에서 랜딩 URL 추출: {page_landing_url[:80]}")
-
-        # 각 대안별 랜딩 URL 결정
+    # 실제 광고 콘텐츠(simgad 이미지 또는 youtube iframe)가 로드될 때까지 추가 대기
+    if not _wait_for_creative_ready(page):
+        logger.debug("simgad/youtube/sadbundle 콘텐츠 미감지, 기존 DOM으로 진행")
+
+    # 모든 대안 + 랜딩 URL + 텍스트 형식 여부를 evaluate 한 번으로 수집
+    detail = collect_detail_page(page)
+    raw_variants = detail["variants"]
+
+    # JS로 못 찾은 경우 Playwright frame API로 iframe 내부 콘텐츠 탐색
+    if not raw_variants:
+        raw_variants = _collect_variants_from_frames(page)
+
+    # 텍스트 광고 fallback: 이미지/영상 variant가 없지만 페이지에 텍스트 콘텐츠가 있는 경우
+    if not raw_variants and detail["is_text_format"] and detail["ad_text"]:
+        raw_variants = [_text_ad_variant(detail["ad_text"])]
+        logger.info(f"  텍스트 광고 감지: {detail['ad_text'][:80]}")
+
+    logger.info(f"  {name} | 대안 {len(raw_variants)}개")
+
+    # 상세 페이지 자체에서 추출한 랜딩 URL (모든 variant 공통)
+    page_landing_url = detail["landing_url"]
+    if is_blocked_url(page_landing_url):
+        page_landing_url = ""
+    if page_landing_url:
+        logger.info(f"  상세 페이지에서 랜딩 URL 추출: {page_landing_url[:80]}")
+
+    # 각 대안별 랜딩 URL 결정
+    ads: list[PlatformAd] = []
+    sad_page = None
+    try:
         for j, v in enumerate(raw_variants):
             content_url = v.get("content_url", "")
             landing_url = ""
@@ -750,17 +881,12 @@ def _collect_ads_for_advertiser(
             # 우선순위 1: sadbundle에서 adurl= 파싱
             if content_url and "sadbundle" in content_url:
                 logger.info(f"  대안{j+1} sadbundle 방문 중...")
-                landing_url = get_landing_from_sadbundle(page, content_url)
+                # 별도 탭에서 열어 상세 페이지로 되돌아갈 필요가 없다
+                if sad_page is None:
+                    sad_page = page.context.new_page()
+                landing_url = get_landing_from_sadbundle(sad_page, content_url)
                 if is_blocked_url(landing_url):
                     landing_url = ""
-                # sadbundle 방문 후 상세 페이지로 복귀
-                if landing_url:
-                    try:
-                        page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                    except Exception as e:
-                        logger.warning(f"  대안{j+1} 상세 페이지 복귀 실패, skip: {e}")
-                        continue
-                    time.sleep(2)
 
             # 우선순위 2: variant의 anchor href (sub-container 내 <a> 태그)
             if not landing_url:
@@ -777,10 +903,75 @@ def _collect_ads_for_advertiser(
 
             ad = variant_to_platform_ad(name, v, landing_url)
             ads.append(ad)
+    finally:
+        if sad_page is not None:
+            sad_page.close()
 
     return ads
 
 
+def _acquire_detail_slots(wanted: int) -> int:
+    """추가 브라우저 예산에서 최대 wanted개 슬롯을 기다리지 않고 확보해 개수를 반환"""
+    got = 0
+    while got < wanted and _detail_browser_slots.acquire(blocking=False):
+        got += 1
+    return got
+
+
+def _detail_worker(labeled_links: list[tuple[str, str, str]], headless: bool) -> dict[str, list[PlatformAd]]:
+    """워커 스레드: 자기 브라우저를 띄워 맡은 상세 페이지들을 순서대로 방문한다.
+
+    Playwright sync API 객체는 생성한 스레드에서만 쓸 수 있으므로 브라우저는 워커마다 따로 띄운다.
+    끝나면 확보해 둔 추가 브라우저 슬롯을 반납한다.
+    """
+    results: dict[str, list[PlatformAd]] = {}
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            try:
+                page = browser.new_context(**_CONTEXT_OPTIONS).new_page()
+                for label, advertiser_name, href in labeled_links:
+                    try:
+                        results[label] = _scrape_creative_detail(page, href, advertiser_name, label)
+                    except Exception as e:
+                        logger.warning(f"  [{label}] 상세 페이지 수집 실패, skip: {e}")
+            finally:
+                browser.close()
+    finally:
+        _detail_browser_slots.release()
+    return results
+
+
+def _collect_ads_for_links(page, links: list[tuple[str, str]], headless: bool = True) -> list[PlatformAd]:
+    """(광고주명, 크리에이티브 링크) 목록의 상세 페이지를 방문해 대안별 광고를 수집한다.
+
+    링크 10개당 몫 1개(최대 DETAIL_WORKERS)로 나눠 첫 몫은 현재 page에서, 나머지는 워커 스레드의
+    브라우저에서 동시에 방문한다 (추가 브라우저는 프로세스 예산 안에서만). 결과는 링크 순서대로 합친다.
+    """
+    labeled = [(f"{i+1}/{len(links)}", name, href) for i, (name, href) in enumerate(links)]
+    n_workers = 1 + _acquire_detail_slots(min(DETAIL_WORKERS, len(labeled) // 10) - 1)
+    shares = [labeled[k::n_workers] for k in range(n_workers)]
+
+    results: dict[str, list[PlatformAd]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, n_workers - 1)) as executor:
+        futures = [executor.submit(_detail_worker, share, headless) for share in shares[1:]]
+        for label, advertiser_name, href in shares[0]:
+            try:
+                results[label] = _scrape_creative_detail(page, href, advertiser_name, label)
+            except Exception as e:
+                logger.warning(f"  [{label}] 상세 페이지 수집 실패, skip: {e}")
+        for future in futures:
+            try:
+                results.update(future.result())
+            except Exception as e:
+                logger.warning(f"상세 페이지 워커 실패: {e}")
+
+    ads: list[PlatformAd] = []
+    for label, _, _ in labeled:
+        ads.extend(results.get(label, []))
+    return ads
+
+
 def scrape_google_ads_by_keyword(
     keyword: str, headless: bool = True, max_results: int = 12, max_advertisers: int = 3,
     browser=None,
@@ -805,11 +996,7 @@ def scrape_google_ads_by_keyword(
             own_browser = own_playwright.chromium.launch(headless=headless)
             browser = own_browser
 
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            locale="ko-KR",
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
+        context = browser.new_context(**_CONTEXT_OPTIONS)
         page = context.new_page()
 
         # 1. 광고주 목록 수집
@@ -822,42 +1009,66 @@ def scrape_google_ads_by_keyword(
         advertisers_to_visit = advertisers[:max_advertisers]
         logger.info(f"광고주 {len(advertisers)}개 발견, {len(advertisers_to_visit)}개 순회 예정: {[a['name'] for a in advertisers_to_visit]}")
 
-        # 2. 각 광고주 순회하며 광고 수집
-        platform_ads: list[PlatformAd] = []
-        seen_source_ids: set[str] = set()
-
+        # 2. 광고주별 크리에이티브 링크를 먼저 모은다. 검색 페이지는 한 번만 로드하고
+        #    (첫 광고주는 열려 있는 드롭다운 사용) 이후에는 뒤로 가기로 검색 화면에 돌아온다.
+        #    드롭다운이 그대로 살아 있으면 재입력도 생략하고, 없을 때만 다시 입력한다.
+        #    링크가 max_results개 모이면 남은 광고주는 열지 않는다
+        links_by_advertiser: list[list[str]] = []
+        collected = 0
+        items = page.query_selector_all("material-select-item")
         for adv_idx, adv in enumerate(advertisers_to_visit):
-            remaining = max_results - len(platform_ads)
-            if remaining <= 0:
-                logger.info(f"max_results({max_results}) 도달, 순회 종료")
+            if collected >= max_results:
+                logger.info(f"링크 {collected}개로 max_results({max_results}) 도달, 남은 광고주 생략")
                 break
-
-            logger.info(f"=== 광고주 [{adv_idx+1}/{len(advertisers_to_visit)}] {adv['name']} (남은 수집 가능: {remaining}) ===")
-
+            if adv_idx > 0:
+                try:
+                    page.go_back(wait_until="domcontentloaded", timeout=15000)
+                    items = page.query_selector_all("material-select-item")
+                    if len(items) <= adv["index"] or not items[adv["index"]].is_visible():
+                        items = _open_search_dropdown(page, keyword, base_url, reload=False)
+                except Exception as e:
+                    logger.info(f"검색 페이지 복귀 실패, 다시 로드: {e}")
+                    try:
+                        items = _open_search_dropdown(page, keyword, base_url)
+                    except Exception as e:
+                        logger.warning(f"광고주 '{adv['name']}' 검색 실패, skip: {e}")
+                        links_by_advertiser.append([])
+                        continue
             try:
-                ads = _collect_ads_for_advertiser(
-                    page, keyword, base_url,
+                links_by_advertiser.append(_collect_creative_links(
+                    page, items,
                     advertiser_index=adv["index"],
                     advertiser_name=adv["name"],
-                    max_creatives=remaining,
-                )
+                    max_creatives=max_results - collected,
+                ))
             except Exception as e:
-                logger.warning(f"광고주 '{adv['name']}' 수집 실패, skip: {e}")
-                continue
-
-            # 중복 제거 후 추가
-            for ad in ads:
-                if ad.source_id not in seen_source_ids:
-                    seen_source_ids.add(ad.source_id)
-                    platform_ads.append(ad)
-
-                    if len(platform_ads) >= max_results:
-                        logger.info(f"max_results({max_results}) 도달, 수집 종료")
-                        break
+                logger.warning(f"광고주 '{adv['name']}' 링크 수집 실패, skip: {e}")
+                links_by_advertiser.append([])
+            collected += len(links_by_advertiser[-1])
+
+        # 3. 모든 광고주의 링크를 한 번에 모아 상세 페이지에서 광고 수집.
+        #    광고주별로 브라우저를 새로 띄우지 않고, 링크 수에 따라 한 번만 병렬로 나눈다
+        all_links = [
+            (adv["name"], href)
+            for adv, creative_links in zip(advertisers_to_visit, links_by_advertiser)
+            for href in creative_links
+        ]
+        logger.info(f"상세 페이지 {len(all_links)}건 방문 (광고주 {len(links_by_advertiser)}개)")
+        ads = _collect_ads_for_links(page, all_links, headless=headless)
+
+        # 중복 제거 후 추가
+        platform_ads: list[PlatformAd] = []
+        seen_source_ids: set[str] = set()
+        for ad in ads:
+            if ad.source_id not in seen_source_ids:
+                seen_source_ids.add(ad.source_id)
+                platform_ads.append(ad)
 
-            logger.info(f"광고주 '{adv['name']}' 완료: 이번 {len(ads)}건, 누적 {len(platform_ads)}건")
+                if len(platform_ads) >= max_results:
+                    logger.info(f"max_results({max_results}) 도달, 수집 종료")
+                    break
 
-        logger.info(f"Google 스크래핑 완료: 총 {len(platform_ads)}건 (광고주 {len(advertisers_to_visit)}개 순회)")
+        logger.info(f"Google 스크래핑 완료: 총 {len(platform_ads)}건 (광고주 {len(links_by_advertiser)}개 순회)")
     finally:
         if context:
             try:
@@ -872,6 +1083,127 @@ def scrape_google_ads_by_keyword(
     return platform_ads
 
 
+def _visit_details(browser, indexed_links, domain: str, total: int):
+    """(i, href)를 차례로 방문해 (href, ads)를 yield. 메모리 누적 방지를 위해 context는 주기적으로 재생성."""
+    context = browser.new_context(**_CONTEXT_OPTIONS)
+    try:
+        page = context.new_page()
+        for handled, (i, href) in enumerate(indexed_links):
+            if handled > 0 and handled % CONTEXT_RESTART_INTERVAL == 0:
+                try:
+                    context.close()
+                except Exception as e:
+                    logger.warning(f"Context close failed: {e}")
+                context = browser.new_context(**_CONTEXT_OPTIONS)
+                page = context.new_page()
+                logger.info(f"  메모리 관리: context 재생성 ({handled}건 처리)")
+            yield href, _scrape_creative_detail(page, href, domain, f"{i+1}/{total}")
+    finally:
+        try:
+            context.close()
+        except Exception:
+            pass
+
+
+def _drain(work_q: queue.Queue, stop: threading.Event):
+    """stop 전까지 work_q에서 항목을 하나씩 꺼낸다 (비면 종료)."""
+    while not stop.is_set():
+        try:
+            yield work_q.get_nowait()
+        except queue.Empty:
+            return
+
+
+_WORKER_DONE = object()
+
+
+def _domain_detail_worker(
+    work_q: queue.Queue, result_q: queue.Queue, stop: threading.Event, domain: str, total: int, headless: bool
+) -> None:
+    """워커 스레드: 자기 브라우저를 띄워 work_q가 빌 때까지 상세 페이지를 처리하고 결과를 result_q로 보낸다.
+
+    Playwright sync API 객체는 생성한 스레드에서만 쓸 수 있으므로 브라우저는 워커마다 따로 띄운다.
+    끝나면 확보해 둔 추가 브라우저 슬롯을 반납한다.
+    """
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=headless)
+            try:
+                for href, ads in _visit_details(browser, _drain(work_q, stop), domain, total):
+                    result_q.put((href, ads, None))
+            finally:
+                browser.close()
+    except Exception as e:
+        result_q.put((None, [], e))
+    finally:
+        _detail_browser_slots.release()
+        result_q.put(_WORKER_DONE)
+
+
+def _iter_domain_details(browser, ad_links: list[str], domain: str, headless: bool):
+    """상세 페이지를 방문해 (href, ads)를 완료 순서대로 yield.
+
+    링크 10개당 워커 1개(최대 DETAIL_WORKERS)로 나눈다. 전달받은 browser도 현재 스레드에서 같은
+    큐를 함께 처리하고, 추가 워커 스레드는 프로세스 예산이 남은 만큼만 자기 브라우저를 띄운다.
+    추가 워커가 없으면 browser로 순차 처리. 소비 측이 중간에 멈추면(max_results 도달) 남은 워커도 멈춘다.
+    """
+    n_extra = _acquire_detail_slots(min(DETAIL_WORKERS, len(ad_links) // 10) - 1)
+    if n_extra == 0:
+        yield from _visit_details(browser, enumerate(ad_links), domain, len(ad_links))
+        return
+
+    work_q: queue.Queue = queue.Queue()
+    for item in enumerate(ad_links):
+        work_q.put(item)
+    result_q: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    workers = [
+        threading.Thread(
+            target=_domain_detail_worker,
+            args=(work_q, result_q, stop, domain, len(ad_links), headless),
+            name=f"google-detail-{k + 1}",
+            daemon=True,
+        )
+        for k in range(n_extra)
+    ]
+    logger.info(f"상세 페이지 워커 {n_extra + 1}개로 {len(ad_links)}건 병렬 방문")
+    for w in workers:
+        w.start()
+
+    finished = 0
+
+    def _take(msg):
+        nonlocal finished
+        if msg is _WORKER_DONE:
+            finished += 1
+            return None
+        href, ads, exc = msg
+        if exc is not None:
+            raise exc
+        return href, ads
+
+    try:
+        # 현재 스레드도 browser로 큐를 처리하면서, 사이사이 워커 결과를 넘겨준다
+        for item in _visit_details(browser, _drain(work_q, stop), domain, len(ad_links)):
+            yield item
+            while True:
+                try:
+                    msg = result_q.get_nowait()
+                except queue.Empty:
+                    break
+                item = _take(msg)
+                if item is not None:
+                    yield item
+        while finished < n_extra:
+            item = _take(result_q.get())
+            if item is not None:
+                yield item
+    finally:
+        stop.set()
+        for w in workers:
+            w.join()
+
+
 def scrape_google_ads_by_domain(
     domain: str,
     headless: bool = True,
@@ -910,25 +1242,27 @@ def scrape_google_ads_by_domain(
             own_browser = own_playwright.chromium.launch(headless=headless)
             browser = own_browser
 
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            locale="ko-KR",
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        )
+        context = browser.new_context(**_CONTEXT_OPTIONS)
         page = context.new_page()
 
         # 1. 도메인 검색 페이지 접속
         logger.info(f"도메인 페이지 접속: {base_url}")
-        page.goto(base_url, wait_until="load", timeout=60000)
-        time.sleep(5)
+        page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+        try:
+            page.wait_for_selector(
+                "creative-preview, material-button.grid-expansion-button", timeout=10000
+            )
+        except Exception:
+            logger.info("광고 카드 미감지 (광고가 없거나 로드 지연), 계속 진행")
 
         # 2. "See all ads" 확장 버튼 클릭 시도
         try:
             see_all_btn = page.locator("material-button.grid-expansion-button")
             if see_all_btn.count() > 0:
+                before = page.evaluate(_CARD_COUNT_JS)
                 see_all_btn.first.click()
                 logger.info("'See all ads' 버튼 클릭 완료")
-                time.sleep(3)
+                _wait_for_more_cards(page, before, timeout=5000)
             else:
                 logger.info("'See all ads' 버튼 없음 (모든 광고가 이미 표시된 상태)")
         except Exception as e:
@@ -953,9 +1287,7 @@ def scrape_google_ads_by_domain(
                 logger.info(f"스크롤 타임아웃 ({SCROLL_TIMEOUT_SECONDS}초) 초과, 스크롤 중단")
                 break
 
-            current_count = page.evaluate(
-                """() => document.querySelectorAll('creative-preview a[href*="/creative/"]').length"""
-            )
+            current_count = page.evaluate(_CARD_COUNT_JS)
             logger.info(f"스크롤 {scroll_attempts + 1}: 현재 {current_count}개 광고 발견 (경과: {elapsed:.0f}초)")
 
             if not unlimited and current_count >= max_results:
@@ -972,7 +1304,8 @@ def scrape_google_ads_by_domain(
 
             prev_count = current_count
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(2)
+            # 새 카드가 붙는 즉시 다음 스크롤로 (시간 내에 안 늘면 다음 반복에서 no_new_count 증가)
+            _wait_for_more_cards(page, current_count, timeout=4000)
             scroll_attempts += 1
 
         # 4. creative-preview 카드에서 상세 페이지 링크 수집
@@ -989,12 +1322,12 @@ def scrape_google_ads_by_domain(
         # 증분 모드: 이미 수집한 creative 건너뛰기
         skipped_count = 0
         if mode == "incremental":
-            existing_ids = get_existing_creative_ids(domain)
+            link_ids = [extract_creative_id_from_link(href) for href in ad_links]
+            existing_ids = get_existing_creative_ids(domain, [cid for cid in link_ids if cid])
             logger.info(f"증분 모드: DB에 {len(existing_ids)}개 기존 creative ID 발견")
 
             filtered_links = []
-            for href in ad_links:
-                cid = extract_creative_id_from_link(href)
+            for href, cid in zip(ad_links, link_ids):
                 if cid and cid in existing_ids:
                     skipped_count += 1
                 else:
@@ -1010,147 +1343,28 @@ def scrape_google_ads_by_domain(
                 logger.info("증분 수집: 신규 광고 없음, 스크래핑 종료")
                 return []
 
+        # 목록 페이지는 더 쓰지 않으므로 상세 방문 전에 닫는다
+        try:
+            context.close()
+        except Exception:
+            pass
+        context = None
+
         # 5. 각 상세 페이지 방문하여 광고 데이터 추출
+        #    방문은 _iter_domain_details가 (링크가 많으면 여러 워커로 동시에) 처리하고,
+        #    중복 제거·배치 콜백·max_results 판단은 이 스레드에서만 한다
         platform_ads: list[PlatformAd] = []
         seen_source_ids: set[str] = set()
         batch_buffer: list[PlatformAd] = []
         total_collected = 0
 
-        for i, href in enumerate(ad_links):
-            # 주기적 context 재생성으로 메모리 누적 방지
-            if i > 0 and i % CONTEXT_RESTART_INTERVAL == 0:
-                try:
-                    context.close()
-                except Exception as e:
-                    logger.warning(f"Context close failed: {e}")
-                context = browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    locale="ko-KR",
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                )
-                page = context.new_page()
-                logger.info(f"  메모리 관리: context 재생성 ({i}/{len(ad_links)})")
-
-            detail_url = f"https://adstransparency.google.com{href}"
-            if "region=KR" not in detail_url:
-                detail_url += ("&" if "?" in detail_url else "?") + "region=KR"
-
-            logger.info(f"  [{i+1}/{len(ad_links)}] 상세 페이지: {href[:80]}")
-
-            loaded = False
-            for attempt in range(3):
-                try:
-                    page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                    loaded = True
-                    break
-                except Exception as e:
-                    if attempt < 2:
-                        logger.warning(f"  [{i+1}/{len(ad_links)}] 상세 페이지 로드 재시도 ({attempt+1}/3): {e}")
-                        time.sleep(2)
-                    else:
-                        logger.warning(f"  [{i+1}/{len(ad_links)}] 상세 페이지 로드 최종 실패, skip: {e}")
-            if not loaded:
-                continue
-            time.sleep(3)
-
-            # 광고주명
-            name_el = page.query_selector("div.advertiser-name")
-            advertiser_name = name_el.inner_text().strip() if name_el else domain
-
-            # creative-details 패널 대기
-            try:
-                page.wait_for_selector("creative-details .ad-container", timeout=5000)
-            except Exception:
-                logger.warning(f"creative-details 패널 없음: url={detail_url[:100]}")
-                continue
-
-            # 실제 광고 콘텐츠 로드 대기
-            try:
-                page.wait_for_selector(
-                    'creative-details img[src*="simgad"], '
-                    'creative-details iframe[src*="youtube"], '
-                    'creative-details iframe[src*="sadbundle"]',
-                    timeout=5000,
-                )
-            except Exception:
-                logger.debug("simgad/youtube/sadbundle 콘텐츠 미감지, 기존 DOM으로 진행")
-            time.sleep(1)
-
-            # 모든 대안 수집
-            raw_variants = collect_all_variants(page)
-            if not raw_variants:
-                raw_variants = _collect_variants_from_frames(page)
-
-            # 텍스트 광고 fallback: 이미지/영상 variant가 없지만 페이지에 텍스트 콘텐츠가 있는 경우
-            if not raw_variants:
-                is_text_format = page.evaluate("""() => {
-                    const bodyText = document.body ? document.body.innerText : '';
-                    return /형식\\s*[:\\uff1a]\\s*텍스트|Format\\s*[:\\uff1a]\\s*Text/i.test(bodyText);
-                }""")
-                if is_text_format:
-                    ad_text = page.evaluate("""() => {
-                        const container = document.querySelector('creative-details .ad-container');
-                        return container ? container.innerText.trim() : '';
-                    }""")
-                    if ad_text:
-                        raw_variants = [{
-                            "content_url": "text_ad:" + hashlib.sha256(ad_text[:100].encode()).hexdigest()[:16],
-                            "anchor_href": None,
-                            "is_video": False,
-                            "is_text": True,
-                            "ad_copy_text": ad_text,
-                            "video_url": None,
-                            "thumbnail_url": None,
-                            "youtube_video_id": None,
-                        }]
-                        logger.info(f"  텍스트 광고 감지: {ad_text[:80]}")
-
-            logger.info(f"  {advertiser_name} | 대안 {len(raw_variants)}개")
-
-            # 랜딩 URL 추출
-            page_landing_url = _extract_landing_url(page)
-            if is_blocked_url(page_landing_url):
-                page_landing_url = ""
-            if page_landing_url:
-                logger.info(f"  상세 페이지에서 랜딩 URL 추출: {page_landing_url[:80]}")
-
-            # 각 대안별 PlatformAd 생성
+        details = _iter_domain_details(browser, ad_links, domain, headless)
+        for href, ads in details:
+            # 각 대안별 PlatformAd 처리
             hit_limit = False
-            for j, v in enumerate(raw_variants):
-                content_url = v.get("content_url", "")
-                landing_url = ""
-
-                # 우선순위 1: sadbundle에서 adurl= 파싱
-                if content_url and "sadbundle" in content_url:
-                    logger.info(f"  대안{j+1} sadbundle 방문 중...")
-                    landing_url = get_landing_from_sadbundle(page, content_url)
-                    if is_blocked_url(landing_url):
-                        landing_url = ""
-                    if landing_url:
-                        try:
-                            page.goto(detail_url, wait_until="domcontentloaded", timeout=30000)
-                        except Exception as e:
-                            logger.warning(f"  대안{j+1} 상세 페이지 복귀 실패, skip: {e}")
-                            continue
-                        time.sleep(2)
-
-                # 우선순위 2: variant의 anchor href
-                if not landing_url:
-                    anchor = v.get("anchor_href", "")
-                    if anchor and not is_blocked_url(anchor):
-                        landing_url = anchor
-
-                # 우선순위 3: 상세 페이지 공통 랜딩 URL
-                if not landing_url:
-                    landing_url = page_landing_url
-
-                if landing_url:
-                    logger.info(f"  대안{j+1} 랜딩 URL: {landing_url[:80]}")
-
-                ad = variant_to_platform_ad(advertiser_name, v, landing_url)
-
+            cid = extract_creative_id_from_link(href)
+            for ad in ads:
                 # creative_id 설정
-                cid = extract_creative_id_from_link(href)
                 if cid:
                     ad.creative_id = cid
 
@@ -1173,6 +1387,8 @@ def scrape_google_ads_by_domain(
                         break
 
             if hit_limit:
+                # 남은 워커를 바로 멈춘다
+                details.close()
                 break
 
         # 남은 배치 처리
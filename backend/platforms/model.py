@@ -64,7 +64,9 @@ class MonitoredDomain(BaseModel):
 class BatchRunStatus(str, Enum):
     running = "running"
     completed = "completed"
+    partial_failure = "partial_failure"
     failed = "failed"
+    crashed = "crashed"
 
 
 class BatchRun(BaseModel):
@@ -77,6 +79,7 @@ class BatchRun(BaseModel):
     total_ads_new: int = 0
     total_ads_updated: int = 0
     domain_results: dict = {}
+    last_domain: Optional[str] = None
     errors: list = []
     trigger_type: str = "manual"
 
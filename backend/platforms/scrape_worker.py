@@ -4,11 +4,14 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from playwright.sync_api import sync_playwright
+from psycopg2.extras import execute_values
+
 from conn import get_db
 from platforms.model import PlatformAd
 from platforms.s3 import is_s3_configured, upload_from_url
 from platforms.meta_scraper import scrape_meta_ads
-from platforms.google_scraper import scrape_google_ads_by_keyword, scrape_google_ads_by_domain
+from platforms.google_scraper import add_creative_id, scrape_google_ads_by_keyword, scrape_google_ads_by_domain
 from utils.activity_log import log_activity
 
 
@@ -114,15 +117,52 @@ def _save_ads_to_db(ads: list[PlatformAd]) -> int:
     return saved
 
 
-UPSERT_CHUNK_SIZE = 50
-
-
-def upsert_ads_batch(ads: list[PlatformAd], brand_id: str | None = None) -> dict:
+UPSERT_CHUNK_SIZE = 500
+
+_UPSERT_ADS_SQL = """
+    INSERT INTO ads (
+        source_id, platform, format, advertiser_name,
+        advertiser_handle, thumbnail_url, preview_url,
+        media_type, ad_copy, cta_text,
+        start_date, end_date, tags,
+        landing_page_url, raw_data, domain, creative_id,
+        brand_id, saved_at, last_seen_at
+    ) VALUES %s
+    ON CONFLICT (source_id, platform) DO UPDATE SET
+        advertiser_name = EXCLUDED.advertiser_name,
+        thumbnail_url = EXCLUDED.thumbnail_url,
+        preview_url = EXCLUDED.preview_url,
+        ad_copy = EXCLUDED.ad_copy,
+        cta_text = EXCLUDED.cta_text,
+        end_date = EXCLUDED.end_date,
+        raw_data = EXCLUDED.raw_data,
+        landing_page_url = EXCLUDED.landing_page_url,
+        domain = EXCLUDED.domain,
+        creative_id = COALESCE(EXCLUDED.creative_id, ads.creative_id),
+        brand_id = COALESCE(EXCLUDED.brand_id, ads.brand_id),
+        updated_at = NOW(),
+        last_seen_at = NOW()
+    RETURNING (xmax = 0) AS is_new
+"""
+
+_UPSERT_ADS_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())"
+)
+
+
+def upsert_ads_batch(
+    ads: list[PlatformAd],
+    brand_id: str | None = None,
+    default_domain: str | None = None,
+) -> dict:
     """광고를 DB에 UPSERT하고 신규/업데이트 건수를 반환.
 
+    청크당 multi-row INSERT ... ON CONFLICT 한 번으로 처리한다 (execute_values).
+
     Args:
         ads: List of PlatformAd objects to upsert.
         brand_id: Optional brand_id to set on all ads. If provided, overrides ad.brand_id.
+        default_domain: Domain to store for ads whose ad.domain is empty.
 
     Returns: {"new": int, "updated": int, "total": int}
     """
@@ -130,64 +170,37 @@ def upsert_ads_batch(ads: list[PlatformAd], brand_id: str | None = None) -> dict
         logger.info(f"upsert_ads_batch 호출: 0건 입력 (brand_id={brand_id}), 스킵")
         return {"new": 0, "updated": 0, "total": 0}
 
-    new = 0
-    updated = 0
-
-    for i in range(0, len(ads), UPSERT_CHUNK_SIZE):
-        chunk = ads[i : i + UPSERT_CHUNK_SIZE]
-        with get_db() as (conn, cur):
-            for ad in chunk:
-                effective_brand_id = brand_id or ad.brand_id
-                cur.execute(
-                    """
-                    INSERT INTO ads (
-                        source_id, platform, format, advertiser_name,
-                        advertiser_handle, thumbnail_url, preview_url,
-                        media_type, ad_copy, cta_text,
-                        start_date, end_date, tags,
-                        landing_page_url, raw_data, domain, creative_id,
-                        brand_id, saved_at, last_seen_at
-                    ) VALUES (
-                        %s, %s, %s, %s,
-                        %s, %s, %s,
-                        %s, %s, %s,
-                        %s, %s, %s,
-                        %s, %s, %s, %s,
-                        %s, NOW(), NOW()
-                    )
-                    ON CONFLICT (source_id, platform) DO UPDATE SET
-                        advertiser_name = EXCLUDED.advertiser_name,
-                        thumbnail_url = EXCLUDED.thumbnail_url,
-                        preview_url = EXCLUDED.preview_url,
-                        ad_copy = EXCLUDED.ad_copy,
-                        cta_text = EXCLUDED.cta_text,
-                        end_date = EXCLUDED.end_date,
-                        raw_data = EXCLUDED.raw_data,
-                        landing_page_url = EXCLUDED.landing_page_url,
-                        domain = EXCLUDED.domain,
-                        creative_id = COALESCE(EXCLUDED.creative_id, ads.creative_id),
-                        brand_id = COALESCE(EXCLUDED.brand_id, ads.brand_id),
-                        updated_at = NOW(),
-                        last_seen_at = NOW()
-                    RETURNING (xmax = 0) AS is_new
-                    """,
-                    (
-                        ad.source_id, ad.platform.value, ad.format,
-                        ad.advertiser_name, ad.advertiser_handle,
-                        ad.thumbnail_url, ad.preview_url,
-                        ad.media_type, ad.ad_copy, ad.cta_text,
-                        ad.start_date, ad.end_date,
-                        ad.tags, ad.landing_page_url,
-                        json.dumps(ad.raw_data, ensure_ascii=False, default=str),
-                        ad.domain, ad.creative_id,
-                        effective_brand_id,
-                    ),
-                )
-                is_new = cur.fetchone()[0]
-                if is_new:
-                    new += 1
-                else:
-                    updated += 1
+    # 한 INSERT 안에서 같은 (source_id, platform)이 두 번 나오면 ON CONFLICT가 실패하므로
+    # 마지막 값만 남긴다 (기존 행 단위 UPSERT에서도 마지막 값이 최종 반영됨)
+    rows = {}
+    for ad in ads:
+        rows[(ad.source_id, ad.platform.value)] = (
+            ad.source_id, ad.platform.value, ad.format,
+            ad.advertiser_name, ad.advertiser_handle,
+            ad.thumbnail_url, ad.preview_url,
+            ad.media_type, ad.ad_copy, ad.cta_text,
+            ad.start_date, ad.end_date,
+            ad.tags, ad.landing_page_url,
+            json.dumps(ad.raw_data, ensure_ascii=False, default=str),
+            ad.domain or default_domain, ad.creative_id,
+            brand_id or ad.brand_id,
+        )
+    # execute_values가 UPSERT_CHUNK_SIZE 단위로 나눠 보내고 RETURNING 결과를 모아 준다
+    with get_db() as (conn, cur):
+        returned = execute_values(
+            cur,
+            _UPSERT_ADS_SQL,
+            list(rows.values()),
+            template=_UPSERT_ADS_TEMPLATE,
+            page_size=UPSERT_CHUNK_SIZE,
+            fetch=True,
+        )
+    new = sum(1 for (is_new,) in returned if is_new)
+    updated = len(returned) - new
+    # 증분 수집 캐시에도 반영해 같은 실행에서 다시 상세 페이지를 열지 않게 한다
+    for ad in ads:
+        if ad.platform.value == "google" and ad.creative_id:
+            add_creative_id(ad.domain or default_domain or "", ad.creative_id)
 
     total = new + updated
     logger.info(f"UPSERT 완료: new={new}, updated={updated}, total={total}")
@@ -201,6 +214,24 @@ def upsert_ads_batch(ads: list[PlatformAd], brand_id: str | None = None) -> dict
     return {"new": new, "updated": updated, "total": total}
 
 
+def _ensure_browser(pw, browser, result: dict):
+    """공유 브라우저가 죽었으면 다시 띄운다. 실행 실패는 result["errors"]에 남기고 None 반환"""
+    if browser is not None and browser.is_connected():
+        return browser
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+    try:
+        return pw.chromium.launch(headless=True)
+    except Exception as e:
+        error_msg = f"browser launch failed: {type(e).__name__}: {e}"
+        logger.error(error_msg)
+        result["errors"].append(error_msg)
+        return None
+
+
 def run_crawl(keyword: str, platforms: list[str], search_type: str = "keyword", max_results: int = 12) -> dict:
     result = {
         "keyword": keyword,
@@ -214,56 +245,72 @@ def run_crawl(keyword: str, platforms: list[str], search_type: str = "keyword",
 
     all_ads: list[PlatformAd] = []
 
-    for platform in platforms:
-        scraped_ads: list[PlatformAd] = []
-
-        if platform == "meta":
-            logger.info(f"Meta 스크래핑 시작: keyword='{keyword}'")
-            try:
-                scraped_ads = scrape_meta_ads(keyword, headless=True, max_results=max_results)
-            except Exception as e:
-                error_msg = f"meta scrape failed: {type(e).__name__}: {e}"
-                logger.error(error_msg)
-                result["errors"].append(error_msg)
-
-        elif platform == "google":
-            if search_type == "domain":
-                logger.info(f"Google 도메인 스크래핑 시작: domain='{keyword}'")
-                try:
-                    scraped_ads = scrape_google_ads_by_domain(keyword, headless=True, max_results=max_results)
-                except Exception as e:
-                    error_msg = f"google domain scrape failed: {type(e).__name__}: {e}"
-                    logger.error(error_msg)
-                    result["errors"].append(error_msg)
-            else:
-                logger.info(f"Google 키워드 스크래핑 시작: keyword='{keyword}'")
+    # 플랫폼마다 Chromium을 새로 띄우지 않도록 크롤 1회 동안 브라우저 하나를 공유.
+    # 앞 플랫폼에서 브라우저가 죽었으면 다음 플랫폼 전에 다시 띄운다
+    with sync_playwright() as pw:
+        browser = None
+        try:
+            for platform in platforms:
+                scraped_ads: list[PlatformAd] = []
+
+                browser = _ensure_browser(pw, browser, result)
+                if browser is None:
+                    result["results"][platform] = {"scraped": 0, "saved": 0}
+                    continue
+
+                if platform == "meta":
+                    logger.info(f"Meta 스크래핑 시작: keyword='{keyword}'")
+                    try:
+                        scraped_ads = scrape_meta_ads(keyword, headless=True, max_results=max_results, browser=browser)
+                    except Exception as e:
+                        error_msg = f"meta scrape failed: {type(e).__name__}: {e}"
+                        logger.error(error_msg)
+                        result["errors"].append(error_msg)
+
+                elif platform == "google":
+                    if search_type == "domain":
+                        logger.info(f"Google 도메인 스크래핑 시작: domain='{keyword}'")
+                        try:
+                            scraped_ads = scrape_google_ads_by_domain(keyword, headless=True, max_results=max_results, browser=browser)
+                        except Exception as e:
+                            error_msg = f"google domain scrape failed: {type(e).__name__}: {e}"
+                            logger.error(error_msg)
+                            result["errors"].append(error_msg)
+                    else:
+                        logger.info(f"Google 키워드 스크래핑 시작: keyword='{keyword}'")
+                        try:
+                            scraped_ads = scrape_google_ads_by_keyword(keyword, headless=True, max_results=max_results, browser=browser)
+                        except Exception as e:
+                            error_msg = f"google scrape failed: {type(e).__name__}: {e}"
+                            logger.error(error_msg)
+                            result["errors"].append(error_msg)
+
+                logger.info(f"[{platform}] {len(scraped_ads)}건 스크래핑 완료")
+
+                # S3 upload (optional)
+                if is_s3_configured():
+                    s3_prefix = f"ads/{platform}/{keyword}"
+                    for ad in scraped_ads:
+                        stats = _upload_ad_media_to_s3(ad, s3_prefix)
+                        result["s3_uploads"]["success"] += stats["success"]
+                        result["s3_uploads"]["failed"] += stats["failed"]
+
+                # DB save
+                saved_count = _save_ads_to_db(scraped_ads)
+
+                result["results"][platform] = {
+                    "scraped": len(scraped_ads),
+                    "saved": saved_count,
+                }
+                result["total_scraped"] += len(scraped_ads)
+                result["total_saved"] += saved_count
+                all_ads.extend(scraped_ads)
+        finally:
+            if browser is not None:
                 try:
-                    scraped_ads = scrape_google_ads_by_keyword(keyword, headless=True, max_results=max_results)
-                except Exception as e:
-                    error_msg = f"google scrape failed: {type(e).__name__}: {e}"
-                    logger.error(error_msg)
-                    result["errors"].append(error_msg)
-
-        logger.info(f"[{platform}] {len(scraped_ads)}건 스크래핑 완료")
-
-        # S3 upload (optional)
-        if is_s3_configured():
-            s3_prefix = f"ads/{platform}/{keyword}"
-            for ad in scraped_ads:
-                stats = _upload_ad_media_to_s3(ad, s3_prefix)
-                result["s3_uploads"]["success"] += stats["success"]
-                result["s3_uploads"]["failed"] += stats["failed"]
-
-        # DB save
-        saved_count = _save_ads_to_db(scraped_ads)
-
-        result["results"][platform] = {
-            "scraped": len(scraped_ads),
-            "saved": saved_count,
-        }
-        result["total_scraped"] += len(scraped_ads)
-        result["total_saved"] += saved_count
-        all_ads.extend(scraped_ads)
+                    browser.close()
+                except Exception:
+                    pass
 
     logger.info(f"전체 완료: scraped={result['total_scraped']}, saved={result['total_saved']}")
     return result
@@ -0,0 +1,14 @@
+import sys
+import types
+
+# conn.py opens the connection pool at import (needs DATABASE_URL). Tests only cover
+# pure functions, so give the scraper modules a conn without a database behind it.
+if "conn" not in sys.modules:
+    _conn = types.ModuleType("conn")
+
+    def _no_db(*args, **kwargs):
+        raise RuntimeError("tests have no database")
+
+    _conn.get_db = _no_db
+    _conn.get_db_connection = _no_db
+    sys.modules["conn"] = _conn
@@ -0,0 +1,35 @@
+import pytest
+
+from platforms import dedup_meta, meta_scraper
+
+URLS = [
+    "https://scontent.xx.fbcdn.net/v/t39/123_n.jpg?stp=dst-jpg&_nc_cat=1",
+    "https://video.xx.fbcdn.net/v/t42/456_n.mp4#t=3",
+    "http://example.com/a/b",
+    "HTTPS://Example.com/Path/Upper",
+    "https://example.com",
+    "https://example.com?x=1",
+    "https://example.com:8443/port/path?q",
+    "https://user:pw@example.com/auth/path",
+    "https://example.com/a;params?x=1",
+    "https://example.com/with space/x.jpg",
+    "https://example.com/tab\there",
+    "https://example.com/éè/x.jpg",
+    "ftp://example.com/file.jpg",
+    "//example.com/scheme-relative",
+    "relative/path?x=1",
+    "",
+]
+
+
+@pytest.mark.parametrize("content_url", URLS)
+@pytest.mark.parametrize("advertiser_name", ["Nike", "나이키 코리아", ""])
+def test_make_source_id_matches_urlparse_reference(advertiser_name, content_url):
+    assert dedup_meta.make_source_id(advertiser_name, content_url) == meta_scraper.make_source_id(
+        advertiser_name, content_url
+    )
+
+
+@pytest.mark.parametrize("content_url", URLS[:8])
+def test_plain_http_urls_take_the_regex_fast_path(content_url):
+    assert dedup_meta._HTTP_PATH_RE.match(content_url.encode()) is not None
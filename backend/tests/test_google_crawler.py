@@ -0,0 +1,103 @@
+import pytest
+
+from platforms.google_crawler import _choose_thumbnail_and_preview, _parse_format
+
+DETAIL_URL = "https://adstransparency.google.com/advertiser/AR01/creative/CR01?region=KR"
+SYNDICATION_IMG = "https://tpc.googlesyndication.com/simgad/123"
+
+
+@pytest.mark.parametrize(
+    "raw_format, expected",
+    [
+        ("동영상", ("video", "video")),
+        ("Video", ("video", "video")),
+        ("이미지", ("image", "image")),
+        ("IMAGE", ("image", "image")),
+        ("텍스트", ("text", "image")),
+        ("Text", ("text", "image")),
+        ("unknown", ("image", "image")),
+        ("", ("image", "image")),
+    ],
+)
+def test_parse_format(raw_format, expected):
+    assert _parse_format(raw_format) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"format": "텍스트", "adImage": "https://example.com/a.png"},
+        {"format": "이미지", "isSearchAd": True, "adImage": "https://example.com/a.png"},
+    ],
+)
+def test_text_and_search_ads_are_skipped(data):
+    _, _, thumbnail_url, preview_url, skip = _choose_thumbnail_and_preview(data, DETAIL_URL)
+    assert skip is True
+    assert (thumbnail_url, preview_url) == ("", "")
+
+
+def test_youtube_video_uses_youtube_thumbnail_and_embed():
+    data = {
+        "format": "동영상",
+        "youtubeVideoIds": ["abc123", "def456"],
+        "adImage": "https://example.com/a.png",
+        "videoSrc": "https://example.com/v.mp4",
+    }
+    assert _choose_thumbnail_and_preview(data, DETAIL_URL) == (
+        "video", "video",
+        "https://i.ytimg.com/vi/abc123/hqdefault.jpg",
+        "https://www.youtube.com/embed/abc123",
+        False,
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"format": "동영상", "adImageOther": SYNDICATION_IMG},
+        {"format": "동영상"},
+    ],
+)
+def test_video_without_video_content_is_skipped(data):
+    assert _choose_thumbnail_and_preview(data, DETAIL_URL)[4] is True
+
+
+def test_video_without_youtube_id_uses_video_src():
+    data = {
+        "format": "동영상",
+        "videoSrc": "https://example.com/v.mp4",
+        "videoPoster": "https://example.com/poster.jpg",
+    }
+    assert _choose_thumbnail_and_preview(data, DETAIL_URL) == (
+        "video", "video", "https://example.com/poster.jpg", "https://example.com/v.mp4", False,
+    )
+
+
+_IMAGES = {
+    "adImage": "https://example.com/ad.png",
+    "adImageSyndication": SYNDICATION_IMG,
+    "adImageOther": "https://example.com/other.png",
+    "videoPoster": "https://example.com/poster.jpg",
+}
+
+
+@pytest.mark.parametrize(
+    "present, expected_key",
+    [
+        (["adImage", "adImageSyndication", "adImageOther", "videoPoster"], "adImage"),
+        (["adImageSyndication", "adImageOther", "videoPoster"], "adImageSyndication"),
+        (["adImageOther", "videoPoster"], "adImageOther"),
+        (["videoPoster"], "videoPoster"),
+    ],
+)
+def test_image_thumbnail_fallback_order(present, expected_key):
+    data = {"format": "이미지", **{k: _IMAGES[k] for k in present}}
+    ad_format, media_type, thumbnail_url, preview_url, skip = _choose_thumbnail_and_preview(data, DETAIL_URL)
+    assert (ad_format, media_type, skip) == ("image", "image", False)
+    assert thumbnail_url == _IMAGES[expected_key]
+    assert preview_url == DETAIL_URL
+
+
+def test_image_without_any_image_falls_back_to_screenshot():
+    _, _, thumbnail_url, preview_url, skip = _choose_thumbnail_and_preview({"format": "이미지"}, DETAIL_URL)
+    assert (thumbnail_url, preview_url, skip) == ("", DETAIL_URL, False)
@@ -1,10 +1,32 @@
 import json
 import logging
 
+from psycopg2.extras import execute_values
+
 from conn import get_db
 
 logger = logging.getLogger("activity_log")
 
+_INSERT_ACTIVITY_PREFIX = "INSERT INTO activity_logs (event_type, event_subtype, title, message, metadata) VALUES "
+INSERT_ACTIVITY_SQL = _INSERT_ACTIVITY_PREFIX + "(%s, %s, %s, %s, %s)"
+
+
+def activity_params(
+    event_type: str,
+    title: str,
+    message: str = "",
+    event_subtype: str | None = None,
+    metadata: dict | None = None,
+) -> tuple:
+    """Parameter tuple for INSERT_ACTIVITY_SQL, for callers that batch statements."""
+    return (
+        event_type,
+        event_subtype,
+        title,
+        message,
+        json.dumps(metadata or {}, ensure_ascii=False, default=str),
+    )
+
 
 def log_activity(
     event_type: str,
@@ -16,17 +38,24 @@ def log_activity(
     try:
         with get_db() as (conn, cur):
             cur.execute(
-                """
-                INSERT INTO activity_logs (event_type, event_subtype, title, message, metadata)
-                VALUES (%s, %s, %s, %s, %s)
-                """,
-                (
-                    event_type,
-                    event_subtype,
-                    title,
-                    message,
-                    json.dumps(metadata or {}, ensure_ascii=False, default=str),
-                ),
+                INSERT_ACTIVITY_SQL,
+                activity_params(event_type, title, message, event_subtype, metadata),
             )
     except Exception as e:
         logger.warning(f"Failed to write activity log: {e}")
+
+
+def log_activities(rows: list[tuple]) -> None:
+    """Insert many activity_params() tuples in one statement."""
+    if not rows:
+        return
+    try:
+        with get_db() as (conn, cur):
+            execute_values(
+                cur,
+                _INSERT_ACTIVITY_PREFIX + "%s",
+                rows,
+                page_size=500,
+            )
+    except Exception as e:
+        logger.warning(f"Failed to write activity logs: {e}")
@@ -1,9 +1,22 @@
 import logging
 
+from psycopg2.extras import execute_values
+
 from conn import get_db
 
 logger = logging.getLogger("daily_stats")
 
+_UPSERT_DAILY_STATS = """
+    INSERT INTO daily_brand_stats (brand_id, platform, new_count, updated_count, total_scraped)
+    VALUES {values}
+    ON CONFLICT (brand_id, stat_date, platform) DO UPDATE SET
+        new_count = daily_brand_stats.new_count + EXCLUDED.new_count,
+        updated_count = daily_brand_stats.updated_count + EXCLUDED.updated_count,
+        total_scraped = daily_brand_stats.total_scraped + EXCLUDED.total_scraped,
+        updated_at = NOW()
+"""
+UPSERT_DAILY_STATS_SQL = _UPSERT_DAILY_STATS.format(values="(%s, %s, %s, %s, %s)")
+
 
 def record_daily_stats(
     brand_id: str,
@@ -16,16 +29,33 @@ def record_daily_stats(
     try:
         with get_db() as (conn, cur):
             cur.execute(
-                """
-                INSERT INTO daily_brand_stats (brand_id, platform, new_count, updated_count, total_scraped)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (brand_id, stat_date, platform) DO UPDATE SET
-                    new_count = daily_brand_stats.new_count + EXCLUDED.new_count,
-                    updated_count = daily_brand_stats.updated_count + EXCLUDED.updated_count,
-                    total_scraped = daily_brand_stats.total_scraped + EXCLUDED.total_scraped,
-                    updated_at = NOW()
-                """,
+                UPSERT_DAILY_STATS_SQL,
                 (brand_id, platform, new_count, updated_count, total_scraped),
             )
     except Exception as e:
         logger.warning(f"Failed to record daily stats: {e}")
+
+
+def record_daily_stats_many(rows: list[tuple]) -> None:
+    """Record many (brand_id, platform, new, updated, scraped) rows in one UPSERT.
+
+    Rows are summed per (brand_id, platform) first, since one statement cannot upsert the same row twice.
+    """
+    totals = {}
+    for brand_id, platform, new_count, updated_count, total_scraped in rows:
+        acc = totals.setdefault((brand_id, platform), [0, 0, 0])
+        acc[0] += new_count
+        acc[1] += updated_count
+        acc[2] += total_scraped
+    if not totals:
+        return
+    try:
+        with get_db() as (conn, cur):
+            execute_values(
+                cur,
+                _UPSERT_DAILY_STATS.format(values="%s"),
+                [(brand_id, platform, *acc) for (brand_id, platform), acc in totals.items()],
+                page_size=500,
+            )
+    except Exception as e:
+        logger.warning(f"Failed to record daily stats: {e}")